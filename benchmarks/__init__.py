@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Performance benchmarks for Eddy.
+
+Each benchmark is a standalone module which can be executed from the repository root, i.e:
+
+    python -m benchmarks.loader --scale 20
+
+Benchmarks run against a real Eddy session (offscreen when no display is available).
+"""
+
+
+import jnius_config
+import os
+import shutil
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+from eddy.core.functions.path import expandPath
+
+WIN32 = sys.platform.startswith('win32')
+
+#############################################
+# BEGIN JAVA VIRTUAL MACHINE SETUP
+#################################
+
+if os.path.isdir(expandPath('@resources/java/')):
+    os.environ['JAVA_HOME'] = expandPath('@resources/java/')
+
+if WIN32:
+    path = os.getenv('Path', '')
+    path = path.split(os.pathsep)
+    path.insert(0, os.path.join(os.environ['JAVA_HOME'], 'bin', 'client'))
+    os.environ['Path'] = os.pathsep.join(path)
+
+classpath = []
+resources = expandPath('@resources/lib/')
+for name in os.listdir(resources):
+    path = os.path.join(resources, name)
+    if os.path.isfile(path):
+        classpath.append(path)
+
+jnius_config.add_options('-ea', '-Xmx512m')
+jnius_config.set_classpath(*classpath)
+
+#############################################
+# END JAVA VIRTUAL MACHINE SETUP
+#################################
+
+if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from argparse import Namespace
+
+from eddy.core.application import Eddy
+from eddy.core.output import getLogger
+from eddy.ui import fonts_rc
+from eddy.ui import images_rc
+
+
+def createSession(project='@examples/Pizza'):
+    """
+    Create an Eddy application instance together with a session for the given project.
+    :type project: str
+    :rtype: Session
+    """
+    from eddy.ui.session import Session
+    getLogger().disabled = True
+    app = Eddy(Namespace(nosplash=True, tests=True, open=None), [sys.argv[0]])
+    return Session(app, expandPath(project))
+
+
+def peakRSS():
+    """
+    Returns the peak resident set size of the current process (in KB).
+    :rtype: int
+    """
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform.startswith('darwin'):
+        usage //= 1024
+    return usage
+
+
+def scaleProject(source, scale, workdir=None):
+    """
+    Generate a synthetic project by replicating the diagrams of the given Graphol project 'scale' times.
+    Returns the path of the directory containing the generated project.
+    :type source: str
+    :type scale: int
+    :type workdir: str
+    :rtype: str
+    """
+    source = expandPath(source)
+    name = os.path.basename(source.rstrip(os.path.sep))
+    tree = ET.parse(os.path.join(source, '{0}.graphol'.format(name)))
+    section = tree.getroot().find('diagrams')
+    diagrams = list(section.findall('diagram'))
+    for i in range(1, scale):
+        for diagram in diagrams:
+            copy = ET.fromstring(ET.tostring(diagram))
+            copy.set('name', '{0}_{1}'.format(diagram.get('name'), i))
+            section.append(copy)
+    name = '{0}x{1}'.format(name, scale)
+    path = os.path.join(workdir or tempfile.mkdtemp(prefix='eddy-bench-'), name)
+    os.makedirs(path, exist_ok=True)
+    tree.write(os.path.join(path, '{0}.graphol'.format(name)), encoding='UTF-8', xml_declaration=True)
+    return path
+
+
+def removeProject(path):
+    """
+    Remove a project previously generated with scaleProject (together with its snapshot, if any).
+    :type path: str
+    """
+    from eddy.core.loaders.snapshot import ProjectSnapshot
+    ProjectSnapshot(os.path.join(path, '{0}.graphol'.format(os.path.basename(path)))).remove()
+    shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+
+class Timer(object):
+    """
+    Context manager which measures the wall time spent in its body.
+    USAGE:
+        with Timer() as timer:
+            # do stuff
+        print(timer.elapsed)
+    """
+    def __init__(self):
+        self.elapsed = 0.0
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.elapsed = time.perf_counter() - self.start
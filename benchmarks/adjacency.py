@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of querying the neighbourhood of a node with thousands of incident edges.
+
+USAGE:
+    python -m benchmarks.adjacency [--inputs 5000] [--runs 200]
+
+A union node is given the requested amount of concept nodes in input (plus an inclusion edge
+towards a single concept node) and the queries performed by the profile rules and by the OWL 2
+exporter are timed: the linear scan of all the incident edges (the lookup used before nodes indexed
+their edges by type and direction) is compared with the lookup through the adjacency index.
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def scan(node, incoming, filter_on_edges, filter_on_nodes=lambda x: True):
+    """
+    Returns the nodes connected to the given one by scanning all its edges.
+    :type node: AbstractNode
+    :type incoming: bool
+    :type filter_on_edges: callable
+    :type filter_on_nodes: callable
+    :rtype: set
+    """
+    from eddy.core.datatypes.graphol import Item
+    if incoming:
+        check = lambda e: e.target is node or e.type() is Item.EquivalenceEdge
+    else:
+        check = lambda e: e.source is node or e.type() is Item.EquivalenceEdge
+    return {x for x in [e.other(node) for e in node.edges if check(e) and filter_on_edges(e)] if filter_on_nodes(x)}
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--inputs', dest='inputs', type=int, default=5000)
+    parser.add_argument('--runs', dest='runs', type=int, default=200)
+    options = parser.parse_args()
+
+    from eddy.core.datatypes.graphol import Item, Identity
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        session = createSession(path)
+        diagram = next(iter(session.project.diagrams()))
+        hub = diagram.factory.create(Item.UnionNode)
+        superclass = diagram.factory.create(Item.ConceptNode)
+        edges = [diagram.factory.create(Item.InclusionEdge, source=hub, target=superclass)]
+        for _ in range(options.inputs):
+            edges.append(diagram.factory.create(Item.InputEdge, source=diagram.factory.create(Item.ConceptNode), target=hub))
+        for edge in edges:
+            edge.source.addEdge(edge)
+            edge.target.addEdge(edge)
+        print('Node: {0} with {1} incident edges'.format(hub.name, len(hub.edges)))
+
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.type() is Item.InclusionEdge
+        f3 = lambda x: x.type() is Item.EquivalenceEdge
+        f4 = lambda x: x.identity() is Identity.Concept
+        queries = (
+            ('incoming inputs', lambda: scan(hub, True, f1, f4),
+                                lambda: hub.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f4)),
+            ('outgoing inputs', lambda: scan(hub, False, f1),
+                                lambda: hub.outgoingNodes(filter_on_types={Item.InputEdge})),
+            ('outgoing inclusions', lambda: scan(hub, False, f2, f4),
+                                    lambda: hub.outgoingNodes(filter_on_types={Item.InclusionEdge}, filter_on_nodes=f4)),
+            ('adjacent equivalences', lambda: {e.other(hub) for e in hub.edges if f3(e)},
+                                      lambda: hub.adjacentNodes(filter_on_types={Item.EquivalenceEdge})),
+        )
+
+        for name, linear, indexed in queries:
+            assert linear() == indexed()
+            with Timer() as t1:
+                for _ in range(options.runs):
+                    linear()
+            with Timer() as t2:
+                for _ in range(options.runs):
+                    indexed()
+            print('{0:>22}: scan={1:.3f}ms index={2:.3f}ms ({3:.0f}x)'.format(
+                name, t1.elapsed * 1000 / options.runs, t2.elapsed * 1000 / options.runs,
+                t1.elapsed / max(t2.elapsed, 1e-9)))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of dragging a large selection of nodes around a diagram.
+
+USAGE:
+    python -m benchmarks.drag [--nodes 100] [--events 120] [--rate 4]
+
+The requested amount of concept nodes (chained by inclusion edges) is selected and dragged across the diagram
+by a stream of mouse move events, delivered every --rate milliseconds (as a high frequency mouse would do),
+followed by the mouse release. Updating all the attached edges on every mouse move event (the previous behavior)
+is compared with applying the movement at most once per frame: the time needed to complete the drag, how far
+behind the mouse the editor fell, the time needed to handle the release and the amount of edge updates are reported.
+"""
+
+
+from argparse import ArgumentParser
+import time
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--nodes', dest='nodes', type=int, default=100)
+    parser.add_argument('--events', dest='events', type=int, default=120)
+    parser.add_argument('--rate', dest='rate', type=float, default=4)
+    options = parser.parse_args()
+
+    from PyQt5 import QtCore
+    from PyQt5 import QtGui
+    from PyQt5 import QtWidgets
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.datatypes.misc import DiagramMode
+    from eddy.core.items.edges.common.base import AbstractEdge
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        session = createSession(path)
+        session.action('toggle_grid').setChecked(False)
+        diagram = next(iter(session.project.diagrams()))
+        nodes = []
+        for i in range(options.nodes):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setPos(QtCore.QPointF(i % 20 * 200, 3000 + i // 20 * 150))
+            diagram.addItem(node)
+            nodes.append(node)
+        for source, target in zip(nodes, nodes[1:]):
+            edge = diagram.factory.create(Item.InclusionEdge, source=source, target=target)
+            source.addEdge(edge)
+            target.addEdge(edge)
+            diagram.addItem(edge)
+            edge.updateEdge()
+
+        session.sgnFocusDiagram.emit(diagram)
+        view = session.mdi.subWindowForDiagram(diagram).view
+        counts = {'updates': 0}
+        updateEdge = AbstractEdge.updateEdge
+
+        def counted(self, *args, **kwargs):
+            counts['updates'] += 1
+            return updateEdge(self, *args, **kwargs)
+
+        def send(kind, pos, buttons):
+            event = QtGui.QMouseEvent(kind, QtCore.QPointF(view.mapFromScene(pos)),
+                                      QtCore.Qt.LeftButton, buttons, QtCore.Qt.NoModifier)
+            QtWidgets.QApplication.sendEvent(view.viewport(), event)
+
+        def drag(legacy):
+            if legacy:
+                # Before movements were coalesced they were applied on every mouse move event.
+                diagram.moveTimer.isActive = lambda: False
+            else:
+                diagram.moveTimer.__dict__.pop('isActive', None)
+            origin = nodes[0].pos()
+            view.centerOn(origin)
+            diagram.clearSelection()
+            for node in nodes:
+                node.setSelected(True)
+            diagram.mp_Node = nodes[0]
+            diagram.mp_NodePos = origin
+            diagram.mp_Pos = origin
+            diagram.mp_Data = diagram.setupMove(nodes)
+            diagram.setMode(DiagramMode.NodeMove)
+            counts['updates'] = 0
+            start = time.perf_counter()
+            for i in range(1, options.events + 1):
+                due = start + i * options.rate / 1000
+                while time.perf_counter() < due:
+                    QtWidgets.QApplication.processEvents()
+                pos = origin + QtCore.QPointF(i, i / 2)
+                send(QtCore.QEvent.MouseMove, pos, QtCore.Qt.LeftButton)
+            with Timer() as timer:
+                send(QtCore.QEvent.MouseButtonRelease, pos, QtCore.Qt.NoButton)
+            total = time.perf_counter() - start
+            updates = counts['updates']
+            moved = nodes[0].pos() - origin
+            session.undostack.undo()
+            lag = total - timer.elapsed - options.events * options.rate / 1000
+            return total * 1000, lag * 1000, timer.elapsed * 1000, updates, moved
+
+        AbstractEdge.updateEdge = counted
+        try:
+            results = [('legacy', drag(True)), ('coalesced', drag(False))]
+        finally:
+            AbstractEdge.updateEdge = updateEdge
+        print('Drag: {0} nodes, {1} edges, {2} mouse events every {3}ms'.format(
+            len(nodes), len(nodes) - 1, options.events, options.rate))
+        for name, (total, lag, release, updates, moved) in results:
+            print('{0:>10}: drag={1:.0f}ms lag={2:.0f}ms release={3:.0f}ms edge updates={4} offset=({5:.0f}, {6:.0f})'.format(
+                name, total, lag, release, updates, moved.x(), moved.y()))
+        # Dispose the session while the application is still alive (the subwindows having received input events).
+        session.deleteLater()
+        QtWidgets.QApplication.processEvents()
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of filling the Ontology Explorer with the predicate nodes of a project.
+
+USAGE:
+    python -m benchmarks.explorer [--project @examples/Diet] [--scale 20] [--runs 200]
+
+The explorer model is built out of all the nodes of the project appending one row at a time, looking up
+rows with QStandardItemModel.findItems and sorting the view after every row (the previous behavior), and
+compared with the bulk population through the (type, predicate) and (diagram, node id) indexes with a
+single sort; then the removal and addition of a single node (e.g. a label change) are timed the same way.
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def legacyAddNode(widget, diagram, node):
+    """
+    Add a node in the explorer as done before rows were indexed and sorted in bulk.
+    :type widget: OntologyExplorerWidget
+    :type diagram: Diagram
+    :type node: AbstractNode
+    """
+    from PyQt5 import QtCore
+    from PyQt5 import QtGui
+    if node.type() in widget.Types:
+        parent = None
+        for i in widget.model.findItems(widget.parentKey(node), QtCore.Qt.MatchExactly):
+            if node.type() is i.child(0).data().type():
+                parent = i
+                break
+        if not parent:
+            parent = QtGui.QStandardItem(widget.parentKey(node))
+            parent.setIcon(widget.iconFor(node))
+            widget.model.appendRow(parent)
+            widget.proxy.sort(0, QtCore.Qt.AscendingOrder)
+        child = QtGui.QStandardItem(widget.childKey(diagram, node))
+        child.setData(node)
+        parent.appendRow(child)
+        widget.proxy.sort(0, QtCore.Qt.AscendingOrder)
+
+
+def legacyRemoveNode(widget, diagram, node):
+    """
+    Remove a node from the explorer as done before rows were indexed.
+    :type widget: OntologyExplorerWidget
+    :type diagram: Diagram
+    :type node: AbstractNode
+    """
+    from PyQt5 import QtCore
+    if node.type() in widget.Types:
+        for parent in widget.model.findItems(widget.parentKey(node), QtCore.Qt.MatchExactly):
+            if node.type() is parent.child(0).data().type():
+                key = widget.childKey(diagram, node)
+                for i in range(parent.rowCount()):
+                    if parent.child(i).text() == key:
+                        parent.removeRow(i)
+                        break
+                if not parent.rowCount():
+                    widget.model.removeRow(parent.index().row())
+                break
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--project', dest='project', default='@examples/Diet')
+    parser.add_argument('--scale', dest='scale', type=int, default=20)
+    parser.add_argument('--runs', dest='runs', type=int, default=200)
+    options = parser.parse_args()
+
+    from eddy.core.plugin import PluginManager
+
+    path = scaleProject(options.project, options.scale)
+    try:
+        PluginManager.scan('@plugins/')
+        session = createSession(path)
+        project = session.project
+        widget = session.plugin('ontology_explorer').widget('ontology_explorer')
+        nodes = [x for x in project.nodes() if x.type() in widget.Types]
+        print('Project: {0} (x{1}): {2} predicate nodes'.format(options.project, options.scale, len(nodes)))
+
+        def clear():
+            widget.model.clear()
+            widget.children.clear()
+            widget.parents.clear()
+
+        clear()
+        with Timer() as t1:
+            for node in nodes:
+                legacyAddNode(widget, node.diagram, node)
+        rows = widget.model.rowCount()
+        clear()
+        with Timer() as t2:
+            widget.addNodes(nodes)
+        assert rows == widget.model.rowCount()
+        print('{0:>8}: row by row={1:.3f}ms bulk={2:.3f}ms ({3:.0f}x)'.format(
+            'populate', t1.elapsed * 1000, t2.elapsed * 1000, t1.elapsed / max(t2.elapsed, 1e-9)))
+
+        node = nodes[len(nodes) // 2]
+        clear()
+        for x in nodes:
+            legacyAddNode(widget, x.diagram, x)
+        with Timer() as t1:
+            for _ in range(options.runs):
+                legacyRemoveNode(widget, node.diagram, node)
+                legacyAddNode(widget, node.diagram, node)
+        assert rows == widget.model.rowCount()
+        clear()
+        widget.addNodes(nodes)
+        with Timer() as t2:
+            for _ in range(options.runs):
+                widget.doRemoveNode(node.diagram, node)
+                widget.doAddNode(node.diagram, node)
+                widget.doSort()
+        assert rows == widget.model.rowCount()
+        print('{0:>8}: row by row={1:.3f}ms indexed={2:.3f}ms ({3:.0f}x)'.format(
+            'single', t1.elapsed * 1000 / options.runs, t2.elapsed * 1000 / options.runs,
+            t1.elapsed / max(t2.elapsed, 1e-9)))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of the identification of nodes which can be identified as NEUTRAL.
+
+USAGE:
+    python -m benchmarks.identification [--nodes 500] [--runs 20]
+
+A chain of the requested amount of union nodes (fed by a single concept node) is added to a diagram and
+the identification of all its nodes (what loaders do when the nodes identities are not stored in the
+document) and of a single node (what the diagram does whenever an edge is added or removed) are timed:
+a breadth-first visit of the component for every identified node (the previous behavior) is compared
+with the identification of each component only once, looked up through the maintained components index.
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--nodes', dest='nodes', type=int, default=500)
+    parser.add_argument('--runs', dest='runs', type=int, default=20)
+    options = parser.parse_args()
+
+    from eddy.core.datatypes.graphol import Item, Identity
+    from eddy.core.diagram import NeutralComponents
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        session = createSession(path)
+        diagram = next(iter(session.project.diagrams()))
+        nodes = [diagram.factory.create(Item.UnionNode) for _ in range(options.nodes)]
+        edges = [diagram.factory.create(Item.InputEdge, source=diagram.factory.create(Item.ConceptNode), target=nodes[0])]
+        for source, target in zip(nodes, nodes[1:]):
+            edges.append(diagram.factory.create(Item.InputEdge, source=source, target=target))
+        for edge in edges:
+            edge.source.addEdge(edge)
+            edge.target.addEdge(edge)
+        print('Component: {0} union nodes, {1} input edges'.format(len(nodes), len(edges)))
+
+        def reset():
+            for node in nodes:
+                node.setIdentity(Identity.Neutral)
+
+        def bulk(maintained):
+            for node in nodes:
+                if not maintained:
+                    diagram.components = NeutralComponents()
+                diagram.sgnNodeIdentification.emit(node)
+            assert all(node.identity() is Identity.Concept for node in nodes)
+
+        def single(maintained):
+            if not maintained:
+                diagram.components = NeutralComponents()
+            diagram.sgnNodeIdentification.emit(nodes[-1])
+
+        # Bulk identification is quadratic when every node visits its component: time it once.
+        reset()
+        with Timer() as t1:
+            bulk(False)
+        reset()
+        diagram.components = NeutralComponents()
+        with Timer() as t2:
+            diagram.identifyNodes(nodes)
+        assert all(node.identity() is Identity.Concept for node in nodes)
+        print('{0:>8}: visit={1:.3f}ms maintained={2:.3f}ms ({3:.0f}x)'.format(
+            'bulk', t1.elapsed * 1000, t2.elapsed * 1000, t1.elapsed / max(t2.elapsed, 1e-9)))
+
+        with Timer() as t1:
+            for _ in range(options.runs):
+                single(False)
+        with Timer() as t2:
+            for _ in range(options.runs):
+                single(True)
+        print('{0:>8}: visit={1:.3f}ms maintained={2:.3f}ms ({3:.1f}x)'.format(
+            'single', t1.elapsed * 1000 / options.runs, t2.elapsed * 1000 / options.runs,
+            t1.elapsed / max(t2.elapsed, 1e-9)))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
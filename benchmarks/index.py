@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of the project-wide queries performed by the Info plugin after every item insertion/removal.
+
+USAGE:
+    python -m benchmarks.index [--project @examples/Diet] [--scale 50] [--runs 200]
+
+The figures served by the ProjectIndex (through its counters and cached views) are compared
+with the ones computed by merging the per-diagram collections on every call (the previous lookup).
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--project', dest='project', default='@examples/Diet')
+    parser.add_argument('--scale', dest='scale', type=int, default=50)
+    parser.add_argument('--runs', dest='runs', type=int, default=200)
+    options = parser.parse_args()
+
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.project import K_EDGE, K_ITEMS, K_NODE, K_PREDICATE, K_TYPE
+
+    path = scaleProject(options.project, options.scale)
+    try:
+        session = createSession(path)
+        project = session.project
+        index = project.index
+        diagram = sorted(project.diagrams(), key=lambda x: x.name)[0]
+        node = sorted(project.nodes(diagram), key=lambda x: x.id)[0]
+        print('Project: {0} (x{1}): {2} diagrams, {3} items'.format(
+            options.project, options.scale, len(project.diagrams()), len(project.items())))
+
+        def merge(key):
+            return set.union(*(set(index[key][i].values()) for i in index[key]))
+
+        def countMerged():
+            # Info plugin figures, as computed before the index kept counters.
+            subdict = index[K_TYPE]
+            for item in (Item.InclusionEdge, Item.MembershipEdge):
+                len(set().union(*(subdict[i][item] for i in subdict if item in subdict[i])))
+            for item in (Item.AttributeNode, Item.ConceptNode, Item.RoleNode):
+                len({i for i in index[K_PREDICATE][item] if diagram.name in index[K_PREDICATE][item][i][K_NODE]})
+
+        def countIndexed():
+            for item in (Item.InclusionEdge, Item.MembershipEdge):
+                project.itemNum(item)
+            for item in (Item.AttributeNode, Item.ConceptNode, Item.RoleNode):
+                project.predicateNum(item, diagram)
+
+        def viewMerged():
+            return merge(K_ITEMS), merge(K_NODE), merge(K_EDGE)
+
+        def viewIndexed():
+            return project.items(), project.nodes(), project.edges()
+
+        assert viewMerged() == viewIndexed()
+
+        for name, merged, indexed, edit in (
+            ('counters (after every edit)', countMerged, countIndexed, True),
+            ('views (after every edit)', viewMerged, viewIndexed, True),
+            ('views (no edit)', viewMerged, viewIndexed, False),
+        ):
+            results = []
+            for query in (merged, indexed):
+                with Timer() as timer:
+                    for _ in range(options.runs):
+                        if edit:
+                            project.doRemoveItem(diagram, node)
+                            project.doAddItem(diagram, node)
+                        query()
+                results.append(timer.elapsed * 1000 / options.runs)
+            print('{0:>28}: merged={1:.3f}ms indexed={2:.3f}ms'.format(name, *results))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Compare wall time and peak memory of the Graphol project loader in DOM and streaming mode,
+and when reopening a project from its snapshot.
+
+USAGE:
+    python -m benchmarks.loader [--project @examples/Diet] [--scale 20] [--runs 3]
+
+Every load is executed in a dedicated process so that peak RSS figures are not polluted by previous runs.
+"""
+
+
+import json
+import subprocess
+import sys
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, peakRSS, removeProject, scaleProject, Timer
+
+
+MODES = ('dom', 'stream', 'snapshot')
+
+
+def child(path, mode):
+    """
+    Load the given project using the given loader mode and print timing information as JSON.
+    :type path: str
+    :type mode: str
+    """
+    from eddy.core.loaders.graphol import GrapholProjectLoader_v2
+    session = createSession()
+    baseline = peakRSS()
+    loader = GrapholProjectLoader_v2(path, session)
+    loader.cache = mode == 'snapshot'
+    loader.streaming = mode in ('stream', 'snapshot')
+    with Timer() as timer:
+        loader.run()
+    print(json.dumps({
+        'items': len(session.project.items()),
+        'rss': peakRSS() - baseline,
+        'time': timer.elapsed,
+    }))
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--project', dest='project', default='@examples/Diet')
+    parser.add_argument('--scale', dest='scale', type=int, default=20)
+    parser.add_argument('--runs', dest='runs', type=int, default=3)
+    parser.add_argument('--child', dest='child', default=None)
+    parser.add_argument('--mode', dest='mode', choices=MODES, default='stream')
+    options = parser.parse_args()
+
+    if options.child:
+        child(options.child, options.mode)
+        return
+
+    path = scaleProject(options.project, options.scale)
+    try:
+        print('Project: {0} (x{1})'.format(options.project, options.scale))
+        for mode in MODES:
+            results = []
+            command = [sys.executable, '-m', 'benchmarks.loader', '--child', path, '--mode', mode]
+            if mode == 'snapshot':
+                # The first load creates the snapshot which is used by the measured ones.
+                subprocess.check_output(command, universal_newlines=True)
+            for _ in range(options.runs):
+                output = subprocess.check_output(command, universal_newlines=True)
+                results.append(json.loads(output.strip().splitlines()[-1]))
+            print('{0:>8}: items={1} time={2:.3f}s peak-rss-delta={3}KB'.format(
+                mode, results[0]['items'],
+                min(x['time'] for x in results),
+                min(x['rss'] for x in results)))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
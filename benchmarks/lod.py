@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of zooming and panning across a large diagram.
+
+USAGE:
+    python -m benchmarks.lod [--nodes 5000] [--pans 5]
+
+The requested amount of concept nodes (chained by inclusion edges) is laid out in a grid, and the diagram is
+zoomed out step by step, from the default zoom down to the minimum one: at each zoom level the time needed to
+repaint the view and to pan it --pans times is reported. Painting all the items in full detail at any zoom
+level (the previous behavior) is compared with painting them with less detail when zoomed out.
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--nodes', dest='nodes', type=int, default=5000)
+    parser.add_argument('--pans', dest='pans', type=int, default=5)
+    options = parser.parse_args()
+
+    from PyQt5 import QtCore
+    from PyQt5 import QtWidgets
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.items.common import Style
+    from eddy.ui.view import DiagramView
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        session = createSession(path)
+        diagram = next(iter(session.project.diagrams()))
+        diagram.clear()
+        columns = 100
+        nodes = []
+        for i in range(options.nodes):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setPos(QtCore.QPointF(i % columns * 160, i // columns * 100))
+            diagram.addItem(node)
+            nodes.append(node)
+        for source, target in zip(nodes, nodes[1:]):
+            edge = diagram.factory.create(Item.InclusionEdge, source=source, target=target)
+            source.addEdge(edge)
+            target.addEdge(edge)
+            diagram.addItem(edge)
+            edge.updateEdge()
+
+        session.resize(1400, 1000)
+        session.show()
+        session.sgnFocusDiagram.emit(diagram)
+        view = session.mdi.subWindowForDiagram(diagram).view
+        QtWidgets.QApplication.processEvents()
+        zooms = []
+        zoom = DiagramView.ZoomDefault
+        while zoom >= DiagramView.ZoomMin:
+            zooms.append(zoom)
+            zoom = round(zoom - DiagramView.ZoomStep, 2)
+
+        def measure():
+            results = []
+            for zoom in zooms:
+                view.scaleView(zoom)
+                view.centerOn(diagram.contentRect().center())
+                with Timer() as timer:
+                    view.viewport().repaint()
+                repaint = timer.elapsed
+                with Timer() as timer:
+                    for _ in range(options.pans):
+                        view.moveBy(QtCore.QPointF(view.visibleRect().width() / 3, 0))
+                        view.viewport().repaint()
+                results.append((repaint * 1000, timer.elapsed * 1000 / options.pans))
+            return results
+
+        shapeZoom, labelZoom = Style.ShapeZoom, Style.LabelZoom
+        Style.ShapeZoom = Style.LabelZoom = 0
+        try:
+            before = measure()
+        finally:
+            Style.ShapeZoom, Style.LabelZoom = shapeZoom, labelZoom
+        after = measure()
+
+        print('LOD: {0} nodes, {1} edges'.format(len(nodes), len(nodes) - 1))
+        for zoom, (repaint0, pan0), (repaint1, pan1) in zip(zooms, before, after):
+            print('zoom={0:.1f}: repaint before={1:.0f}ms after={2:.0f}ms | pan before={3:.0f}ms after={4:.0f}ms'.format(
+                zoom, repaint0, repaint1, pan0, pan1))
+        session.deleteLater()
+        QtWidgets.QApplication.processEvents()
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
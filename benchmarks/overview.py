@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of keeping the Overview plugin up to date on a large diagram.
+
+USAGE:
+    python -m benchmarks.overview [--nodes 1000] [--runs 10]
+
+A diagram with the requested amount of concept nodes (chained by inclusion edges) is inspected by the overview,
+and the following are timed: the computation of the diagram content bounds (mapping the bounding rectangle
+of every item, the previous behavior, versus the incrementally maintained bounds), the overview refresh
+following a selection change, and the overview repaint following a scroll of the inspected view (painting
+the diagram through the QGraphicsView at thumbnail scale, the previous behavior, versus rendering the
+thumbnail only on refresh and drawing it, with the visible area, on repaint).
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def legacyVisibleRect(diagram, margin=0):
+    """
+    Returns the area of the items of the given diagram as computed before bounds were maintained.
+    :type diagram: Diagram
+    :type margin: float
+    :rtype: QtCore.QRectF
+    """
+    from PyQt5 import QtCore
+    items = diagram.items()
+    if items:
+        x = set()
+        y = set()
+        for item in items:
+            b = item.mapRectToScene(item.boundingRect())
+            x.update({b.left(), b.right()})
+            y.update({b.top(), b.bottom()})
+        return QtCore.QRectF(QtCore.QPointF(min(x) - margin, min(y) - margin), QtCore.QPointF(max(x) + margin, max(y) + margin))
+    return QtCore.QRectF()
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--nodes', dest='nodes', type=int, default=1000)
+    parser.add_argument('--runs', dest='runs', type=int, default=10)
+    options = parser.parse_args()
+
+    from PyQt5 import QtCore
+    from PyQt5 import QtGui
+    from PyQt5 import QtWidgets
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.plugin import PluginManager
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        PluginManager.scan('@plugins/')
+        session = createSession(path)
+        diagram = next(iter(session.project.diagrams()))
+        nodes = []
+        for i in range(options.nodes):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setPos(QtCore.QPointF(i % 100 * 200, i // 100 * 150))
+            diagram.addItem(node)
+            nodes.append(node)
+        for source, target in zip(nodes, nodes[1:]):
+            edge = diagram.factory.create(Item.InclusionEdge, source=source, target=target)
+            source.addEdge(edge)
+            target.addEdge(edge)
+            diagram.addItem(edge)
+            edge.updateEdge()
+        print('Diagram: {0} items'.format(len(diagram.items())))
+
+        plugin = session.plugin('overview')
+        widget = plugin.widget('overview')
+        session.show()
+        session.sgnFocusDiagram.emit(diagram)
+        plugin.onSubWindowActivated(session.mdi.subWindowForDiagram(diagram))
+        plugin.doRefresh()
+
+        def legacyRedraw():
+            widget.fitInView(legacyVisibleRect(diagram, margin=10), QtCore.Qt.KeepAspectRatio)
+
+        def legacyPaint():
+            # Paint the scene items through the view, as done before thumbnails were cached.
+            pixmap = QtGui.QPixmap(widget.viewport().size())
+            painter = QtGui.QPainter(pixmap)
+            QtWidgets.QGraphicsView.render(widget, painter, QtCore.QRectF(pixmap.rect()), widget.viewport().rect())
+            painter.end()
+
+        def paint():
+            widget.viewport().grab()
+
+        def measure(func):
+            with Timer() as timer:
+                for _ in range(options.runs):
+                    func()
+            return timer.elapsed * 1000 / options.runs
+
+        assert widget.view() is not None
+        assert legacyVisibleRect(diagram, 10) == diagram.visibleRect(10)
+        results = (
+            ('bounds', measure(lambda: legacyVisibleRect(diagram, 10)), measure(lambda: diagram.visibleRect(10))),
+            ('refresh', measure(lambda: (legacyRedraw(), legacyPaint())), measure(lambda: (widget.redraw(), paint()))),
+            ('repaint', measure(legacyPaint), measure(paint)),
+        )
+        for name, before, after in results:
+            print('{0:>8}: before={1:.3f}ms after={2:.3f}ms ({3:.0f}x)'.format(name, before, after, before / max(after, 1e-9)))
+        session.hide()
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
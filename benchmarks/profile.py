@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of the profile validation of edges.
+
+USAGE:
+    python -m benchmarks.profile [--project @examples/Diet] [--scale 10] [--runs 5]
+
+For each profile (OWL 2, OWL 2 QL, OWL 2 RL) the validation of all the edges of the project (what the
+syntax validation does) and of an edge being dragged over all the nodes of a diagram (what the diagram
+does on mouse move while an edge is being inserted) is measured running every rule of the profile on
+every triple (the previous behavior), running only the rules matching the triple (dispatch table), and
+looking up the results of triples validated before (validation cache, as when hovering nodes again).
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--project', dest='project', default='@examples/Diet')
+    parser.add_argument('--scale', dest='scale', type=int, default=10)
+    parser.add_argument('--runs', dest='runs', type=int, default=5)
+    options = parser.parse_args()
+
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.datatypes.owl import OWLProfile
+
+    path = scaleProject(options.project, options.scale)
+    try:
+        session = createSession(path)
+        project = session.project
+        diagram = sorted(project.diagrams(), key=lambda x: x.name)[0]
+        print('Project: {0} (x{1}): {2} diagrams, {3} items'.format(
+            options.project, options.scale, len(project.diagrams()), len(project.items())))
+
+        edge = sorted((x for x in project.edges(diagram) if x.type() is Item.InclusionEdge), key=lambda x: x.id)[0]
+        triples = {
+            'all edges': [(x.source, x, x.target) for x in project.edges()],
+            'edge drag': [(edge.source, edge, x) for x in project.nodes(diagram)],
+        }
+
+        for profile in (OWLProfile.OWL2, OWLProfile.OWL2QL, OWLProfile.OWL2RL):
+            profile = session.createProfile(profile, project)
+
+            def check(triples):
+                for triple in triples:
+                    profile.reset()
+                    profile.checkEdge(*triple)
+
+            for name in sorted(triples):
+                results = []
+                for mode in ('all rules', 'dispatched', 'cached'):
+                    if mode == 'all rules':
+                        # Validation as performed before rules were dispatched by type.
+                        profile.edgeRulesFor = lambda *_: profile.edgeRules()
+                        profile.nodeRulesFor = lambda *_: profile.nodeRules()
+                    if mode != 'cached':
+                        profile.CacheSize = 0
+                    else:
+                        check(triples[name])
+                    try:
+                        with Timer() as timer:
+                            for _ in range(options.runs):
+                                check(triples[name])
+                    finally:
+                        profile.__dict__.pop('edgeRulesFor', None)
+                        profile.__dict__.pop('nodeRulesFor', None)
+                        profile.__dict__.pop('CacheSize', None)
+                    results.append(timer.elapsed * 1000 / options.runs)
+                print('{0:>10} {1:>10} ({2} triples): all rules={3:.3f}ms dispatched={4:.3f}ms cached={5:.3f}ms'.format(
+                    profile.name(), name, len(triples[name]), *results))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
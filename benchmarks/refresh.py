@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of keeping the dock plugins up to date while a bulk operation is performed.
+
+USAGE:
+    python -m benchmarks.refresh [--items 500] [--runs 5]
+
+The requested amount of concept nodes is added to the focused diagram (and removed again) through a single
+command, as pasting does, and the refreshes performed by the Info and Overview plugins are timed and counted:
+refreshing the plugin widgets on every notification (the previous behavior) is compared with scheduling the
+refresh, so that all the notifications delivered before control returns to the event loop are coalesced.
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--items', dest='items', type=int, default=500)
+    parser.add_argument('--runs', dest='runs', type=int, default=5)
+    options = parser.parse_args()
+
+    from PyQt5 import QtCore
+    from PyQt5 import QtWidgets
+    from eddy.core.commands.common import CommandItemsAdd
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.plugin import PluginManager
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        PluginManager.scan('@plugins/')
+        session = createSession(path)
+        diagram = next(iter(session.project.diagrams()))
+        session.sgnFocusDiagram.emit(diagram)
+        plugins = [session.plugin('info'), session.plugin('overview')]
+        for plugin in plugins:
+            # The MDI area does not activate subwindows while the session is not shown.
+            plugin.onSubWindowActivated(session.mdi.subWindowForDiagram(diagram))
+        counts = dict()
+
+        def counted(plugin, refresh):
+            def wrapper():
+                counts[plugin] = counts.get(plugin, 0) + 1
+                refresh()
+            return wrapper
+
+        for plugin in plugins:
+            plugin.refresh = counted(plugin, plugin.refresh)
+
+        nodes = []
+        for i in range(options.items):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setPos(QtCore.QPointF(i % 25 * 150, i // 25 * 100))
+            nodes.append(node)
+        command = CommandItemsAdd(diagram, nodes)
+
+        def run():
+            command.redo()
+            command.undo()
+            # Give the event loop the chance to deliver scheduled refreshes.
+            QtWidgets.QApplication.processEvents()
+            for plugin in plugins:
+                plugin.doRefresh()
+
+        run()
+        print('Operation: add and remove {0} concept nodes, {1} runs'.format(options.items, options.runs))
+        results = []
+        for mode in ('immediate', 'scheduled'):
+            if mode == 'immediate':
+                for plugin in plugins:
+                    # Refresh as performed before refreshes were scheduled.
+                    plugin.scheduleRefresh = lambda plugin=plugin: (setattr(plugin, 'dirty', True), plugin.doRefresh())
+            counts.clear()
+            try:
+                with Timer() as timer:
+                    for _ in range(options.runs):
+                        run()
+            finally:
+                for plugin in plugins:
+                    plugin.__dict__.pop('scheduleRefresh', None)
+            results.append((timer.elapsed * 1000 / options.runs, sum(counts.values()) / options.runs))
+        for mode, (elapsed, refreshes) in zip(('immediate', 'scheduled'), results):
+            print('{0:>10}: {1:.3f}ms ({2:.0f} refreshes)'.format(mode, elapsed, refreshes))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of rendering all the elements of a project after it has been loaded.
+
+USAGE:
+    python -m benchmarks.render [--nodes 500] [--degree 3] [--runs 3]
+
+A dense diagram is generated, made of the requested amount of concept nodes packed in a grid, each of them
+connected through inclusion edges to --degree other nodes picked in its neighbourhood (so that edges cross
+plenty of nodes and other edges), and the render performed by loaders (projectRender) is timed: stacking each
+edge above the items it collides with, queried through the scene index (the previous behavior), is compared
+with stacking it above the topmost layer of nodes, as maintained by the diagram.
+"""
+
+
+from argparse import ArgumentParser
+from types import SimpleNamespace
+import random
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def legacyEdgeDepth(edge):
+    """
+    Returns the depth of the given edge as computed before node layers were maintained.
+    :type edge: AbstractEdge
+    :rtype: float
+    """
+    try:
+        zValue = max(*(x.zValue() for x in edge.collidingItems())) + 0.1
+    except TypeError:
+        zValue = edge.source.zValue() + 0.1
+        if edge.source.label:
+            zValue = max(zValue, edge.source.label.zValue())
+        if edge.target:
+            zValue = max(zValue, edge.target.zValue())
+            if edge.target.label:
+                zValue = max(zValue, edge.target.label.zValue())
+    return zValue
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--nodes', dest='nodes', type=int, default=500)
+    parser.add_argument('--degree', dest='degree', type=int, default=3)
+    parser.add_argument('--runs', dest='runs', type=int, default=3)
+    options = parser.parse_args()
+
+    from PyQt5 import QtCore
+    from PyQt5 import QtWidgets
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.loaders.graphol import GrapholLoaderMixin_v2
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        session = createSession(path)
+        diagram = next(iter(session.project.diagrams()))
+        generator = random.Random(0)
+        columns = 40
+        nodes = []
+        for i in range(options.nodes):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setPos(QtCore.QPointF(i % columns * 140, 3000 + i // columns * 80))
+            diagram.addItem(node)
+            diagram.sgnItemAdded.emit(diagram, node)
+            nodes.append(node)
+        edges = 0
+        for i, source in enumerate(nodes):
+            for _ in range(options.degree):
+                j = i + generator.choice((-1, 1)) * generator.randint(2, 3 * columns)
+                if 0 <= j < len(nodes):
+                    target = nodes[j]
+                    edge = diagram.factory.create(Item.InclusionEdge, source=source, target=target)
+                    source.addEdge(edge)
+                    target.addEdge(edge)
+                    diagram.addItem(edge)
+                    diagram.sgnItemAdded.emit(diagram, edge)
+                    edges += 1
+        loader = SimpleNamespace(nproject=session.project)
+        print('Render: {0} items ({1} generated nodes, {2} generated edges)'.format(
+            len(session.project.items()), len(nodes), edges))
+
+        def measure():
+            with Timer() as timer:
+                for _ in range(options.runs):
+                    GrapholLoaderMixin_v2.projectRender(loader)
+            return timer.elapsed * 1000 / options.runs
+
+        diagram.layers.edgeDepth = legacyEdgeDepth
+        try:
+            before = measure()
+        finally:
+            del diagram.layers.edgeDepth
+        after = measure()
+        for edge in session.project.edges(diagram):
+            for item in edge.collidingItems():
+                if item.isNode():
+                    assert edge.zValue() > item.zValue()
+        print('projectRender: before={0:.0f}ms after={1:.0f}ms ({2:.1f}x)'.format(before, after, before / after))
+        session.deleteLater()
+        QtWidgets.QApplication.processEvents()
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Compare the cost of saving a project from scratch with the one of saving it after a single node edit.
+
+USAGE:
+    python -m benchmarks.save [--project @examples/Diet] [--scale 50] [--runs 5]
+
+The collection of the project structure (performed in the main thread) and its
+serialization to disk (performed in a worker thread) are measured separately.
+"""
+
+
+from argparse import ArgumentParser
+
+from PyQt5 import QtCore
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def save(exporter):
+    """
+    Save the project using the given exporter and returns the time spent collecting and writing it.
+    :type exporter: GrapholProjectExporter
+    :rtype: tuple
+    """
+    with Timer() as collect:
+        worker = exporter.createWorker()
+    with Timer() as write:
+        worker.save()
+    exporter.project.setClean()
+    return collect.elapsed, write.elapsed
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--project', dest='project', default='@examples/Diet')
+    parser.add_argument('--scale', dest='scale', type=int, default=50)
+    parser.add_argument('--runs', dest='runs', type=int, default=5)
+    options = parser.parse_args()
+
+    from eddy.core.commands.nodes import CommandNodeMove
+    from eddy.core.exporters.graphol import GrapholProjectExporter
+
+    path = scaleProject(options.project, options.scale)
+    try:
+        session = createSession(path)
+        project = session.project
+        diagram = sorted(project.diagrams(), key=lambda x: x.name)[0]
+        node = sorted(project.nodes(diagram), key=lambda x: x.id)[0]
+        print('Project: {0} (x{1}): {2} diagrams, {3} items'.format(
+            options.project, options.scale, len(project.diagrams()), len(project.items())))
+
+        results = {'full': [], 'incremental': []}
+        for i in range(options.runs):
+            # SAVE FROM SCRATCH
+            GrapholProjectExporter.Cache.clear()
+            results['full'].append(save(GrapholProjectExporter(project, session)))
+            # MOVE A SINGLE NODE AND SAVE AGAIN
+            pos = node.pos()
+            undo = {'nodes': {node: {'anchors': {}, 'pos': pos}}, 'edges': {}}
+            redo = {'nodes': {node: {'anchors': {}, 'pos': pos + QtCore.QPointF(20, 20) * (-1) ** i}}, 'edges': {}}
+            session.undostack.push(CommandNodeMove(diagram, undo, redo))
+            results['incremental'].append(save(GrapholProjectExporter(project, session)))
+
+        for mode in ('full', 'incremental'):
+            print('{0:>12}: collect={1:.3f}s write={2:.3f}s'.format(
+                mode, min(x[0] for x in results[mode]), min(x[1] for x in results[mode])))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of refreshing the look of a large amount of diagram items.
+
+USAGE:
+    python -m benchmarks.styles [--nodes 1000] [--runs 3]
+
+The requested amount of concept nodes (chained by inclusion edges) is laid out so that all of them are visible
+at once, and the following passes are timed, both when updating the items and when repainting the view:
+
+    - refresh: all the items are updated without changing their state (e.g: when switching the profile)
+    - validate: all the nodes are painted as valid (as the outcome of a repeated syntax validation)
+    - select: all the items are painted as selected and then as deselected
+
+Regenerating the cache of the items on every update (the previous behavior) is compared with regenerating it
+only when the look of the item actually changes. Fresh pens and brushes were also allocated on every update:
+this is not accounted here.
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def legacyUpdateCache(self):
+    """
+    Regenerate the cache of the given item as done before items tracked the changes of their polygons.
+    :type self: AbstractItem
+    :rtype: bool
+    """
+    from eddy.core.items.common import AbstractItem
+    for polygon in self.polygons():
+        polygon.setChanged(False)
+    self.setCacheMode(AbstractItem.NoCache)
+    self.setCacheMode(AbstractItem.DeviceCoordinateCache)
+    self.update()
+    return True
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--nodes', dest='nodes', type=int, default=1000)
+    parser.add_argument('--runs', dest='runs', type=int, default=3)
+    options = parser.parse_args()
+
+    from PyQt5 import QtCore
+    from PyQt5 import QtWidgets
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.items.common import AbstractItem
+
+    path = scaleProject('@examples/Pizza', 1)
+    try:
+        session = createSession(path)
+        diagram = next(iter(session.project.diagrams()))
+        diagram.clear()
+        columns = 40
+        nodes = []
+        for i in range(options.nodes):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setPos(QtCore.QPointF(i % columns * 140, i // columns * 80))
+            diagram.addItem(node)
+            nodes.append(node)
+        edges = []
+        for source, target in zip(nodes, nodes[1:]):
+            edge = diagram.factory.create(Item.InclusionEdge, source=source, target=target)
+            source.addEdge(edge)
+            target.addEdge(edge)
+            diagram.addItem(edge)
+            edge.updateEdge()
+            edges.append(edge)
+
+        session.resize(1400, 1000)
+        session.show()
+        session.sgnFocusDiagram.emit(diagram)
+        view = session.mdi.subWindowForDiagram(diagram).view
+        QtWidgets.QApplication.processEvents()
+        rect = diagram.contentRect()
+        view.scaleView(min(view.viewport().width() / rect.width(), view.viewport().height() / rect.height()))
+        view.centerOn(rect.center())
+
+        def refresh():
+            for node in nodes:
+                node.updateNode(selected=node.isSelected())
+            for edge in edges:
+                edge.updateEdge()
+
+        def validate():
+            for node in nodes:
+                node.updateNode(selected=node.isSelected(), valid=True)
+
+        def select():
+            for selected in (True, False):
+                for node in nodes:
+                    node.updateNode(selected=selected)
+                for edge in edges:
+                    edge.updateEdge(selected=selected)
+
+        def measure(task):
+            update = repaint = 0
+            for _ in range(options.runs):
+                with Timer() as timer:
+                    task()
+                update += timer.elapsed
+                with Timer() as timer:
+                    view.viewport().repaint()
+                    QtWidgets.QApplication.processEvents()
+                repaint += timer.elapsed
+            return update * 1000 / options.runs, repaint * 1000 / options.runs
+
+        view.viewport().repaint()
+        print('Styles: {0} nodes, {1} edges, zoom={2:.2f}'.format(len(nodes), len(edges), view.zoom))
+        updateCache = AbstractItem.updateCache
+        for name, task in (('refresh', refresh), ('validate', validate), ('select', select)):
+            AbstractItem.updateCache = legacyUpdateCache
+            try:
+                before = measure(task)
+            finally:
+                AbstractItem.updateCache = updateCache
+            after = measure(task)
+            print('{0:>9}: update before={1:.0f}ms after={2:.0f}ms | repaint before={3:.0f}ms after={4:.0f}ms'.format(
+                name, before[0], after[0], before[1], after[1]))
+        session.deleteLater()
+        QtWidgets.QApplication.processEvents()
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
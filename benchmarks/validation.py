@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Measure the cost of running the syntax validation after a single edit of the project.
+
+USAGE:
+    python -m benchmarks.validation [--project @examples/Diet] [--scale 50] [--runs 20]
+
+The incremental validation performed by the project SyntaxValidator (which only checks again the items
+affected by the edit) is compared with the full validation of all the edges and isolated nodes of the
+project (the validation performed by the syntax validation dialog before results were kept).
+"""
+
+
+from argparse import ArgumentParser
+
+from benchmarks import createSession, removeProject, scaleProject, Timer
+
+
+def main():
+    """
+    Benchmark entry point.
+    """
+    parser = ArgumentParser()
+    parser.add_argument('--project', dest='project', default='@examples/Diet')
+    parser.add_argument('--scale', dest='scale', type=int, default=50)
+    parser.add_argument('--runs', dest='runs', type=int, default=20)
+    parser.add_argument('--profile', dest='profile', default='OWL 2')
+    options = parser.parse_args()
+
+    from eddy.core.commands.edges import CommandEdgeSwap
+
+    path = scaleProject(options.project, options.scale)
+    try:
+        session = createSession(path)
+        project = session.project
+        project.profile = session.createProfile(options.profile, project)
+        validator = project.validator
+        edge = sorted(project.edges(), key=lambda x: (x.diagram.name, x.id))[0]
+        print('Project: {0} (x{1}): {2} diagrams, {3} items'.format(
+            options.project, options.scale, len(project.diagrams()), len(project.items())))
+
+        def validateFull():
+            items = list(project.edges()) + list(filter(lambda n: not n.adjacentNodes(), project.nodes()))
+            return sorted(filter(None, map(validator.check, items)))
+
+        def validateIncremental():
+            return sorted(x[1] for x in validator.errors())
+
+        validator.reset()
+        with Timer() as timer:
+            validator.validate()
+        print('{0:>12}: {1:.3f}ms'.format('first run', timer.elapsed * 1000))
+
+        results = []
+        for validate in (validateFull, validateIncremental):
+            with Timer() as timer:
+                for _ in range(options.runs):
+                    session.undostack.push(CommandEdgeSwap(edge.diagram, {edge}))
+                    validate()
+            results.append(timer.elapsed * 1000 / options.runs)
+        assert validateFull() == validateIncremental()
+        print('{0:>12}: full={1:.3f}ms incremental={2:.3f}ms'.format('after edit', *results))
+    finally:
+        removeProject(path)
+
+
+if __name__ == '__main__':
+    main()
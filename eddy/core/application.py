@@ -250,10 +250,10 @@ class Eddy(QtWidgets.QApplication):
                 break
         else:
             # If we do not have a session for the given project we'll create one.
-            with BusyProgressDialog('Loading project: {0}'.format(os.path.basename(path))):
+            with BusyProgressDialog('Loading project: {0}'.format(os.path.basename(path))) as progress:
     
                 try:
-                    session = Session(self, path)
+                    session = Session(self, path, progress=progress)
                 except ProjectStopLoadingError:
                     pass
                 except (ProjectNotFoundError, ProjectNotValidError, ProjectVersionError) as e:
@@ -263,6 +263,8 @@ class CommandEdgeSwap(QtWidgets.QUndoCommand):
         # Swap the edges.
         for edge in self.edges:
             edge.source, edge.target = edge.target, edge.source
+            edge.source.indexEdge(edge)
+            edge.target.indexEdge(edge)
             edge.breakpoints = edge.breakpoints[::-1]
             for node in {edge.source, edge.target}:
                 if node in self.inputs:
@@ -280,6 +282,8 @@ class CommandEdgeSwap(QtWidgets.QUndoCommand):
         # Swap the edges.
         for edge in self.edges:
             edge.source, edge.target = edge.target, edge.source
+            edge.source.indexEdge(edge)
+            edge.target.indexEdge(edge)
             edge.breakpoints = edge.breakpoints[::-1]
             for node in {edge.source, edge.target}:
                 if node in self.inputs:
@@ -74,6 +74,9 @@ class CommandLabelChange(QtWidgets.QUndoCommand):
         self.item.setText(self.data['redo'])
         if self.item.isNode():
             self.project.doAddItem(self.diagram, self.item)
+            # NEIGHBOURS' VALIDATION MAY DEPEND ON THIS LABEL
+            for node in {self.item} | self.item.adjacentNodes():
+                node.updateRevision()
 
         # RESTORE METADATA
         if meta:
@@ -113,6 +116,9 @@ class CommandLabelChange(QtWidgets.QUndoCommand):
         self.item.setText(self.data['undo'])
         if self.item.isNode():
             self.project.doAddItem(self.diagram, self.item)
+            # NEIGHBOURS' VALIDATION MAY DEPEND ON THIS LABEL
+            for node in {self.item} | self.item.adjacentNodes():
+                node.updateRevision()
 
         # RESTORE METADATA
         if meta:
@@ -36,7 +36,6 @@
 from PyQt5 import QtWidgets
 
 from eddy.core.functions.misc import first
-from eddy.core.items.common import AbstractItem
 
 
 class CommandNodeAdd(QtWidgets.QUndoCommand):
@@ -113,10 +112,6 @@ class CommandNodeRezize(QtWidgets.QUndoCommand):
 
     def redo(self):
         """redo the command"""
-        # TURN CACHING OFF
-        for edge in self.node.edges:
-            edge.setCacheMode(AbstractItem.NoCache)
-
         self.node.background.setGeometry(self.data['redo']['background'])
         self.node.selection.setGeometry(self.data['redo']['selection'])
         self.node.polygon.setGeometry(self.data['redo']['polygon'])
@@ -129,18 +124,10 @@ class CommandNodeRezize(QtWidgets.QUndoCommand):
         self.node.updateEdges()
         self.node.update()
 
-        # TURN CACHING ON
-        for edge in self.node.edges:
-            edge.setCacheMode(AbstractItem.DeviceCoordinateCache)
-
         self.diagram.sgnUpdated.emit()
 
     def undo(self):
         """undo the command"""
-        # TURN CACHING OFF
-        for edge in self.node.edges:
-            edge.setCacheMode(AbstractItem.NoCache)
-
         self.node.background.setGeometry(self.data['undo']['background'])
         self.node.selection.setGeometry(self.data['undo']['selection'])
         self.node.polygon.setGeometry(self.data['undo']['polygon'])
@@ -153,10 +140,6 @@ class CommandNodeRezize(QtWidgets.QUndoCommand):
         self.node.updateEdges()
         self.node.update()
 
-        # TURN CACHING ON
-        for edge in self.node.edges:
-            edge.setCacheMode(AbstractItem.DeviceCoordinateCache)
-
         self.diagram.sgnUpdated.emit()
 
 
@@ -188,9 +171,6 @@ class CommandNodeMove(QtWidgets.QUndoCommand):
 
     def redo(self):
         """redo the command"""
-        # Turn off caching.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.NoCache)
         # Update edges breakpoints.
         for edge, breakpoints in self._redo['edges'].items():
             for i in range(len(breakpoints)):
@@ -204,17 +184,11 @@ class CommandNodeMove(QtWidgets.QUndoCommand):
         # Update edges.
         for edge in self._edges:
             edge.updateEdge()
-        # Turn on caching.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.DeviceCoordinateCache)
         # Emit updated signal.
         self._diagram.sgnUpdated.emit()
 
     def undo(self):
         """undo the command"""
-        # Turn off caching.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.NoCache)
         # Update edges breakpoints.
         for edge, breakpoints in self._undo['edges'].items():
             for i in range(len(breakpoints)):
@@ -228,9 +202,6 @@ class CommandNodeMove(QtWidgets.QUndoCommand):
         # Update edges.
         for edge in self._edges:
             edge.updateEdge()
-        # Turn caching ON.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.DeviceCoordinateCache)
         # Emit updated signal.
         self._diagram.sgnUpdated.emit()
 
@@ -279,7 +250,8 @@ class CommandNodeSwitchTo(QtWidgets.QUndoCommand):
 
         # Clear edge and anchor references from node1.
         self.node['undo'].anchors.clear()
-        self.node['undo'].edges.clear()
+        for edge in set(self.node['undo'].edges):
+            self.node['undo'].removeEdge(edge)
 
         # Remove the old node from the diagram.
         self.diagram.removeItem(self.node['undo'])
@@ -315,7 +287,8 @@ class CommandNodeSwitchTo(QtWidgets.QUndoCommand):
 
         # Clear edge and anchor references from node2.
         self.node['redo'].anchors.clear()
-        self.node['redo'].edges.clear()
+        for edge in set(self.node['redo'].edges):
+            self.node['redo'].removeEdge(edge)
 
         # Remove the new node from the diagram.
         self.diagram.removeItem(self.node['redo'])
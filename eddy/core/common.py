@@ -1388,6 +1388,21 @@ class HasThreadingSystem(object):
         """
         return [(name, qthread) for name, qthread in self._threads.items()]
 
+    def waitThread(self, name):
+        """
+        Block until the worker running in the given thread completes its job, and dispose the thread.
+        Differently from stopThread, the thread is never forcibly terminated.
+        :type name: str
+        """
+        qthread = self.thread(name)
+        if qthread:
+            # The worker requests the thread to quit through a queued connection which we
+            # would never process while blocking here, hence request it ourselves: the
+            # request is honoured as soon as the worker returns from its main method.
+            qthread.quit()
+            qthread.wait()
+            self.stopThread(name)
+
     def worker(self, name):
         """
         Returns the reference to a worker which is running in a QThread.
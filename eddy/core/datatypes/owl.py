@@ -225,6 +225,15 @@ class OWLAxiom(Enum_):
         raise ValueError('unsupported profile: %s' % profile)
 
 
+@unique
+class OWLEngine(Enum_):
+    """
+    Extends Enum providing all the available engines for OWL 2 ontology generation.
+    """
+    OWLAPI = 'OWL API'
+    Python = 'Python (Functional-style syntax only)'
+
+
 @unique
 class OWLProfile(Enum_):
     """
@@ -59,6 +59,7 @@ class File(Enum_):
     Graphol = 'Graphol (*.graphol)'
     Html = 'Hyper-Text Markup Language (*.html)'
     Jpeg = 'JPEG (*.jpg)'
+    Json = 'JavaScript Object Notation (*.json)'
     Owl = 'Web Ontology Language (*.owl)'
     Pdf = 'Portable Document Format (*.pdf)'
     Png = 'PNG (*.png)'
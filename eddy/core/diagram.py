@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+import math
+
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
@@ -44,7 +46,7 @@ from eddy.core.commands.labels import CommandLabelMove
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.misc import DiagramMode
 from eddy.core.functions.graph import bfs
-from eddy.core.functions.misc import snap, partition, first
+from eddy.core.functions.misc import snap, first
 from eddy.core.functions.signals import connect
 from eddy.core.generators import GUID
 from eddy.core.items.factory import ItemFactory
@@ -64,11 +66,20 @@ class Diagram(QtWidgets.QGraphicsScene):
     * sgnItemRemoved: whenever an element is removed from the Diagram.
     * sgnModeChanged: whenever the Diagram operational mode (or its parameter) changes.
     * sgnUpdated: whenever the Diagram has been updated in any of its parts.
+
+    The Diagram keeps track of the area covered by its nodes and edges, and of how many of them lie
+    within each cell of a coarse grid (of CellSize units), so that content bounds and density can be
+    queried without visiting the items. The scene rectangle grows automatically to include items which
+    are moved beyond its border, and shrinks back (never below the size which has been explicitly set).
     """
+    CellSize = 500
+    FitInterval = 500
     GridSize = 10
     KeyMoveFactor = 10
     MinSize = 2000
     MaxSize = 1000000
+    MoveInterval = 16
+    SceneMargin = 200
     SelectionRadius = 4
 
     sgnItemAdded = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
@@ -86,17 +97,32 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         super().__init__(parent)
 
+        self.bounds = None # [LEFT, TOP, RIGHT, BOTTOM]
+        self.boundsValid = True
+        self.cells = dict() # {(COLUMN, ROW): int}
+        self.components = NeutralComponents()
         self.factory = ItemFactory(self)
+        self.itemBounds = dict() # {AbstractItem: QRectF}
+        self.layers = NodeLayers()
         self.guid = GUID(self)
         self.mode = DiagramMode.Idle
         self.modeParam = Item.Undefined
         self.name = name
         self.pasteX = Clipboard.PasteOffsetX
         self.pasteY = Clipboard.PasteOffsetY
+        self.sceneRectHint = QtCore.QRectF()
+        self.fitTimer = QtCore.QTimer(self)
+        self.fitTimer.setInterval(Diagram.FitInterval)
+        self.fitTimer.setSingleShot(True)
+        self.moveTimer = QtCore.QTimer(self)
+        self.moveTimer.setInterval(Diagram.MoveInterval)
+        self.moveTimer.setSingleShot(True)
 
         self.mo_Node = None
         self.mp_Data = None
+        self.mp_Delta = None
         self.mp_Edge = None
+        self.mp_Edges = None
         self.mp_Label = None
         self.mp_LabelPos = None
         self.mp_Node = None
@@ -106,6 +132,8 @@ class Diagram(QtWidgets.QGraphicsScene):
         connect(self.sgnItemAdded, self.onItemAdded)
         connect(self.sgnItemRemoved, self.onItemRemoved)
         connect(self.sgnNodeIdentification, self.doNodeIdentification)
+        connect(self.fitTimer.timeout, self.doFitSceneRect)
+        connect(self.moveTimer.timeout, self.doMove)
 
     #############################################
     #   FACTORY
@@ -375,21 +403,13 @@ class Diagram(QtWidgets.QGraphicsScene):
                         snapToGrid = self.session.action('toggle_grid').isChecked()
                         point = self.mp_NodePos + mousePos - self.mp_Pos
                         point = snap(point, Diagram.GridSize, snapToGrid)
-                        delta = point - self.mp_NodePos
-                        edges = set()
-
-                        for edge, breakpoints in self.mp_Data['edges'].items():
-                            for i in range(len(breakpoints)):
-                                edge.breakpoints[i] = breakpoints[i] + delta
-
-                        for node, data in self.mp_Data['nodes'].items():
-                            edges |= set(node.edges)
-                            node.setPos(data['pos'] + delta)
-                            for edge, pos in data['anchors'].items():
-                                node.setAnchor(edge, pos + delta)
+                        self.mp_Delta = point - self.mp_NodePos
 
-                        for edge in edges:
-                            edge.updateEdge()
+                        # Mouse events may be delivered way more often than the screen is refreshed:
+                        # the movement is applied right away only if no other movement has been
+                        # applied within the current frame, otherwise it's applied when it ends.
+                        if not self.moveTimer.isActive():
+                            self.doMove()
 
         super().mouseMoveEvent(mouseEvent)
 
@@ -465,6 +485,8 @@ class Diagram(QtWidgets.QGraphicsScene):
                 #################################
 
                 if self.isNodeMove():
+                    self.doMove()
+                    self.moveTimer.stop()
                     pos = self.mp_Node.pos()
                     if self.mp_NodePos != pos:
                         moveData = self.completeMove(self.mp_Data)
@@ -498,7 +520,9 @@ class Diagram(QtWidgets.QGraphicsScene):
 
         self.mo_Node = None
         self.mp_Data = None
+        self.mp_Delta = None
         self.mp_Edge = None
+        self.mp_Edges = None
         self.mp_Label = None
         self.mp_LabelPos = None
         self.mp_Node = None
@@ -509,6 +533,44 @@ class Diagram(QtWidgets.QGraphicsScene):
     #   SLOTS
     #################################
 
+    @QtCore.pyqtSlot()
+    def doFitSceneRect(self):
+        """
+        Fit the scene rectangle to the content of the diagram, unless the user is interacting with it.
+        """
+        if QtWidgets.QApplication.mouseButtons() != QtCore.Qt.NoButton:
+            self.fitTimer.start()
+        else:
+            self.fitSceneRect()
+
+    @QtCore.pyqtSlot()
+    def doMove(self):
+        """
+        Apply the pending movement to the nodes being moved, and update the geometry of the attached edges.
+        """
+        if self.isNodeMove() and self.mp_Delta is not None:
+
+            delta = self.mp_Delta
+            self.mp_Delta = None
+            if self.mp_Edges is None:
+                self.mp_Edges = set()
+                for node in self.mp_Data['nodes']:
+                    self.mp_Edges |= node.edges
+
+            for edge, breakpoints in self.mp_Data['edges'].items():
+                for i in range(len(breakpoints)):
+                    edge.breakpoints[i] = breakpoints[i] + delta
+
+            for node, data in self.mp_Data['nodes'].items():
+                node.setPos(data['pos'] + delta)
+                for edge, pos in data['anchors'].items():
+                    node.setAnchor(edge, pos + delta)
+
+            for edge in self.mp_Edges:
+                edge.updateEdge()
+
+            self.moveTimer.start()
+
     @QtCore.pyqtSlot('QGraphicsItem')
     def doNodeIdentification(self, node):
         """
@@ -518,14 +580,27 @@ class Diagram(QtWidgets.QGraphicsScene):
         if Identity.Neutral in node.identities():
 
             func = lambda x: Identity.Neutral in x.identities()
-            collection = bfs(source=node, filter_on_visit=func)
-            generators = partition(func, collection)
+            weak = self.components.find(node)
+            strong = set()
+            for member in weak:
+                for neighbour in member.adjacentNodes():
+                    if neighbour not in weak:
+                        if func(neighbour):
+                            # The component has been changed without notifying
+                            # the Diagram: recompute it and start over.
+                            self.components.stale.add(self.components.component[node])
+                            self.doNodeIdentification(node)
+                            return
+                        strong.add(neighbour)
+
+            weak = set(weak)
             excluded = set()
-            strong = set(generators[1])
-            weak = set(generators[0])
 
-            for node in weak:
-                identification = node.identify()
+            for member in weak | strong:
+                member.updateRevision()
+
+            for member in weak:
+                identification = member.identify()
                 if identification:
                     strong = set.union(strong, identification[0])
                     strong = set.difference(strong, identification[1])
@@ -538,8 +613,8 @@ class Diagram(QtWidgets.QGraphicsScene):
                 if len(identities) > 1:
                     computed = Identity.Unknown
 
-            for node in weak - strong - excluded:
-                node.setIdentity(computed)
+            for member in weak - strong - excluded:
+                member.setIdentity(computed)
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def onItemAdded(self, _, item):
@@ -549,6 +624,8 @@ class Diagram(QtWidgets.QGraphicsScene):
         :type item: AbstractItem
         """
         if item.isEdge():
+            self.components.addEdge(item)
+            self.updateComponentRevisions(item)
             # Execute the node identification procedure only if one of the
             # endpoints we are connecting is currently identified as NEUTRAL.
             if (item.source.identity() is Identity.Neutral) ^ (item.target.identity() is Identity.Neutral):
@@ -562,7 +639,11 @@ class Diagram(QtWidgets.QGraphicsScene):
         :type _: Diagram
         :type item: AbstractItem
         """
-        if item.isEdge():
+        if item.isNode():
+            self.components.removeNode(item)
+        elif item.isEdge():
+            self.components.removeEdge(item)
+            self.updateComponentRevisions(item)
             # When an edge is removed we may be in the case where
             # the ontology is split into 2 subgraphs, hence we need
             # to run the identification procedure on the 2 subgraphs.
@@ -579,9 +660,23 @@ class Diagram(QtWidgets.QGraphicsScene):
         :type item: AbstractItem
         """
         super().addItem(item)
+        if item.isNode() or item.isEdge():
+            self.itemBounds[item] = QtCore.QRectF()
+            self.updateBounds(item)
         if item.isNode():
+            self.layers.addNode(item)
             item.updateNode()
 
+    def cellRange(self, rect):
+        """
+        Returns the first and the last column and row of the grid cells overlapping the given rectangle.
+        :type rect: QtCore.QRectF
+        :rtype: tuple
+        """
+        size = Diagram.CellSize
+        return (math.floor(rect.left() / size), math.floor(rect.top() / size),
+                math.floor(rect.right() / size), math.floor(rect.bottom() / size))
+
     @staticmethod
     def completeMove(moveData, offset=QtCore.QPointF(0, 0)):
         """
@@ -599,6 +694,32 @@ class Diagram(QtWidgets.QGraphicsScene):
             'edges': {x: [p + offset for p in x.breakpoints[:]] for x in moveData['edges']}
         }
 
+    def contentRect(self):
+        """
+        Returns the rectangle enclosing all the nodes and edges of the Diagram.
+        The rectangle is kept up to date as items are added, moved, reshaped and removed: it's recomputed
+        (out of the bounding rectangles of the items, as last reported) only if an item lying on its border
+        has been shrunk, moved inwards or removed.
+        :rtype: QtCore.QRectF
+        """
+        if not self.boundsValid:
+            self.bounds = None
+            self.boundsValid = True
+            for rect in self.itemBounds.values():
+                self.resizeBounds(QtCore.QRectF(), rect)
+        if self.bounds:
+            return QtCore.QRectF(QtCore.QPointF(*self.bounds[:2]), QtCore.QPointF(*self.bounds[2:]))
+        return QtCore.QRectF()
+
+    def density(self, rect):
+        """
+        Returns the average amount of items per grid cell within the given rectangle.
+        :type rect: QtCore.QRectF
+        :rtype: float
+        """
+        x1, y1, x2, y2 = self.cellRange(rect)
+        return self.itemCount(rect) / ((x2 - x1 + 1) * (y2 - y1 + 1))
+
     def edge(self, eid):
         """
         Returns the edge matching the given id or None if no edge is found.
@@ -614,6 +735,35 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return self.project.edges(self)
 
+    def fitSceneRect(self):
+        """
+        Resize the scene rectangle so that it includes all the items of the diagram. The scene rectangle
+        is grown by multiples of MinSize (up to MaxSize) around the explicitly set one, which is restored
+        as soon as the items fit into it again.
+        """
+        self.fitTimer.stop()
+        rect = self.sceneRectHint
+        if not rect.isNull():
+            content = self.visibleRect(margin=Diagram.SceneMargin)
+            if content and not rect.contains(content):
+                size = 2 * max(abs(content.left()), abs(content.top()), abs(content.right()), abs(content.bottom()))
+                size = min(math.ceil(size / Diagram.MinSize) * Diagram.MinSize, Diagram.MaxSize)
+                rect = rect.united(QtCore.QRectF(-size / 2, -size / 2, size, size))
+            if rect != self.sceneRect():
+                super().setSceneRect(rect)
+
+    def identifyNodes(self, nodes):
+        """
+        Perform node identification for the given collection of nodes, running the
+        identification procedure only once for each component the nodes belong to.
+        :type nodes: T <= list|set|tuple
+        """
+        visited = set()
+        for node in nodes:
+            if node not in visited and Identity.Neutral in node.identities():
+                visited.update(self.components.find(node))
+                self.sgnNodeIdentification.emit(node)
+
     def isEdgeAdd(self):
         """
         Returns True if an edge insertion is currently in progress, False otherwise.
@@ -649,6 +799,17 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return len(self.project.items(self)) == 0
 
+    def itemCount(self, rect):
+        """
+        Returns the amount of nodes and edges whose center lies within the grid cells overlapping the given rectangle.
+        :type rect: QtCore.QRectF
+        :rtype: int
+        """
+        x1, y1, x2, y2 = self.cellRange(rect)
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > len(self.cells):
+            return sum(v for (x, y), v in self.cells.items() if x1 <= x <= x2 and y1 <= y <= y2)
+        return sum(self.cells.get((x, y), 0) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1))
+
     def items(self, mixed=None, mode=QtCore.Qt.IntersectsItemShape, **kwargs):
         """
         Returns a collection of items ordered from TOP to BOTTOM.
@@ -675,6 +836,26 @@ class Diagram(QtWidgets.QGraphicsScene):
                     x not in kwargs.get('skip', set())
         ], key=lambda i: i.zValue(), reverse=True)
 
+    def moveCell(self, old, new):
+        """
+        Update the grid cell counts after an item bounding rectangle changed from old to new (null if removed).
+        :type old: QtCore.QRectF
+        :type new: QtCore.QRectF
+        """
+        size = Diagram.CellSize
+        if not old.isNull():
+            center = old.center()
+            key = (math.floor(center.x() / size), math.floor(center.y() / size))
+            count = self.cells[key] - 1
+            if count:
+                self.cells[key] = count
+            else:
+                del self.cells[key]
+        if not new.isNull():
+            center = new.center()
+            key = (math.floor(center.x() / size), math.floor(center.y() / size))
+            self.cells[key] = self.cells.get(key, 0) + 1
+
     def nodes(self):
         """
         Returns a collection with all the nodes in the diagram.
@@ -690,6 +871,43 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return self.project.node(self, nid)
 
+    def removeItem(self, item):
+        """
+        Remove an item from the Diagram.
+        :type item: AbstractItem
+        """
+        rect = self.itemBounds.pop(item, None)
+        if rect is not None:
+            self.moveCell(rect, QtCore.QRectF())
+            self.resizeBounds(rect, QtCore.QRectF())
+            if self.sceneRect() != self.sceneRectHint:
+                self.fitTimer.start()
+        if item.isNode():
+            self.layers.removeNode(item)
+        super().removeItem(item)
+
+    def resizeBounds(self, old, new):
+        """
+        Update the content rectangle after an item bounding rectangle changed from old to new (null if removed).
+        :type old: QtCore.QRectF
+        :type new: QtCore.QRectF
+        """
+        if self.boundsValid:
+            b = self.bounds
+            empty = new.isNull()
+            if b and not old.isNull():
+                if old.left() <= b[0] and (empty or new.left() > b[0]) or \
+                    old.top() <= b[1] and (empty or new.top() > b[1]) or \
+                    old.right() >= b[2] and (empty or new.right() < b[2]) or \
+                    old.bottom() >= b[3] and (empty or new.bottom() < b[3]):
+                    self.boundsValid = False
+                    return
+            if not empty:
+                if b:
+                    self.bounds = [min(b[0], new.left()), min(b[1], new.top()), max(b[2], new.right()), max(b[3], new.bottom())]
+                else:
+                    self.bounds = [new.left(), new.top(), new.right(), new.bottom()]
+
     def selectedEdges(self, filter_on_edges=lambda x: True):
         """
         Returns the edges selected in the diagram.
@@ -726,6 +944,15 @@ class Diagram(QtWidgets.QGraphicsScene):
             self.modeParam = param
             self.sgnModeChanged.emit(mode)
 
+    def setSceneRect(self, rect):
+        """
+        Set the scene rectangle, enlarging it if needed to include all the items of the diagram.
+        :type rect: QtCore.QRectF
+        """
+        self.sceneRectHint = QtCore.QRectF(rect)
+        super().setSceneRect(rect)
+        self.fitSceneRect()
+
     @staticmethod
     def setupMove(selected):
         """
@@ -753,24 +980,216 @@ class Diagram(QtWidgets.QGraphicsScene):
                         moveData['edges'][edge] = edge.breakpoints[:]
         return moveData
 
+    def updateBounds(self, item):
+        """
+        Update the content rectangle after the geometry of the given item changed.
+        :type item: AbstractItem
+        """
+        rect = self.itemBounds.get(item)
+        if rect is not None:
+            bounds = item.mapRectToScene(item.boundingRect())
+            if bounds != rect:
+                self.itemBounds[item] = bounds
+                self.moveCell(rect, bounds)
+                self.resizeBounds(rect, bounds)
+                if not self.boundsValid:
+                    if self.sceneRect() != self.sceneRectHint:
+                        self.fitTimer.start()
+                elif not self.sceneRectHint.isNull() and not self.sceneRect().contains(bounds):
+                    self.fitSceneRect()
+
+    def updateComponentRevisions(self, edge):
+        """
+        Assign a new revision number to all the nodes of the NEUTRAL components the given edge is attached to.
+        Profile rules may look past the endpoints of the edge they validate, following chains of NEUTRAL nodes,
+        hence a connection change invalidates cached validation results of all the nodes of these components.
+        :type edge: AbstractEdge
+        """
+        for node in (edge.source, edge.target):
+            if Identity.Neutral in node.identities():
+                for member in self.components.find(node):
+                    member.updateRevision()
+
     def visibleRect(self, margin=0):
         """
         Returns a rectangle matching the area of visible items.
         :type margin: float
         :rtype: QtCore.QRectF
         """
-        items = self.items()
-        if items:
-            x = set()
-            y = set()
-            for item in items:
-                b = item.mapRectToScene(item.boundingRect())
-                x.update({b.left(), b.right()})
-                y.update({b.top(), b.bottom()})
-            return QtCore.QRectF(QtCore.QPointF(min(x) - margin, min(y) - margin), QtCore.QPointF(max(x) + margin, max(y) + margin))
+        self.contentRect()
+        if self.bounds:
+            l, t, r, b = self.bounds
+            return QtCore.QRectF(QtCore.QPointF(l - margin, t - margin), QtCore.QPointF(r + margin, b + margin))
         return QtCore.QRectF()
 
 
+class NeutralComponents(object):
+    """
+    Keeps track of the connected components of a Diagram which are made of nodes that can be identified as NEUTRAL.
+    Components are computed lazily (when the identity of one of their nodes is requested) and kept up to date as
+    items are added to and removed from the Diagram: connecting 2 components merges them (the smaller component is
+    folded into the larger one) while removing items marks the affected component as stale, so that it's split
+    by recomputing it (only when needed) out of the nodes it used to contain.
+    """
+    def __init__(self):
+        """
+        Initialize the components index.
+        """
+        self.component = dict() # {AbstractNode: int}
+        self.members = dict() # {int: set}
+        self.stale = set() # {int}
+        self.ticket = 0
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addEdge(self, edge):
+        """
+        Update the components index after the given edge has been added to the Diagram.
+        :type edge: AbstractEdge
+        """
+        source, target = edge.source, edge.target
+        if Identity.Neutral in source.identities() and Identity.Neutral in target.identities():
+            c1 = self.component.get(source)
+            c2 = self.component.get(target)
+            if c1 is not None and c2 is not None:
+                self.merge(c1, c2)
+            elif c1 is not None:
+                self.stale.add(c1)
+            elif c2 is not None:
+                self.stale.add(c2)
+
+    def build(self, node):
+        """
+        Compute the component of the given node out of the current Diagram structure.
+        :type node: AbstractNode
+        :rtype: set
+        """
+        func = lambda x: Identity.Neutral in x.identities()
+        members = set(filter(func, bfs(source=node, filter_on_visit=func)))
+        self.ticket += 1
+        for member in members:
+            previous = self.component.get(member)
+            if previous is not None:
+                self.members[previous].discard(member)
+                if not self.members[previous]:
+                    del self.members[previous]
+                    self.stale.discard(previous)
+            self.component[member] = self.ticket
+        self.members[self.ticket] = members
+        return members
+
+    def find(self, node):
+        """
+        Returns the set of nodes which belong to the same component of the given node.
+        :type node: AbstractNode
+        :rtype: set
+        """
+        cid = self.component.get(node)
+        if cid is None or cid in self.stale:
+            return self.build(node)
+        return self.members[cid]
+
+    def merge(self, c1, c2):
+        """
+        Merge the given components, folding the smaller one into the larger one.
+        :type c1: int
+        :type c2: int
+        """
+        if c1 != c2:
+            if len(self.members[c1]) < len(self.members[c2]):
+                c1, c2 = c2, c1
+            for member in self.members[c2]:
+                self.component[member] = c1
+            self.members[c1] |= self.members.pop(c2)
+            if c2 in self.stale:
+                self.stale.discard(c2)
+                self.stale.add(c1)
+
+    def removeEdge(self, edge):
+        """
+        Update the components index after the given edge has been removed from the Diagram.
+        :type edge: AbstractEdge
+        """
+        source, target = edge.source, edge.target
+        if Identity.Neutral in source.identities() and Identity.Neutral in target.identities():
+            for node in (source, target):
+                cid = self.component.get(node)
+                if cid is not None:
+                    self.stale.add(cid)
+
+    def removeNode(self, node):
+        """
+        Update the components index after the given node has been removed from the Diagram.
+        :type node: AbstractNode
+        """
+        cid = self.component.pop(node, None)
+        if cid is not None:
+            self.members[cid].discard(node)
+            self.stale.add(cid)
+
+
+class NodeLayers(object):
+    """
+    Keeps track of the depth of the nodes of a Diagram, so that edges can be stacked without collision queries.
+    An edge has to be drawn above the nodes it overlaps: placing it right above the topmost layer of nodes gives
+    the same result, regardless of the nodes it actually overlaps. Nodes are raised above (or lowered below) the
+    items they overlap only on explicit request, which is where collision queries are still performed.
+    """
+    def __init__(self):
+        """
+        Initialize the layers index.
+        """
+        self.count = dict() # {float: int}
+        self.depth = dict() # {AbstractNode: float}
+        self.top = None
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addNode(self, node):
+        """
+        Update the layers index after the given node has been added to the Diagram, or its depth has changed.
+        :type node: AbstractNode
+        """
+        self.removeNode(node)
+        zValue = node.zValue()
+        self.depth[node] = zValue
+        self.count[zValue] = self.count.get(zValue, 0) + 1
+        if self.top is None or zValue > self.top:
+            self.top = zValue
+
+    def edgeDepth(self, edge):
+        """
+        Returns the depth the given edge should be placed at.
+        :type edge: AbstractEdge
+        :rtype: float
+        """
+        zValue = edge.source.zValue()
+        if edge.target:
+            zValue = max(zValue, edge.target.zValue())
+        if self.top is not None:
+            zValue = max(zValue, self.top)
+        return zValue + 0.1
+
+    def removeNode(self, node):
+        """
+        Update the layers index after the given node has been removed from the Diagram.
+        :type node: AbstractNode
+        """
+        zValue = self.depth.pop(node, None)
+        if zValue is not None:
+            count = self.count[zValue] - 1
+            if count:
+                self.count[zValue] = count
+            else:
+                del self.count[zValue]
+                if zValue == self.top:
+                    self.top = max(self.count) if self.count else None
+
+
 class DiagramMalformedError(RuntimeError):
     """
     Raised whenever a given diagram is detected as malformed.
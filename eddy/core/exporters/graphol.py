@@ -34,20 +34,23 @@
 
 
 import os
+import weakref
 
-from PyQt5 import QtXml
+from PyQt5 import QtCore
 
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.system import File
 from eddy.core.exporters.common import AbstractProjectExporter
 from eddy.core.functions.misc import postfix
-from eddy.core.functions.fsystem import fwrite, mkdir
+from eddy.core.functions.fsystem import mkdir
+from eddy.core.loaders.common import StreamElement
 from eddy.core.output import getLogger
 from eddy.core.project import Project
 from eddy.core.project import K_DESCRIPTION, K_URL
 from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
 from eddy.core.project import K_ASYMMETRIC, K_IRREFLEXIVE, K_REFLEXIVE
 from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
+from eddy.core.worker import AbstractWorker
 
 
 LOGGER = getLogger()
@@ -61,7 +64,12 @@ class GrapholProjectExporter(AbstractProjectExporter):
     - projectname/
     -   projectname.graphol     # contains information on the ontology
     -   ...
+
+    Serialized diagrams and predicate metadata are cached across exports of the same project:
+    only the ones which have been modified since the previous export are serialized again.
     """
+    Cache = weakref.WeakKeyDictionary()
+
     def __init__(self, project, session=None):
         """
         Initialize the project exporter.
@@ -126,6 +134,18 @@ class GrapholProjectExporter(AbstractProjectExporter):
             Item.RoleNode: self.exportRoleMeta,
         }
 
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def cache(self):
+        """
+        Returns the serialization cache of the exported project.
+        :rtype: dict
+        """
+        return self.Cache[self.project]
+
     #############################################
     #   ONTOLOGY PREDICATES EXPORT
     #################################
@@ -135,16 +155,16 @@ class GrapholProjectExporter(AbstractProjectExporter):
         Export predicate metadata.
         :type item: Item
         :type name: str
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         meta = self.project.meta(item, name)
-        element = self.document.createElement('predicate')
+        element = StreamElement('predicate')
         element.setAttribute('type', self.itemToXml[item])
         element.setAttribute('name', name)
-        description = self.document.createElement(K_DESCRIPTION)
-        description.appendChild(self.document.createTextNode(meta.get(K_DESCRIPTION, '')))
-        url = self.document.createElement(K_URL)
-        url.appendChild(self.document.createTextNode(meta.get(K_URL, '')))
+        description = StreamElement(K_DESCRIPTION)
+        description.setText(meta.get(K_DESCRIPTION, ''))
+        url = StreamElement(K_URL)
+        url.setText(meta.get(K_URL, ''))
         element.appendChild(url)
         element.appendChild(description)
         return element
@@ -154,12 +174,12 @@ class GrapholProjectExporter(AbstractProjectExporter):
         Export attribute metadata.
         :type item: Item
         :type name: str
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         element = self.exportPredicateMeta(item, name)
         meta = self.project.meta(item, name)
-        functional = self.document.createElement(K_FUNCTIONAL)
-        functional.appendChild(self.document.createTextNode(str(int(meta.get(K_FUNCTIONAL, False)))))
+        functional = StreamElement(K_FUNCTIONAL)
+        functional.setText(str(int(meta.get(K_FUNCTIONAL, False))))
         element.appendChild(functional)
         return element
     
@@ -168,24 +188,24 @@ class GrapholProjectExporter(AbstractProjectExporter):
         Export role metadata.
         :type item: Item
         :type name: str
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         element = self.exportPredicateMeta(item, name)
         meta = self.project.meta(item, name)
-        functional = self.document.createElement(K_FUNCTIONAL)
-        functional.appendChild(self.document.createTextNode(str(int(meta.get(K_FUNCTIONAL, False)))))
-        inverseFunctional = self.document.createElement(K_INVERSE_FUNCTIONAL)
-        inverseFunctional.appendChild(self.document.createTextNode(str(int(meta.get(K_INVERSE_FUNCTIONAL, False)))))
-        asymmetric = self.document.createElement(K_ASYMMETRIC)
-        asymmetric.appendChild(self.document.createTextNode(str(int(meta.get(K_ASYMMETRIC, False)))))
-        irreflexive = self.document.createElement(K_IRREFLEXIVE)
-        irreflexive.appendChild(self.document.createTextNode(str(int(meta.get(K_IRREFLEXIVE, False)))))
-        reflexive = self.document.createElement(K_REFLEXIVE)
-        reflexive.appendChild(self.document.createTextNode(str(int(meta.get(K_REFLEXIVE, False)))))
-        symmetric = self.document.createElement(K_SYMMETRIC)
-        symmetric.appendChild(self.document.createTextNode(str(int(meta.get(K_SYMMETRIC, False)))))
-        transitive = self.document.createElement(K_TRANSITIVE)
-        transitive.appendChild(self.document.createTextNode(str(int(meta.get(K_TRANSITIVE, False)))))
+        functional = StreamElement(K_FUNCTIONAL)
+        functional.setText(str(int(meta.get(K_FUNCTIONAL, False))))
+        inverseFunctional = StreamElement(K_INVERSE_FUNCTIONAL)
+        inverseFunctional.setText(str(int(meta.get(K_INVERSE_FUNCTIONAL, False))))
+        asymmetric = StreamElement(K_ASYMMETRIC)
+        asymmetric.setText(str(int(meta.get(K_ASYMMETRIC, False))))
+        irreflexive = StreamElement(K_IRREFLEXIVE)
+        irreflexive.setText(str(int(meta.get(K_IRREFLEXIVE, False))))
+        reflexive = StreamElement(K_REFLEXIVE)
+        reflexive.setText(str(int(meta.get(K_REFLEXIVE, False))))
+        symmetric = StreamElement(K_SYMMETRIC)
+        symmetric.setText(str(int(meta.get(K_SYMMETRIC, False))))
+        transitive = StreamElement(K_TRANSITIVE)
+        transitive.setText(str(int(meta.get(K_TRANSITIVE, False))))
         element.appendChild(functional)
         element.appendChild(inverseFunctional)
         element.appendChild(asymmetric)
@@ -201,98 +221,98 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportAttributeNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: AttributeNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportComplementNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: ComplementNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportConceptNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: ConceptNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportDatatypeRestrictionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: DatatypeRestrictionNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportDisjointUnionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: DisjointUnionNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportGenericNode(node)
 
     def exportDomainRestrictionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: DomainRestrictionNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportEnumerationNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: EnumerationNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportFacetNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: FacetNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         position = node.mapToScene(node.textPos())
-        label = self.document.createElement('label')
+        label = StreamElement('label')
         label.setAttribute('height', node.labelA.height())
         label.setAttribute('width', node.labelA.width() + node.labelB.width())
         label.setAttribute('x', position.x())
         label.setAttribute('y', position.y())
-        label.appendChild(self.document.createTextNode(node.text()))
+        label.setText(node.text())
         element = self.exportGenericNode(node)
         element.appendChild(label)
         return element
 
     def exportIndividualNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: IndividualNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportIntersectionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: IntersectionNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportPropertyAssertionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: PropertyAssertionNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         element = self.exportGenericNode(node)
         element.setAttribute('inputs', ','.join(node.inputs))
@@ -300,25 +320,25 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportRangeRestrictionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: RangeRestrictionNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportRoleNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: RoleNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportRoleChainNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: RoleChainNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         element = self.exportLabelNode(node)
         element.setAttribute('inputs', ','.join(node.inputs))
@@ -326,25 +346,25 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportRoleInverseNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: RoleInverseNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportValueDomainNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: ValueDomainNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
     def exportUnionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: UnionNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportLabelNode(node)
 
@@ -354,33 +374,33 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportInclusionEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into a StreamElement.
         :type edge: InclusionEdge
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportGenericEdge(edge)
 
     def exportEquivalenceEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into a StreamElement.
         :type edge: EquivalenceEdge
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportGenericEdge(edge)
 
     def exportInputEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into a StreamElement.
         :type edge: InputEdge
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportGenericEdge(edge)
 
     def exportMembershipEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into a StreamElement.
         :type edge: MembershipEdge
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         return self.exportGenericEdge(edge)
 
@@ -390,35 +410,35 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportLabelNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: AbstractNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
         position = node.mapToScene(node.textPos())
-        label = self.document.createElement('label')
+        label = StreamElement('label')
         label.setAttribute('height', node.label.height())
         label.setAttribute('width', node.label.width())
         label.setAttribute('x', position.x())
         label.setAttribute('y', position.y())
-        label.appendChild(self.document.createTextNode(node.text()))
+        label.setText(node.text())
         element = self.exportGenericNode(node)
         element.appendChild(label)
         return element
 
     def exportGenericEdge(self, edge):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type edge: AbstractEdge
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
-        element = self.document.createElement('edge')
+        element = StreamElement('edge')
         element.setAttribute('source', edge.source.id)
         element.setAttribute('target', edge.target.id)
         element.setAttribute('id', edge.id)
         element.setAttribute('type', self.itemToXml[edge.type()])
 
         for p in [edge.source.anchor(edge)] + edge.breakpoints + [edge.target.anchor(edge)]:
-            point = self.document.createElement('point')
+            point = StreamElement('point')
             point.setAttribute('x', p.x())
             point.setAttribute('y', p.y())
             element.appendChild(point)
@@ -427,15 +447,15 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportGenericNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into a StreamElement.
         :type node: AbstractNode
-        :rtype: QDomElement
+        :rtype: StreamElement
         """
-        element = self.document.createElement('node')
+        element = StreamElement('node')
         element.setAttribute('id', node.id)
         element.setAttribute('type', self.itemToXml[node.type()])
         element.setAttribute('color', node.brush().color().name())
-        geometry = self.document.createElement('geometry')
+        geometry = StreamElement('geometry')
         geometry.setAttribute('height', node.height())
         geometry.setAttribute('width', node.width())
         geometry.setAttribute('x', node.pos().x())
@@ -449,80 +469,100 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def createDiagrams(self):
         """
-        Create the 'diagrams' element in the QDomDocument.
+        Create the 'diagrams' element in the document.
         """
-        section = self.document.createElement('diagrams')
+        cache = {}
+        section = StreamElement('diagrams')
         for diagram in self.project.diagrams():
-            subsection = self.document.createElement('diagram')
+            subsection = StreamElement('diagram')
             subsection.setAttribute('name', diagram.name)
             subsection.setAttribute('width', diagram.width())
             subsection.setAttribute('height', diagram.height())
-            for node in diagram.nodes():
-                func = self.exportFuncForItem[node.type()]
-                subsection.appendChild(func(node))
-            for edge in diagram.edges():
-                func = self.exportFuncForItem[edge.type()]
-                subsection.appendChild(func(edge))
+            if diagram in self.cache['diagrams'] and diagram not in self.project.dirtyDiagrams:
+                # Cached fragments are shared among documents, hence they must be
+                # reused as they are (appendChild would change their parent).
+                subsection.children = self.cache['diagrams'][diagram]
+            else:
+                for node in diagram.nodes():
+                    func = self.exportFuncForItem[node.type()]
+                    subsection.appendChild(func(node))
+                for edge in diagram.edges():
+                    func = self.exportFuncForItem[edge.type()]
+                    subsection.appendChild(func(edge))
+            cache[diagram] = subsection.children
             section.appendChild(subsection)
-        self.document.documentElement().appendChild(section)
+        self.cache['diagrams'] = cache
+        self.document.appendChild(section)
 
-    def createDomDocument(self):
+    def createDocument(self):
         """
-        Create the QDomDocument where to store project information.
+        Create the document where to store project information.
         """
-        self.document = QtXml.QDomDocument()
-        instruction = self.document.createProcessingInstruction('xml', 'version="1.0" encoding="UTF-8"')
-        self.document.appendChild(instruction)
-        graphol = self.document.createElement('graphol')
-        graphol.setAttribute('version', '2')
-        self.document.appendChild(graphol)
+        self.document = StreamElement('graphol')
+        self.document.setAttribute('version', '2')
+        if self.project not in self.Cache:
+            self.Cache[self.project] = {'diagrams': {}, 'metas': {}}
 
     def createOntology(self):
         """
-        Create the 'ontology' element in the QDomDocument.
-        """
-        iri = self.document.createElement('iri')
-        iri.appendChild(self.document.createTextNode(self.project.iri))
-        name = self.document.createElement('name')
-        name.appendChild(self.document.createTextNode(self.project.name))
-        prefix = self.document.createElement('prefix')
-        prefix.appendChild(self.document.createTextNode(self.project.prefix))
-        profile = self.document.createElement('profile')
-        profile.appendChild(self.document.createTextNode(self.project.profile.name()))
-        version = self.document.createElement('version')
-        version.appendChild(self.document.createTextNode(self.project.version))
-        section = self.document.createElement('ontology')
+        Create the 'ontology' element in the document.
+        """
+        iri = StreamElement('iri')
+        iri.setText(self.project.iri)
+        name = StreamElement('name')
+        name.setText(self.project.name)
+        prefix = StreamElement('prefix')
+        prefix.setText(self.project.prefix)
+        profile = StreamElement('profile')
+        profile.setText(self.project.profile.name())
+        version = StreamElement('version')
+        version.setText(self.project.version)
+        section = StreamElement('ontology')
         section.appendChild(name)
         section.appendChild(version)
         section.appendChild(prefix)
         section.appendChild(iri)
         section.appendChild(profile)
-        self.document.documentElement().appendChild(section)
+        self.document.appendChild(section)
 
     def createPredicatesMeta(self):
         """
-        Create the 'predicates' element in the QDomDocument.
+        Create the 'predicates' element in the document.
         """
-        section = self.document.createElement('predicates')
+        cache = {}
+        section = StreamElement('predicates')
         for item, predicate in self.project.metas():
-            func = self.exportMetaFuncForItem[item]
-            meta = func(item, predicate)
-            section.appendChild(meta)
-        self.document.documentElement().appendChild(section)
+            meta = self.cache['metas'].get((item, predicate))
+            if meta is None or (item, predicate) in self.project.dirtyMetas:
+                func = self.exportMetaFuncForItem[item]
+                meta = func(item, predicate)
+            cache[item, predicate] = meta
+            section.children.append(meta)
+        self.cache['metas'] = cache
+        self.document.appendChild(section)
 
     def createProjectFile(self):
         """
-        Serialize a previously created QDomDocument to disk.
+        Serialize a previously created document to disk.
         """
-        try:
-            mkdir(self.project.path)
-            filename = postfix(self.project.name, File.Graphol.extension)
-            filepath = os.path.join(self.project.path, filename)
-            fwrite(self.document.toString(2), filepath)
-        except Exception as e:
-            raise e
-        else:
-            LOGGER.info('Saved project %s to %s', self.project.name, self.project.path)
+        worker = GrapholProjectExporterWorker(self.document, self.project.path, self.project.name)
+        worker.save()
+
+    def createWorker(self):
+        """
+        Collect the project information and returns a worker which serializes it to disk.
+        The worker holds a detached copy of the project structure, hence it can be safely
+        executed in a separate thread while the project keeps being edited.
+        The project is marked as being saved: the caller is responsible for marking it
+        as clean (or dirty) once the worker completes (or fails).
+        :rtype: GrapholProjectExporterWorker
+        """
+        self.createDocument()
+        self.createOntology()
+        self.createPredicatesMeta()
+        self.createDiagrams()
+        self.project.setSaving()
+        return GrapholProjectExporterWorker(self.document, self.project.path, self.project.name)
 
     #############################################
     #   INTERFACE
@@ -540,8 +580,77 @@ class GrapholProjectExporter(AbstractProjectExporter):
         """
         Perform Project export to disk.
         """
-        self.createDomDocument()
+        self.createDocument()
         self.createOntology()
         self.createPredicatesMeta()
         self.createDiagrams()
-        self.createProjectFile()
\ No newline at end of file
+        self.project.setSaving()
+        try:
+            self.createProjectFile()
+        except Exception:
+            self.project.setDirty()
+            raise
+        else:
+            self.project.setClean()
+
+
+class GrapholProjectExporterWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker thread that will write a Graphol project document to disk.
+    The document is streamed to a staging file which atomically replaces the project file only
+    once it has been completely written, so that a failure never leaves a truncated project behind.
+    """
+    sgnCompleted = QtCore.pyqtSignal()
+    sgnErrored = QtCore.pyqtSignal(Exception)
+    sgnStarted = QtCore.pyqtSignal()
+
+    def __init__(self, document, path, name):
+        """
+        Initialize the Graphol project exporter worker.
+        :type document: StreamElement
+        :type path: str
+        :type name: str
+        """
+        super().__init__()
+        self.document = document
+        self.name = name
+        self.path = path
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def save(self):
+        """
+        Write the document to disk (raising an exception in case of failure).
+        """
+        mkdir(self.path)
+        filepath = os.path.join(self.path, postfix(self.name, File.Graphol.extension))
+        file = QtCore.QSaveFile(filepath)
+        if not file.open(QtCore.QIODevice.WriteOnly):
+            raise IOError('could not open {0} for writing: {1}'.format(filepath, file.errorString()))
+        writer = QtCore.QXmlStreamWriter(file)
+        writer.setAutoFormatting(True)
+        writer.setAutoFormattingIndent(2)
+        writer.writeStartDocument()
+        self.document.toStream(writer)
+        writer.writeEndDocument()
+        if writer.hasError() or not file.commit():
+            raise IOError('could not write {0}: {1}'.format(filepath, file.errorString()))
+        LOGGER.info('Saved project %s to %s', self.name, self.path)
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            self.sgnStarted.emit()
+            self.save()
+        except Exception as e:
+            LOGGER.exception('Failed to save project %s to %s', self.name, self.path)
+            self.sgnErrored.emit(e)
+        else:
+            self.sgnCompleted.emit()
+        finally:
+            self.finished.emit()
@@ -33,6 +33,7 @@
 ##########################################################################
 
 
+import io
 import os
 
 from jnius import autoclass, cast, detach
@@ -45,15 +46,16 @@ from eddy import APPNAME, BUG_TRACKER, ORGANIZATION
 from eddy.core.common import HasThreadingSystem, HasWidgetSystem
 from eddy.core.datatypes.qt import Font
 from eddy.core.datatypes.graphol import Item, Identity, Special, Restriction
-from eddy.core.datatypes.owl import Datatype, Facet, OWLAxiom, OWLSyntax
+from eddy.core.datatypes.owl import Datatype, Facet, OWLAxiom, OWLEngine, OWLSyntax
 from eddy.core.datatypes.system import File
 from eddy.core.diagram import DiagramMalformedError
+from eddy.core.exporters import owl2python
 from eddy.core.exporters.common import AbstractOntologyExporter
-from eddy.core.functions.fsystem import fwrite, fremove
+from eddy.core.functions.fsystem import fwrite, fremove, frename
 from eddy.core.functions.misc import first, clamp, isEmpty
 from eddy.core.functions.misc import rstrip, postfix, format_exception
 from eddy.core.functions.owl import OWLShortIRI, OWLAnnotationText
-from eddy.core.functions.owl import OWLFunctionalDocumentFilter
+from eddy.core.functions.owl import OWLFunctionalDocumentStreamFilter
 from eddy.core.functions.path import expandPath, openPath
 from eddy.core.functions.signals import connect
 from eddy.core.output import getLogger
@@ -79,7 +81,6 @@ class OWLOntologyExporter(AbstractOntologyExporter, HasThreadingSystem):
         :type session: Session
         """
         super().__init__(project, session)
-        self.items = list(project.edges()) + list(filter(lambda n: not n.adjacentNodes(), project.nodes()))
         self.path = None
         self.progress = None
 
@@ -135,7 +136,7 @@ class OWLOntologyExporter(AbstractOntologyExporter, HasThreadingSystem):
             self.path = path
             self.progress = BusyProgressDialog('Performing syntax check...')
             self.progress.show()
-            worker = SyntaxValidationWorker(0, self.items, self.project)
+            worker = SyntaxValidationWorker(self.project)
             connect(worker.sgnCompleted, self.onSyntaxCheckCompleted)
             connect(worker.sgnSyntaxError, self.onSyntaxCheckErrored)
             self.startThread('syntaxCheck', worker)
@@ -178,6 +179,27 @@ class OWLOntologyExporterDialog(QtWidgets.QDialog, HasThreadingSystem, HasWidget
         syntaxGroup = QtWidgets.QGroupBox('Syntax', self)
         syntaxGroup.setLayout(syntaxLayout)
 
+        ## ENGINE
+        field = ComboBox(self)
+        for engine in OWLEngine:
+            field.addItem(engine.value, engine)
+        field.setCurrentIndex(0)
+        field.setFont(Font('Roboto', 12))
+        field.setObjectName('engine_field')
+        field.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        connect(field.currentIndexChanged, self.onEngineChanged)
+        self.addWidget(field)
+
+        engineLayout = QtWidgets.QVBoxLayout()
+        engineLayout.addWidget(field)
+        engineGroup = QtWidgets.QGroupBox('Engine', self)
+        engineGroup.setLayout(engineLayout)
+
+        optionsLayout = QtWidgets.QHBoxLayout()
+        optionsLayout.setContentsMargins(0, 0, 0, 0)
+        optionsLayout.addWidget(syntaxGroup)
+        optionsLayout.addWidget(engineGroup)
+
         ## AXIOMS
         self.addWidget(QtWidgets.QPushButton('All', self,
             clicked=self.doCheckAxiomMarks,
@@ -305,7 +327,7 @@ class OWLOntologyExporterDialog(QtWidgets.QDialog, HasThreadingSystem, HasWidget
 
         mainLayout = QtWidgets.QVBoxLayout()
         mainLayout.setContentsMargins(10, 10, 10, 10)
-        mainLayout.addWidget(syntaxGroup)
+        mainLayout.addLayout(optionsLayout)
         mainLayout.addWidget(axiomsGroup)
         mainLayout.addWidget(spacer)
         mainLayout.addWidget(self.progressBar)
@@ -328,6 +350,13 @@ class OWLOntologyExporterDialog(QtWidgets.QDialog, HasThreadingSystem, HasWidget
         """
         return {axiom for axiom in OWLAxiom if self.widget(axiom.value).isChecked()}
 
+    def engine(self):
+        """
+        Returns the value of the OWL engine field.
+        :rtype: OWLEngine
+        """
+        return self.widget('engine_field').currentData()
+
     def normalize(self):
         """
         Returns whether the current ontolofy needs to be normalized, or not.
@@ -376,6 +405,16 @@ class OWLOntologyExporterDialog(QtWidgets.QDialog, HasThreadingSystem, HasWidget
             checkbox.setChecked(checked)
         self.widget('confirmation').setEnabled(checked)
 
+    @QtCore.pyqtSlot(int)
+    def onEngineChanged(self, _):
+        """
+        Executed when the OWL engine is changed: the Python engine only supports Functional-style syntax.
+        """
+        field = self.widget('syntax_field')
+        if self.engine() is OWLEngine.Python:
+            field.setCurrentIndex(field.findData(OWLSyntax.Functional))
+        field.setEnabled(self.engine() is not OWLEngine.Python)
+
     @QtCore.pyqtSlot(Exception)
     def onErrored(self, exception):
         """
@@ -439,6 +478,7 @@ class OWLOntologyExporterDialog(QtWidgets.QDialog, HasThreadingSystem, HasWidget
         Executed whenever the translation starts.
         """
         self.widget('confirmation').setEnabled(False)
+        self.widget('engine_field').setEnabled(False)
         self.widget('btn_clear_all').setEnabled(False)
         self.widget('btn_check_all').setEnabled(False)
         for axiom in OWLAxiom:
@@ -452,8 +492,8 @@ class OWLOntologyExporterDialog(QtWidgets.QDialog, HasThreadingSystem, HasWidget
         """
         LOGGER.info('Exporting project %s in OWL 2 format: %s', self.project.name, self.path)
         worker = OWLOntologyExporterWorker(self.project, self.path,
-           axioms=self.axioms(), normalize=self.normalize(),
-           syntax=self.syntax())
+           axioms=self.axioms(), engine=self.engine(),
+           normalize=self.normalize(), syntax=self.syntax())
         connect(worker.sgnStarted, self.onStarted)
         connect(worker.sgnCompleted, self.onCompleted)
         connect(worker.sgnErrored, self.onErrored)
@@ -478,33 +518,50 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         super().__init__()
 
-        self.DefaultPrefixManager = autoclass('org.semanticweb.owlapi.util.DefaultPrefixManager')
-        self.FunctionalSyntaxDocumentFormat = autoclass('org.semanticweb.owlapi.formats.FunctionalSyntaxDocumentFormat')
-        self.HashSet = autoclass('java.util.HashSet')
-        self.IRI = autoclass('org.semanticweb.owlapi.model.IRI')
-        self.LinkedList = autoclass('java.util.LinkedList')
-        self.List = autoclass('java.util.List')
-        self.ManchesterSyntaxDocumentFormat = autoclass('org.semanticweb.owlapi.formats.ManchesterSyntaxDocumentFormat')
-        self.OWLAnnotationValue = autoclass('org.semanticweb.owlapi.model.OWLAnnotationValue')
-        self.OWLFacet = autoclass('org.semanticweb.owlapi.vocab.OWLFacet')
-        self.OWL2Datatype = autoclass('org.semanticweb.owlapi.vocab.OWL2Datatype')
-        self.OWLManager = autoclass('org.semanticweb.owlapi.apibinding.OWLManager')
-        self.OWLOntologyID = autoclass('org.semanticweb.owlapi.model.OWLOntologyID')
-        self.OWLOntologyDocumentTarget = autoclass('org.semanticweb.owlapi.io.OWLOntologyDocumentTarget')
-        self.RDFXMLDocumentFormat = autoclass('org.semanticweb.owlapi.formats.RDFXMLDocumentFormat')
-        self.PrefixManager = autoclass('org.semanticweb.owlapi.model.PrefixManager')
-        self.Set = autoclass('java.util.Set')
-        self.StringDocumentTarget = autoclass('org.semanticweb.owlapi.io.StringDocumentTarget')
-        self.TurtleDocumentFormat = autoclass('org.semanticweb.owlapi.formats.TurtleDocumentFormat')
-
         self.path = path
         self.project = project
         self.axiomsList = kwargs.get('axioms', set())
+        self.engine = kwargs.get('engine', OWLEngine.OWLAPI)
         self.normalize = kwargs.get('normalize', False)
         self.syntax = kwargs.get('syntax', OWLSyntax.Functional)
 
+        if self.engine is OWLEngine.Python:
+            self.HashSet = owl2python.HashSet
+            self.IRI = owl2python.IRI
+            self.LinkedList = owl2python.LinkedList
+            self.List = owl2python.List
+            self.OWLAnnotationValue = owl2python.OWLAnnotationValue
+            self.OWLFacet = owl2python.OWLFacet
+            self.OWL2Datatype = owl2python.OWL2Datatype
+            self.Set = owl2python.Set
+            self.cast = owl2python.cast
+        else:
+            self.Arrays = autoclass('java.util.Arrays')
+            self.DefaultPrefixManager = autoclass('org.semanticweb.owlapi.util.DefaultPrefixManager')
+            self.File = autoclass('java.io.File')
+            self.FileDocumentTarget = autoclass('org.semanticweb.owlapi.io.FileDocumentTarget')
+            self.FunctionalSyntaxDocumentFormat = autoclass('org.semanticweb.owlapi.formats.FunctionalSyntaxDocumentFormat')
+            self.HashSet = autoclass('java.util.HashSet')
+            self.IRI = autoclass('org.semanticweb.owlapi.model.IRI')
+            self.LinkedList = autoclass('java.util.LinkedList')
+            self.List = autoclass('java.util.List')
+            self.ManchesterSyntaxDocumentFormat = autoclass('org.semanticweb.owlapi.formats.ManchesterSyntaxDocumentFormat')
+            self.OWLAnnotationValue = autoclass('org.semanticweb.owlapi.model.OWLAnnotationValue')
+            self.OWLFacet = autoclass('org.semanticweb.owlapi.vocab.OWLFacet')
+            self.OWL2Datatype = autoclass('org.semanticweb.owlapi.vocab.OWL2Datatype')
+            self.OWLManager = autoclass('org.semanticweb.owlapi.apibinding.OWLManager')
+            self.OWLOntologyID = autoclass('org.semanticweb.owlapi.model.OWLOntologyID')
+            self.OWLOntologyDocumentTarget = autoclass('org.semanticweb.owlapi.io.OWLOntologyDocumentTarget')
+            self.RDFXMLDocumentFormat = autoclass('org.semanticweb.owlapi.formats.RDFXMLDocumentFormat')
+            self.PrefixManager = autoclass('org.semanticweb.owlapi.model.PrefixManager')
+            self.Set = autoclass('java.util.Set')
+            self.TurtleDocumentFormat = autoclass('org.semanticweb.owlapi.formats.TurtleDocumentFormat')
+            self.cast = cast
+
         self._axioms = set()
         self._converted = dict()
+        self._convertedHits = 0
+        self._convertedMisses = 0
 
         self.df = None
         self.man = None
@@ -534,51 +591,58 @@ class OWLOntologyExporterWorker(AbstractWorker):
     def convert(self, node):
         """
         Build and returns the OWL 2 conversion of the given node.
+        Conversions are memoized by (diagram, node id), so that sub-expressions shared among
+        different nodes and axioms are converted only once during the whole export.
         :type node: AbstractNode
         :rtype: OWLObject
         """
-        if node.diagram.name not in self._converted:
-            self._converted[node.diagram.name] = dict()
-        if node not in self._converted[node.diagram.name]:
+        key = (node.diagram, node.id)
+        try:
+            expression = self._converted[key]
+        except KeyError:
+            self._convertedMisses += 1
             if node.type() is Item.ConceptNode:
-                self._converted[node.diagram.name][node.id] = self.getConcept(node)
+                expression = self.getConcept(node)
             elif node.type() is Item.AttributeNode:
-                self._converted[node.diagram.name][node.id] = self.getAttribute(node)
+                expression = self.getAttribute(node)
             elif node.type() is Item.RoleNode:
-                self._converted[node.diagram.name][node.id] = self.getRole(node)
+                expression = self.getRole(node)
             elif node.type() is Item.ValueDomainNode:
-                self._converted[node.diagram.name][node.id] = self.getValueDomain(node)
+                expression = self.getValueDomain(node)
             elif node.type() is Item.IndividualNode:
-                self._converted[node.diagram.name][node.id] = self.getIndividual(node)
+                expression = self.getIndividual(node)
             elif node.type() is Item.FacetNode:
-                self._converted[node.diagram.name][node.id] = self.getFacet(node)
+                expression = self.getFacet(node)
             elif node.type() is Item.RoleInverseNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleInverse(node)
+                expression = self.getRoleInverse(node)
             elif node.type() is Item.RoleChainNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleChain(node)
+                expression = self.getRoleChain(node)
             elif node.type() is Item.ComplementNode:
-                self._converted[node.diagram.name][node.id] = self.getComplement(node)
+                expression = self.getComplement(node)
             elif node.type() is Item.EnumerationNode:
-                self._converted[node.diagram.name][node.id] = self.getEnumeration(node)
+                expression = self.getEnumeration(node)
             elif node.type() is Item.IntersectionNode:
-                self._converted[node.diagram.name][node.id] = self.getIntersection(node)
+                expression = self.getIntersection(node)
             elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
-                self._converted[node.diagram.name][node.id] = self.getUnion(node)
+                expression = self.getUnion(node)
             elif node.type() is Item.DatatypeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDatatypeRestriction(node)
+                expression = self.getDatatypeRestriction(node)
             elif node.type() is Item.PropertyAssertionNode:
-                self._converted[node.diagram.name][node.id] = self.getPropertyAssertion(node)
+                expression = self.getPropertyAssertion(node)
             elif node.type() is Item.DomainRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDomainRestriction(node)
+                expression = self.getDomainRestriction(node)
             elif node.type() is Item.RangeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getRangeRestriction(node)
+                expression = self.getRangeRestriction(node)
             else:
                 raise ValueError('no conversion available for node %s' % node)
-        return self._converted[node.diagram.name][node.id]
+            self._converted[key] = expression
+        else:
+            self._convertedHits += 1
+        return expression
 
     def converted(self):
         """
-        Returns the dictionary of converted nodes.
+        Returns the dictionary of converted nodes, keyed by (diagram, node id).
         :rtype: dict
         """
         return self._converted
@@ -724,9 +788,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.identity() in {Identity.Attribute, Identity.Concept, Identity.ValueDomain, Identity.Role}
-        incoming = node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        incoming = node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2)
         if not incoming:
             raise DiagramMalformedError(node, 'missing operand(s)')
         if len(incoming) > 1:
@@ -762,7 +825,6 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: DatatypeRestrictionNode
         :rtype: OWLDatatypeRestriction
         """
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.type() is Item.ValueDomainNode
         f3 = lambda x: x.type() is Item.FacetNode
 
@@ -770,7 +832,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         # BUILD DATATYPE
         #################################
 
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
         if not operand:
             raise DiagramMalformedError(node, 'missing value domain node')
 
@@ -780,7 +842,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         # BUILD FACETS
         #################################
 
-        incoming = node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3)
+        incoming = node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f3)
         if not incoming:
             raise DiagramMalformedError(node, 'missing facet node(s)')
 
@@ -793,7 +855,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         # BUILD DATATYPE RESTRICTION
         #################################
 
-        return self.df.getOWLDatatypeRestriction(de, cast(self.Set, collection))
+        return self.df.getOWLDatatypeRestriction(de, self.cast(self.Set, collection))
 
     def getDomainRestriction(self, node):
         """
@@ -801,12 +863,11 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: DomainRestrictionNode
         :rtype: OWLClassExpression
         """
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.identity() in {Identity.Role, Identity.Attribute}
         f3 = lambda x: x.identity() is Identity.ValueDomain
         f4 = lambda x: x.identity() is Identity.Concept
 
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
         if not operand:
             raise DiagramMalformedError(node, 'missing operand(s)')
 
@@ -822,7 +883,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # BUILD FILLER
             #################################
 
-            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            filler = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f3))
             if not filler:
                 dre = self.df.getTopDatatype()
             else:
@@ -843,7 +904,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 if cardinalities.isEmpty():
                     raise DiagramMalformedError(node, 'missing cardinality')
                 if cardinalities.size() > 1:
-                    return self.df.getOWLDataIntersectionOf(cast(self.Set, cardinalities))
+                    return self.df.getOWLDataIntersectionOf(self.cast(self.Set, cardinalities))
                 return cardinalities.iterator().next()
             raise DiagramMalformedError(node, 'unsupported restriction (%s)' % node.restriction())
 
@@ -859,7 +920,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # BUILD FILLER
             #################################
 
-            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f4))
+            filler = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f4))
             if not filler:
                 ce = self.df.getOWLThing()
             else:
@@ -882,7 +943,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 if cardinalities.isEmpty():
                     raise DiagramMalformedError(node, 'missing cardinality')
                 if cardinalities.size() > 1:
-                    return self.df.getOWLObjectIntersectionOf(cast(self.Set, cardinalities))
+                    return self.df.getOWLObjectIntersectionOf(self.cast(self.Set, cardinalities))
                 return cardinalities.iterator().next()
             raise DiagramMalformedError(node, 'unsupported restriction (%s)' % node.restriction())
 
@@ -894,15 +955,14 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.type() is Item.IndividualNode
         individuals = self.HashSet()
-        for individual in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+        for individual in node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
             conversion = self.convert(individual)
             individuals.add(conversion)
         if individuals.isEmpty():
             raise DiagramMalformedError(node, 'missing operand(s)')
-        return self.df.getOWLObjectOneOf(cast(self.Set, individuals))
+        return self.df.getOWLObjectOneOf(self.cast(self.Set, individuals))
 
     def getFacet(self, node):
         """
@@ -938,16 +998,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
         collection = self.HashSet()
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.identity() is node.identity()
-        for operand in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+        for operand in node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
             conversion = self.convert(operand)
             collection.add(conversion)
         if collection.isEmpty():
             raise DiagramMalformedError(node, 'missing operand(s)')
         if node.identity() is Identity.Concept:
-            return self.df.getOWLObjectIntersectionOf(cast(self.Set, collection))
-        return self.df.getOWLDataIntersectionOf(cast(self.Set, collection))
+            return self.df.getOWLObjectIntersectionOf(self.cast(self.Set, collection))
+        return self.df.getOWLDataIntersectionOf(self.cast(self.Set, collection))
 
     def getPropertyAssertion(self, node):
         """
@@ -975,7 +1034,6 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: DomainRestrictionNode
         :rtype: T <= OWLClassExpression|OWLDataProperty
         """
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.identity() in {Identity.Role, Identity.Attribute}
         f3 = lambda x: x.identity() is Identity.Concept
 
@@ -987,7 +1045,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         # we'll see an AttributeError added in the application log which will
         # highlight an expression composition problem.
 
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
         if not operand:
             raise DiagramMalformedError(node, 'missing operand(s)')
 
@@ -1003,7 +1061,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # BUILD FILLER
             #################################
 
-            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            filler = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f3))
             if not filler:
                 ce = self.df.getOWLThing()
             else:
@@ -1026,7 +1084,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 if cardinalities.isEmpty():
                     raise DiagramMalformedError(node, 'missing cardinality')
                 if cardinalities.size() > 1:
-                    return self.df.getOWLObjectIntersectionOf(cast(self.Set, cardinalities))
+                    return self.df.getOWLObjectIntersectionOf(self.cast(self.Set, cardinalities))
                 return cardinalities.iterator().next()
             raise DiagramMalformedError(node, 'unsupported restriction (%s)' % node.restriction())
 
@@ -1058,7 +1116,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             collection.add(conversion)
         if collection.isEmpty():
             raise DiagramMalformedError(node, 'missing operand(s)')
-        return cast(self.List, collection)
+        return self.cast(self.List, collection)
 
     def getRoleInverse(self, node):
         """
@@ -1066,9 +1124,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: RoleInverseNode
         :rtype: OWLObjectPropertyExpression
         """
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.type() is Item.RoleNode
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
         if not operand:
             raise DiagramMalformedError(node, 'missing operand')
         return self.convert(operand).getInverseProperty()
@@ -1082,16 +1139,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
         collection = self.HashSet()
-        f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.identity() is node.identity()
-        for operand in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+        for operand in node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
             conversion = self.convert(operand)
             collection.add(conversion)
         if collection.isEmpty():
             raise DiagramMalformedError(node, 'missing operand(s)')
         if node.identity() is Identity.Concept:
-            return self.df.getOWLObjectUnionOf(cast(self.Set, collection))
-        return self.df.getOWLDataUnionOf(cast(self.Set, collection))
+            return self.df.getOWLObjectUnionOf(self.cast(self.Set, collection))
+        return self.df.getOWLDataUnionOf(self.cast(self.Set, collection))
 
     def getValueDomain(self, node):
         """
@@ -1115,7 +1171,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             if meta and not isEmpty(meta.get(K_DESCRIPTION, '')):
                 aproperty = self.df.getOWLAnnotationProperty(self.IRI.create("rdfs:comment"))
                 value = self.df.getOWLLiteral(OWLAnnotationText(meta.get(K_DESCRIPTION, '')))
-                value = cast(self.OWLAnnotationValue, value)
+                value = self.cast(self.OWLAnnotationValue, value)
                 annotation = self.df.getOWLAnnotation(aproperty, value)
                 conversion = self.convert(node)
                 self.addAxiom(self.df.getOWLAnnotationAssertionAxiom(conversion.getIRI(), annotation))
@@ -1171,7 +1227,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 for operand in node.incomingNodes(lambda x: x.type() is Item.InputEdge):
                     conversion = self.convert(operand)
                     collection.add(conversion)
-                self.addAxiom(self.df.getOWLDisjointClassesAxiom(cast(self.Set, collection)))
+                self.addAxiom(self.df.getOWLDisjointClassesAxiom(self.cast(self.Set, collection)))
             elif node.type() is Item.ComplementNode:
                 operand = first(node.incomingNodes(lambda x: x.type() is Item.InputEdge))
                 conversionA = self.convert(operand)
@@ -1180,7 +1236,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                     collection = self.HashSet()
                     collection.add(conversionA)
                     collection.add(conversionB)
-                    self.addAxiom(self.df.getOWLDisjointClassesAxiom(cast(self.Set, collection)))
+                    self.addAxiom(self.df.getOWLDisjointClassesAxiom(self.cast(self.Set, collection)))
 
     def createDisjointDataPropertiesAxiom(self, edge):
         """
@@ -1193,7 +1249,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             collection = self.HashSet()
             collection.add(conversionA)
             collection.add(conversionB)
-            self.addAxiom(self.df.getOWLDisjointDataPropertiesAxiom(cast(self.Set, collection)))
+            self.addAxiom(self.df.getOWLDisjointDataPropertiesAxiom(self.cast(self.Set, collection)))
 
     def createDisjointObjectPropertiesAxiom(self, edge):
         """
@@ -1206,7 +1262,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             collection = self.HashSet()
             collection.add(conversionA)
             collection.add(conversionB)
-            self.addAxiom(self.df.getOWLDisjointObjectPropertiesAxiom(cast(self.Set, collection)))
+            self.addAxiom(self.df.getOWLDisjointObjectPropertiesAxiom(self.cast(self.Set, collection)))
 
     def createEquivalentClassesAxiom(self, edge):
         """
@@ -1226,17 +1282,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
                             continue
                     if source.type() in {Item.DisjointUnionNode, Item.UnionNode}:
                         # (A OR B) ISA C needs to be normalized to (A ISA C) && (B ISA C)
-                        f1 = lambda x: x.type() is Item.InputEdge
                         f2 = lambda x: x.identity() is Identity.Concept
-                        for operand in source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        for operand in source.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
                             conversionA = self.convert(operand)
                             conversionB = self.convert(target)
                             self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
                     elif edge.target.type() is Item.IntersectionNode:
                         # A ISA (B AND C) needs to be normalized to A ISA B && A ISA C
-                        f1 = lambda x: x.type() is Item.InputEdge
                         f2 = lambda x: x.identity() is Identity.Concept
-                        for operand in target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        for operand in target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
                             conversionA = self.convert(source)
                             conversionB = self.convert(operand)
                             self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
@@ -1250,7 +1304,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 collection = self.HashSet()
                 collection.add(conversionA)
                 collection.add(conversionB)
-                self.addAxiom(self.df.getOWLEquivalentClassesAxiom(cast(self.Set, collection)))
+                self.addAxiom(self.df.getOWLEquivalentClassesAxiom(self.cast(self.Set, collection)))
 
     def createEquivalentDataPropertiesAxiom(self, edge):
         """
@@ -1269,7 +1323,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 collection = self.HashSet()
                 collection.add(conversionA)
                 collection.add(conversionB)
-                self.addAxiom(self.df.getOWLEquivalentDataPropertiesAxiom(cast(self.Set, collection)))
+                self.addAxiom(self.df.getOWLEquivalentDataPropertiesAxiom(self.cast(self.Set, collection)))
 
     def createEquivalentObjectPropertiesAxiom(self, edge):
         """
@@ -1288,7 +1342,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 collection = self.HashSet()
                 collection.add(conversionA)
                 collection.add(conversionB)
-                self.addAxiom(self.df.getOWLEquivalentObjectPropertiesAxiom(cast(self.Set, collection)))
+                self.addAxiom(self.df.getOWLEquivalentObjectPropertiesAxiom(self.cast(self.Set, collection)))
 
     def createInverseObjectPropertiesAxiom(self, edge):
         """
@@ -1296,14 +1350,13 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: InclusionEdge
         """
         if OWLAxiom.InverseObjectProperties in self.axiomsList:
-            f1 = lambda x: x.type() is Item.InputEdge
             f2 = lambda x: x.type() is Item.RoleNode
             if edge.source.type() is Item.RoleInverseNode:
                 forward = edge.target
-                inverse = first(edge.source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                inverse = first(edge.source.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
             else:
                 forward = edge.source
-                inverse = first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                inverse = first(edge.target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
             conversionA = self.convert(forward)
             conversionB = self.convert(inverse)
             self.addAxiom(self.df.getOWLInverseObjectPropertiesAxiom(conversionA, conversionB))
@@ -1314,9 +1367,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: MembershipEdge
         """
         if OWLAxiom.NegativeDataPropertyAssertion in self.axiomsList:
-            f1 = lambda x: x.type() is Item.InputEdge
             f2 = lambda x: x.identity() is Identity.Attribute
-            conversionA = self.convert(first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)))
+            conversionA = self.convert(first(edge.target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2)))
             conversionB = self.convert(edge.source)[0]
             conversionC = self.convert(edge.source)[1]
             self.addAxiom(self.df.getOWLNegativeDataPropertyAssertionAxiom(conversionA, conversionB, conversionC))
@@ -1327,9 +1379,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: MembershipEdge
         """
         if OWLAxiom.NegativeObjectPropertyAssertion in self.axiomsList:
-            f1 = lambda x: x.type() is Item.InputEdge
             f2 = lambda x: x.identity() is Identity.Role
-            conversionA = self.convert(first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)))
+            conversionA = self.convert(first(edge.target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2)))
             conversionB = self.convert(edge.source)[0]
             conversionC = self.convert(edge.source)[1]
             self.addAxiom(self.df.getOWLNegativeObjectPropertyAssertionAxiom(conversionA, conversionB, conversionC))
@@ -1386,27 +1437,25 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if OWLAxiom.ObjectPropertyDomain in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
                 f2 = lambda x: x.identity() is Identity.Role
-                role = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                role = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
                 if role:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
                     f5 = lambda x: x.identity() is Identity.Concept
-                    for concept in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    outgoing = node.outgoingNodes(filter_on_types={Item.InclusionEdge}, filter_on_nodes=f5)
+                    adjacent = node.adjacentNodes(filter_on_types={Item.EquivalenceEdge}, filter_on_nodes=f5)
+                    for concept in outgoing | adjacent:
                         conversionA = self.convert(role)
                         conversionB = self.convert(concept)
                         self.addAxiom(self.df.getOWLObjectPropertyDomainAxiom(conversionA, conversionB))
         if OWLAxiom.DataPropertyDomain in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
                 f2 = lambda x: x.identity() is Identity.Attribute
-                attribute = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                attribute = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
                 if attribute:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
                     f5 = lambda x: x.identity() is Identity.Concept
-                    for concept in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    outgoing = node.outgoingNodes(filter_on_types={Item.InclusionEdge}, filter_on_nodes=f5)
+                    adjacent = node.adjacentNodes(filter_on_types={Item.EquivalenceEdge}, filter_on_nodes=f5)
+                    for concept in outgoing | adjacent:
                         conversionA = self.convert(attribute)
                         conversionB = self.convert(concept)
                         self.addAxiom(self.df.getOWLDataPropertyDomainAxiom(conversionA, conversionB))
@@ -1418,27 +1467,25 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if OWLAxiom.ObjectPropertyRange in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
                 f2 = lambda x: x.identity() is Identity.Role
-                role = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                role = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
                 if role:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
                     f5 = lambda x: x.identity() is Identity.Concept
-                    for concept in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    outgoing = node.outgoingNodes(filter_on_types={Item.InclusionEdge}, filter_on_nodes=f5)
+                    adjacent = node.adjacentNodes(filter_on_types={Item.EquivalenceEdge}, filter_on_nodes=f5)
+                    for concept in outgoing | adjacent:
                         conversionA = self.convert(role)
                         conversionB = self.convert(concept)
                         self.addAxiom(self.df.getOWLObjectPropertyRangeAxiom(conversionA, conversionB))
         if OWLAxiom.DataPropertyRange in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
                 f2 = lambda x: x.identity() is Identity.Attribute
-                attribute = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                attribute = first(node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
                 if attribute:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
                     f5 = lambda x: x.identity() is Identity.ValueDomain
-                    for datatype in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    outgoing = node.outgoingNodes(filter_on_types={Item.InclusionEdge}, filter_on_nodes=f5)
+                    adjacent = node.adjacentNodes(filter_on_types={Item.EquivalenceEdge}, filter_on_nodes=f5)
+                    for datatype in outgoing | adjacent:
                         conversionA = self.convert(attribute)
                         conversionB = self.convert(datatype)
                         self.addAxiom(self.df.getOWLDataPropertyRangeAxiom(conversionA, conversionB))
@@ -1468,17 +1515,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
 
             if edge.source.type() in {Item.DisjointUnionNode, Item.UnionNode} and self.normalize:
                 # (A OR B) ISA C needs to be normalized to (A ISA C) && (B ISA C)
-                f1 = lambda x: x.type() is Item.InputEdge
                 f2 = lambda x: x.identity() is Identity.Concept
-                for operand in edge.source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                for operand in edge.source.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
                     conversionA = self.convert(operand)
                     conversionB = self.convert(edge.target)
                     self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
             elif edge.target.type() is Item.IntersectionNode and self.normalize:
                 # A ISA (B AND C) needs to be normalized to A ISA B && A ISA C
-                f1 = lambda x: x.type() is Item.InputEdge
                 f2 = lambda x: x.identity() is Identity.Concept
-                for operand in edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                for operand in edge.target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
                     conversionA = self.convert(edge.source)
                     conversionB = self.convert(operand)
                     self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
@@ -1536,14 +1581,19 @@ class OWLOntologyExporterWorker(AbstractWorker):
 
             ontologyIRI = rstrip(self.project.iri, '#')
             versionIRI = '{0}/{1}'.format(ontologyIRI, self.project.version)
-            ontologyID = self.OWLOntologyID(self.IRI.create(ontologyIRI), self.IRI.create(versionIRI))
-            self.man = self.OWLManager.createOWLOntologyManager()
-            self.df = self.man.getOWLDataFactory()
-            self.ontology = self.man.createOntology(ontologyID)
-            self.pm = self.DefaultPrefixManager()
-            self.pm.setPrefix(self.project.prefix, postfix(ontologyIRI, '#'))
-
-            cast(self.PrefixManager, self.pm)
+            if self.engine is OWLEngine.Python:
+                self.df = owl2python.OWLDataFactory()
+                self.ontology = owl2python.OWLOntology(ontologyIRI, versionIRI)
+                self.pm = owl2python.OWLPrefixManager()
+                self.pm.setPrefix(self.project.prefix, postfix(ontologyIRI, '#'))
+            else:
+                ontologyID = self.OWLOntologyID(self.IRI.create(ontologyIRI), self.IRI.create(versionIRI))
+                self.man = self.OWLManager.createOWLOntologyManager()
+                self.df = self.man.getOWLDataFactory()
+                self.ontology = self.man.createOntology(ontologyID)
+                self.pm = self.DefaultPrefixManager()
+                self.pm.setPrefix(self.project.prefix, postfix(ontologyIRI, '#'))
+                self.cast(self.PrefixManager, self.pm)
 
             LOGGER.debug('Initialized OWL 2 Ontology: %s', ontologyIRI)
 
@@ -1672,6 +1722,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from edges (axioms = %s)', len(self.axioms()))
+            LOGGER.debug('OWL 2 conversion cache: %s hits, %s misses', self._convertedHits, self._convertedMisses)
 
             #############################################
             # APPLY GENERATED AXIOMS
@@ -1679,44 +1730,65 @@ class OWLOntologyExporterWorker(AbstractWorker):
 
             LOGGER.debug('Applying OWL 2 axioms on the OWL 2 Ontology')
 
-            for axiom in self.axioms():
-                self.man.addAxiom(self.ontology, axiom)
+            if self.engine is OWLEngine.Python:
+                self.ontology.addAxioms(self.axioms())
+            else:
+                # Axioms are moved into a single Java set (and applied) with one call
+                # each, rather than crossing the Python/Java bridge once per axiom.
+                axioms = self.HashSet(self.Arrays.asList(*self.axioms()))
+                self.man.addAxioms(self.ontology, self.cast(self.Set, axioms))
 
             #############################################
             # SERIALIZE THE ONTOLOGY
             #################################
 
-            if self.syntax is OWLSyntax.Functional:
-                DocumentFormat = self.FunctionalSyntaxDocumentFormat
-                DocumentFilter = OWLFunctionalDocumentFilter
-            elif self.syntax is OWLSyntax.Manchester:
-                DocumentFormat = self.ManchesterSyntaxDocumentFormat
-                DocumentFilter = lambda x: x
-            elif self.syntax is OWLSyntax.RDF:
-                DocumentFormat = self.RDFXMLDocumentFormat
-                DocumentFilter = lambda x: x
-            elif self.syntax is OWLSyntax.Turtle:
-                DocumentFormat = self.TurtleDocumentFormat
-                DocumentFilter = lambda x: x
+            if self.engine is OWLEngine.Python:
+                if self.syntax is not OWLSyntax.Functional:
+                    raise TypeError('unsupported syntax (%s) for engine %s' % (self.syntax, self.engine))
+                LOGGER.debug('Serializing the OWL 2 Ontology in %s', self.syntax.value)
+                renderer = owl2python.OWLFunctionalSyntaxRenderer(self.pm)
+                fwrite(OWLFunctionalDocumentStreamFilter(renderer.renderOntology(self.ontology)), self.path)
             else:
-                raise TypeError('unsupported syntax (%s)' % self.syntax)
-
-            LOGGER.debug('Serializing the OWL 2 Ontology in %s', self.syntax.value)
-
-            # COPY PREFIXES
-            ontoFormat = DocumentFormat()
-            ontoFormat.copyPrefixesFrom(self.pm)
-            # CREARE TARGET STREAM
-            stream = self.StringDocumentTarget()
-            stream = cast(self.OWLOntologyDocumentTarget, stream)
-            # SAVE THE ONTOLOGY TO DISK
-            self.man.setOntologyFormat(self.ontology, ontoFormat)
-            self.man.saveOntology(self.ontology, stream)
-            stream = cast(self.StringDocumentTarget, stream)
-            string = DocumentFilter(stream.toString())
-            fwrite(string, self.path)
-            # REMOVE RANDOM FILES GENERATED BY OWL API
-            fremove(os.path.join(os.path.dirname(self.path), 'catalog-v001.xml'))
+                if self.syntax is OWLSyntax.Functional:
+                    DocumentFormat = self.FunctionalSyntaxDocumentFormat
+                    DocumentFilter = OWLFunctionalDocumentStreamFilter
+                elif self.syntax is OWLSyntax.Manchester:
+                    DocumentFormat = self.ManchesterSyntaxDocumentFormat
+                    DocumentFilter = None
+                elif self.syntax is OWLSyntax.RDF:
+                    DocumentFormat = self.RDFXMLDocumentFormat
+                    DocumentFilter = None
+                elif self.syntax is OWLSyntax.Turtle:
+                    DocumentFormat = self.TurtleDocumentFormat
+                    DocumentFilter = None
+                else:
+                    raise TypeError('unsupported syntax (%s)' % self.syntax)
+
+                LOGGER.debug('Serializing the OWL 2 Ontology in %s', self.syntax.value)
+
+                # COPY PREFIXES
+                ontoFormat = DocumentFormat()
+                ontoFormat.copyPrefixesFrom(self.pm)
+                # CREATE TARGET STREAM: THE ONTOLOGY IS WRITTEN ON A STAGING FILE
+                path = expandPath(self.path)
+                stage = os.path.join(os.path.dirname(path), '.{0}.owlapi'.format(os.path.basename(path)))
+                stream = self.FileDocumentTarget(self.File(stage))
+                stream = self.cast(self.OWLOntologyDocumentTarget, stream)
+                # SAVE THE ONTOLOGY TO DISK
+                try:
+                    self.man.setOntologyFormat(self.ontology, ontoFormat)
+                    self.man.saveOntology(self.ontology, stream)
+                    if DocumentFilter:
+                        with io.open(stage, 'r', encoding='utf8') as ptr:
+                            fwrite(DocumentFilter(ptr), path)
+                    else:
+                        fremove(path)
+                        frename(stage, path)
+                finally:
+                    # NEVER LEAVE THE STAGING FILE BEHIND, EVEN IF SERIALIZATION FAILED
+                    fremove(stage)
+                # REMOVE RANDOM FILES GENERATED BY OWL API
+                fremove(os.path.join(os.path.dirname(path), 'catalog-v001.xml'))
 
         except DiagramMalformedError as e:
             LOGGER.warning('Malformed expression detected on {0}: {1} ... aborting!'.format(e.item, e))
@@ -0,0 +1,1087 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Pure-Python OWL 2 engine for the OWL 2 exporter.
+
+This module mimics the subset of the OWL API (data factory, prefix manager, java collections)
+used by OWLOntologyExporterWorker to build OWL 2 expressions and axioms, so that the same
+conversion code can run without crossing the Python/Java bridge, and renders the resulting
+ontology in OWL 2 Functional Syntax.
+"""
+
+
+from eddy.core.datatypes.common import Enum_
+
+
+K_OWL = 'http://www.w3.org/2002/07/owl#'
+K_RDF = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+K_RDFS = 'http://www.w3.org/2000/01/rdf-schema#'
+K_XML = 'http://www.w3.org/XML/1998/namespace'
+K_XSD = 'http://www.w3.org/2001/XMLSchema#'
+
+
+def cast(_, obj):
+    """
+    Mimics jnius.cast: Python objects need no casting hence the given object is returned as it is.
+    :type obj: T
+    :rtype: T
+    """
+    return obj
+
+
+#############################################
+#   COLLECTIONS
+#################################
+
+
+class HashSet(set):
+    """
+    Extends the builtin set exposing the subset of the java.util.HashSet interface used by the exporter.
+    """
+    def isEmpty(self):
+        """
+        Returns True if the set contains no element, False otherwise.
+        :rtype: bool
+        """
+        return not self
+
+    def iterator(self):
+        """
+        Returns an iterator over the elements of the set.
+        :rtype: Iterator
+        """
+        return Iterator(self)
+
+    def size(self):
+        """
+        Returns the number of elements in the set.
+        :rtype: int
+        """
+        return len(self)
+
+
+class Iterator(object):
+    """
+    Wraps a Python iterator exposing the java.util.Iterator interface.
+    """
+    def __init__(self, iterable):
+        """
+        Initialize the iterator.
+        :type iterable: T <= list|set|tuple
+        """
+        self.iterator = iter(iterable)
+
+    def next(self):
+        """
+        Returns the next element of the iteration.
+        :rtype: OWLObject
+        """
+        return next(self.iterator)
+
+
+class LinkedList(list):
+    """
+    Extends the builtin list exposing the subset of the java.util.LinkedList interface used by the exporter.
+    """
+    def add(self, item):
+        """
+        Append the given item to the list.
+        :type item: OWLObject
+        """
+        self.append(item)
+
+    def isEmpty(self):
+        """
+        Returns True if the list contains no element, False otherwise.
+        :rtype: bool
+        """
+        return not self
+
+    def size(self):
+        """
+        Returns the number of elements in the list.
+        :rtype: int
+        """
+        return len(self)
+
+
+# Interfaces used by the exporter only as cast targets.
+List = LinkedList
+OWLAnnotationValue = None
+Set = HashSet
+
+
+#############################################
+#   IRIS AND VOCABULARY
+#################################
+
+
+class IRI(str):
+    """
+    Extends the builtin str to represent an IRI.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, value):
+        """
+        Create an IRI out of the given string.
+        :type value: str
+        :rtype: IRI
+        """
+        return cls(value)
+
+    def toString(self):
+        """
+        Returns the string representation of this IRI.
+        :rtype: str
+        """
+        return str(self)
+
+
+class OWL2Datatype(Enum_):
+    """
+    Extends Enum providing the OWL 2 datatypes map (mimics org.semanticweb.owlapi.vocab.OWL2Datatype).
+    """
+    OWL_RATIONAL = K_OWL + 'rational'
+    OWL_REAL = K_OWL + 'real'
+    RDF_PLAIN_LITERAL = K_RDF + 'PlainLiteral'
+    RDF_XML_LITERAL = K_RDF + 'XMLLiteral'
+    RDFS_LITERAL = K_RDFS + 'Literal'
+    XSD_ANY_URI = K_XSD + 'anyURI'
+    XSD_BASE_64_BINARY = K_XSD + 'base64Binary'
+    XSD_BOOLEAN = K_XSD + 'boolean'
+    XSD_BYTE = K_XSD + 'byte'
+    XSD_DATE_TIME = K_XSD + 'dateTime'
+    XSD_DATE_TIME_STAMP = K_XSD + 'dateTimeStamp'
+    XSD_DECIMAL = K_XSD + 'decimal'
+    XSD_DOUBLE = K_XSD + 'double'
+    XSD_FLOAT = K_XSD + 'float'
+    XSD_HEX_BINARY = K_XSD + 'hexBinary'
+    XSD_INT = K_XSD + 'int'
+    XSD_INTEGER = K_XSD + 'integer'
+    XSD_LANGUAGE = K_XSD + 'language'
+    XSD_LONG = K_XSD + 'long'
+    XSD_NAME = K_XSD + 'Name'
+    XSD_NCNAME = K_XSD + 'NCName'
+    XSD_NEGATIVE_INTEGER = K_XSD + 'negativeInteger'
+    XSD_NMTOKEN = K_XSD + 'NMTOKEN'
+    XSD_NON_NEGATIVE_INTEGER = K_XSD + 'nonNegativeInteger'
+    XSD_NON_POSITIVE_INTEGER = K_XSD + 'nonPositiveInteger'
+    XSD_NORMALIZED_STRING = K_XSD + 'normalizedString'
+    XSD_POSITIVE_INTEGER = K_XSD + 'positiveInteger'
+    XSD_SHORT = K_XSD + 'short'
+    XSD_STRING = K_XSD + 'string'
+    XSD_TOKEN = K_XSD + 'token'
+    XSD_UNSIGNED_BYTE = K_XSD + 'unsignedByte'
+    XSD_UNSIGNED_INT = K_XSD + 'unsignedInt'
+    XSD_UNSIGNED_LONG = K_XSD + 'unsignedLong'
+    XSD_UNSIGNED_SHORT = K_XSD + 'unsignedShort'
+
+    @classmethod
+    def valueOf(cls, name):
+        """
+        Returns the datatype matching the given name.
+        :type name: str
+        :rtype: OWL2Datatype
+        """
+        return cls[name]
+
+    def getIRI(self):
+        """
+        Returns the IRI of this datatype.
+        :rtype: IRI
+        """
+        return IRI(self.value)
+
+
+class OWLFacet(Enum_):
+    """
+    Extends Enum providing the OWL 2 facets map (mimics org.semanticweb.owlapi.vocab.OWLFacet).
+    """
+    LANG_RANGE = K_RDF + 'langRange'
+    LENGTH = K_XSD + 'length'
+    MAX_EXCLUSIVE = K_XSD + 'maxExclusive'
+    MAX_INCLUSIVE = K_XSD + 'maxInclusive'
+    MAX_LENGTH = K_XSD + 'maxLength'
+    MIN_EXCLUSIVE = K_XSD + 'minExclusive'
+    MIN_INCLUSIVE = K_XSD + 'minInclusive'
+    MIN_LENGTH = K_XSD + 'minLength'
+    PATTERN = K_XSD + 'pattern'
+
+    @classmethod
+    def valueOf(cls, name):
+        """
+        Returns the facet matching the given name.
+        :type name: str
+        :rtype: OWLFacet
+        """
+        return cls[name]
+
+    def getIRI(self):
+        """
+        Returns the IRI of this facet.
+        :rtype: IRI
+        """
+        return IRI(self.value)
+
+
+BuiltIn = frozenset({
+    K_OWL + 'Thing', K_OWL + 'Nothing',
+    K_OWL + 'topObjectProperty', K_OWL + 'bottomObjectProperty',
+    K_OWL + 'topDataProperty', K_OWL + 'bottomDataProperty',
+    K_OWL + 'backwardCompatibleWith', K_OWL + 'deprecated', K_OWL + 'incompatibleWith',
+    K_OWL + 'priorVersion', K_OWL + 'versionInfo',
+    K_RDFS + 'comment', K_RDFS + 'isDefinedBy', K_RDFS + 'label', K_RDFS + 'seeAlso',
+}) | frozenset(x.value for x in OWL2Datatype)
+
+
+class OWLPrefixManager(object):
+    """
+    This class mimics org.semanticweb.owlapi.util.DefaultPrefixManager.
+    """
+    def __init__(self):
+        """
+        Initialize the prefix manager with the standard OWL 2 prefixes.
+        """
+        self.prefixes = [('owl', K_OWL), ('rdf', K_RDF), ('xml', K_XML), ('xsd', K_XSD), ('rdfs', K_RDFS)]
+
+    def getIRI(self, curie):
+        """
+        Expands the given prefixed name into a full IRI.
+        :type curie: str
+        :rtype: IRI
+        """
+        prefix, _, local = curie.partition(':')
+        for name, namespace in self.prefixes:
+            if name == prefix:
+                return IRI(namespace + local)
+        raise ValueError('unknown prefix in %s' % curie)
+
+    def getShortForm(self, iri):
+        """
+        Returns the prefixed name of the given IRI, or None if no prefix matches it.
+        :type iri: str
+        :rtype: str
+        """
+        for name, namespace in self.prefixes:
+            if iri.startswith(namespace):
+                local = iri[len(namespace):]
+                if local and not any(c in local for c in '/#:'):
+                    return '{0}:{1}'.format(name, local)
+        return None
+
+    def setPrefix(self, name, namespace):
+        """
+        Bind the given prefix name to the given namespace.
+        :type name: str
+        :type namespace: str
+        """
+        name = name.rstrip(':')
+        self.prefixes = [x for x in self.prefixes if x[0] != name]
+        self.prefixes.append((name, namespace))
+
+
+#############################################
+#   OWL 2 OBJECTS
+#################################
+
+
+class OWLObject(object):
+    """
+    Immutable OWL 2 object (entity, expression, literal or axiom) identified by its
+    Functional Syntax constructor name and its arguments, and comparable by value.
+    """
+    __slots__ = ('args', 'hash', 'kind')
+
+    Entities = frozenset({'AnnotationProperty', 'Class', 'DataProperty', 'Datatype', 'NamedIndividual', 'ObjectProperty'})
+
+    def __init__(self, kind, *args):
+        """
+        Initialize the object.
+        :type kind: str
+        :type args: tuple
+        """
+        self.args = args
+        self.hash = hash((kind, args))
+        self.kind = kind
+
+    def __eq__(self, other):
+        """
+        Returns True if the given object represents the same OWL 2 object, False otherwise.
+        :type other: OWLObject
+        :rtype: bool
+        """
+        return isinstance(other, OWLObject) and self.kind == other.kind and self.args == other.args
+
+    def __hash__(self):
+        """
+        Returns the hash of this object.
+        :rtype: int
+        """
+        return self.hash
+
+    def __repr__(self):
+        """
+        Returns the representation of this object.
+        :rtype: str
+        """
+        return 'OWLObject({0}, {1})'.format(self.kind, ', '.join(map(repr, self.args)))
+
+    def getInverseProperty(self):
+        """
+        Returns the inverse of this object property expression.
+        :rtype: OWLObject
+        """
+        if self.kind == 'ObjectInverseOf':
+            return self.args[0]
+        return OWLObject('ObjectInverseOf', self)
+
+    def getIRI(self):
+        """
+        Returns the IRI of this entity.
+        :rtype: IRI
+        """
+        return self.args[0]
+
+    def isBuiltIn(self):
+        """
+        Returns True if this object is a builtin entity, False otherwise.
+        :rtype: bool
+        """
+        return self.isEntity() and self.args[0] in BuiltIn
+
+    def isEntity(self):
+        """
+        Returns True if this object is an entity, False otherwise.
+        :rtype: bool
+        """
+        return self.kind in self.Entities
+
+    def isTopEntity(self):
+        """
+        Returns True if this object is owl:Thing or rdfs:Literal, False otherwise.
+        :rtype: bool
+        """
+        return self.isEntity() and self.args[0] in {K_OWL + 'Thing', K_RDFS + 'Literal'}
+
+    def signature(self):
+        """
+        Returns the set of entities appearing in this object.
+        :rtype: set
+        """
+        if self.isEntity():
+            return {self}
+        signature = set()
+        for arg in self.args:
+            if isinstance(arg, OWLObject):
+                signature |= arg.signature()
+            elif isinstance(arg, (frozenset, tuple)):
+                for item in arg:
+                    signature |= item.signature()
+        return signature
+
+
+class OWLDataFactory(object):
+    """
+    This class mimics the subset of org.semanticweb.owlapi.model.OWLDataFactory used by the OWL 2 exporter.
+    """
+    def __init__(self, pm=None):
+        """
+        Initialize the data factory.
+        :type pm: OWLPrefixManager
+        """
+        self.pm = pm
+
+    #############################################
+    #   ENTITIES
+    #################################
+
+    @staticmethod
+    def iri(value, pm):
+        """
+        Returns the IRI identified by the given prefixed name or full IRI.
+        :type value: str
+        :type pm: OWLPrefixManager
+        :rtype: IRI
+        """
+        return pm.getIRI(value) if pm is not None else IRI(value)
+
+    def getOWLAnnotationProperty(self, iri, pm=None):
+        """
+        :type iri: str
+        :type pm: OWLPrefixManager
+        :rtype: OWLObject
+        """
+        return OWLObject('AnnotationProperty', self.iri(iri, pm))
+
+    def getOWLBottomDataProperty(self):
+        """
+        :rtype: OWLObject
+        """
+        return OWLObject('DataProperty', IRI(K_OWL + 'bottomDataProperty'))
+
+    def getOWLBottomObjectProperty(self):
+        """
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectProperty', IRI(K_OWL + 'bottomObjectProperty'))
+
+    def getOWLClass(self, iri, pm=None):
+        """
+        :type iri: str
+        :type pm: OWLPrefixManager
+        :rtype: OWLObject
+        """
+        return OWLObject('Class', self.iri(iri, pm))
+
+    def getOWLDataProperty(self, iri, pm=None):
+        """
+        :type iri: str
+        :type pm: OWLPrefixManager
+        :rtype: OWLObject
+        """
+        return OWLObject('DataProperty', self.iri(iri, pm))
+
+    def getOWLDatatype(self, iri, pm=None):
+        """
+        :type iri: str
+        :type pm: OWLPrefixManager
+        :rtype: OWLObject
+        """
+        return OWLObject('Datatype', self.iri(iri, pm))
+
+    def getOWLNamedIndividual(self, iri, pm=None):
+        """
+        :type iri: str
+        :type pm: OWLPrefixManager
+        :rtype: OWLObject
+        """
+        return OWLObject('NamedIndividual', self.iri(iri, pm))
+
+    def getOWLNothing(self):
+        """
+        :rtype: OWLObject
+        """
+        return OWLObject('Class', IRI(K_OWL + 'Nothing'))
+
+    def getOWLObjectProperty(self, iri, pm=None):
+        """
+        :type iri: str
+        :type pm: OWLPrefixManager
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectProperty', self.iri(iri, pm))
+
+    def getOWLThing(self):
+        """
+        :rtype: OWLObject
+        """
+        return OWLObject('Class', IRI(K_OWL + 'Thing'))
+
+    def getOWLTopDataProperty(self):
+        """
+        :rtype: OWLObject
+        """
+        return OWLObject('DataProperty', IRI(K_OWL + 'topDataProperty'))
+
+    def getOWLTopObjectProperty(self):
+        """
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectProperty', IRI(K_OWL + 'topObjectProperty'))
+
+    def getTopDatatype(self):
+        """
+        :rtype: OWLObject
+        """
+        return OWLObject('Datatype', IRI(K_RDFS + 'Literal'))
+
+    #############################################
+    #   LITERALS AND ANNOTATIONS
+    #################################
+
+    def getOWLAnnotation(self, aproperty, value):
+        """
+        :type aproperty: OWLObject
+        :type value: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('Annotation', aproperty, value)
+
+    def getOWLFacetRestriction(self, facet, literal):
+        """
+        :type facet: OWLFacet
+        :type literal: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('FacetRestriction', facet.getIRI(), literal)
+
+    def getOWLLiteral(self, value, datatype=None):
+        """
+        :type value: str
+        :type datatype: OWLObject
+        :rtype: OWLObject
+        """
+        if datatype is None:
+            datatype = self.getOWLDatatype(OWL2Datatype.XSD_STRING.getIRI())
+        if datatype.getIRI() == OWL2Datatype.RDF_PLAIN_LITERAL.value:
+            lexical, _, language = str(value).rpartition('@') if '@' in str(value) else (str(value), '', '')
+            return OWLObject('Literal', lexical, None, language)
+        return OWLObject('Literal', str(value), datatype, '')
+
+    #############################################
+    #   CLASS EXPRESSIONS AND DATA RANGES
+    #################################
+
+    def getOWLDataAllValuesFrom(self, dpe, dre):
+        """
+        :type dpe: OWLObject
+        :type dre: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataAllValuesFrom', dpe, dre)
+
+    def getOWLDataComplementOf(self, dre):
+        """
+        :type dre: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataComplementOf', dre)
+
+    def getOWLDataIntersectionOf(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('DataIntersectionOf', frozenset(collection))
+
+    def getOWLDataMaxCardinality(self, cardinality, dpe, dre):
+        """
+        :type cardinality: int
+        :type dpe: OWLObject
+        :type dre: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataMaxCardinality', int(cardinality), dpe, dre)
+
+    def getOWLDataMinCardinality(self, cardinality, dpe, dre):
+        """
+        :type cardinality: int
+        :type dpe: OWLObject
+        :type dre: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataMinCardinality', int(cardinality), dpe, dre)
+
+    def getOWLDataSomeValuesFrom(self, dpe, dre):
+        """
+        :type dpe: OWLObject
+        :type dre: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataSomeValuesFrom', dpe, dre)
+
+    def getOWLDatatypeRestriction(self, datatype, collection):
+        """
+        :type datatype: OWLObject
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('DatatypeRestriction', datatype, frozenset(collection))
+
+    def getOWLDataUnionOf(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('DataUnionOf', frozenset(collection))
+
+    def getOWLObjectAllValuesFrom(self, ope, ce):
+        """
+        :type ope: OWLObject
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectAllValuesFrom', ope, ce)
+
+    def getOWLObjectComplementOf(self, ce):
+        """
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectComplementOf', ce)
+
+    def getOWLObjectHasSelf(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectHasSelf', ope)
+
+    def getOWLObjectIntersectionOf(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectIntersectionOf', frozenset(collection))
+
+    def getOWLObjectMaxCardinality(self, cardinality, ope, ce):
+        """
+        :type cardinality: int
+        :type ope: OWLObject
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectMaxCardinality', int(cardinality), ope, ce)
+
+    def getOWLObjectMinCardinality(self, cardinality, ope, ce):
+        """
+        :type cardinality: int
+        :type ope: OWLObject
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectMinCardinality', int(cardinality), ope, ce)
+
+    def getOWLObjectOneOf(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectOneOf', frozenset(collection))
+
+    def getOWLObjectSomeValuesFrom(self, ope, ce):
+        """
+        :type ope: OWLObject
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectSomeValuesFrom', ope, ce)
+
+    def getOWLObjectUnionOf(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectUnionOf', frozenset(collection))
+
+    #############################################
+    #   AXIOMS
+    #################################
+
+    def getOWLAnnotationAssertionAxiom(self, subject, annotation):
+        """
+        :type subject: IRI
+        :type annotation: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('AnnotationAssertion', annotation.args[0], subject, annotation.args[1])
+
+    def getOWLAsymmetricObjectPropertyAxiom(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('AsymmetricObjectProperty', ope)
+
+    def getOWLClassAssertionAxiom(self, ce, individual):
+        """
+        :type ce: OWLObject
+        :type individual: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ClassAssertion', ce, individual)
+
+    def getOWLDataPropertyAssertionAxiom(self, dpe, subject, value):
+        """
+        :type dpe: OWLObject
+        :type subject: OWLObject
+        :type value: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataPropertyAssertion', dpe, subject, value)
+
+    def getOWLDataPropertyDomainAxiom(self, dpe, ce):
+        """
+        :type dpe: OWLObject
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataPropertyDomain', dpe, ce)
+
+    def getOWLDataPropertyRangeAxiom(self, dpe, dre):
+        """
+        :type dpe: OWLObject
+        :type dre: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('DataPropertyRange', dpe, dre)
+
+    def getOWLDeclarationAxiom(self, entity):
+        """
+        :type entity: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('Declaration', entity)
+
+    def getOWLDisjointClassesAxiom(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('DisjointClasses', frozenset(collection))
+
+    def getOWLDisjointDataPropertiesAxiom(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('DisjointDataProperties', frozenset(collection))
+
+    def getOWLDisjointObjectPropertiesAxiom(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('DisjointObjectProperties', frozenset(collection))
+
+    def getOWLEquivalentClassesAxiom(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('EquivalentClasses', frozenset(collection))
+
+    def getOWLEquivalentDataPropertiesAxiom(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('EquivalentDataProperties', frozenset(collection))
+
+    def getOWLEquivalentObjectPropertiesAxiom(self, collection):
+        """
+        :type collection: set
+        :rtype: OWLObject
+        """
+        return OWLObject('EquivalentObjectProperties', frozenset(collection))
+
+    def getOWLFunctionalDataPropertyAxiom(self, dpe):
+        """
+        :type dpe: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('FunctionalDataProperty', dpe)
+
+    def getOWLFunctionalObjectPropertyAxiom(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('FunctionalObjectProperty', ope)
+
+    def getOWLInverseFunctionalObjectPropertyAxiom(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('InverseFunctionalObjectProperty', ope)
+
+    def getOWLInverseObjectPropertiesAxiom(self, forward, inverse):
+        """
+        :type forward: OWLObject
+        :type inverse: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('InverseObjectProperties', forward, inverse)
+
+    def getOWLIrreflexiveObjectPropertyAxiom(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('IrreflexiveObjectProperty', ope)
+
+    def getOWLNegativeDataPropertyAssertionAxiom(self, dpe, subject, value):
+        """
+        :type dpe: OWLObject
+        :type subject: OWLObject
+        :type value: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('NegativeDataPropertyAssertion', dpe, subject, value)
+
+    def getOWLNegativeObjectPropertyAssertionAxiom(self, ope, subject, value):
+        """
+        :type ope: OWLObject
+        :type subject: OWLObject
+        :type value: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('NegativeObjectPropertyAssertion', ope, subject, value)
+
+    def getOWLObjectPropertyAssertionAxiom(self, ope, subject, value):
+        """
+        :type ope: OWLObject
+        :type subject: OWLObject
+        :type value: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectPropertyAssertion', ope, subject, value)
+
+    def getOWLObjectPropertyDomainAxiom(self, ope, ce):
+        """
+        :type ope: OWLObject
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectPropertyDomain', ope, ce)
+
+    def getOWLObjectPropertyRangeAxiom(self, ope, ce):
+        """
+        :type ope: OWLObject
+        :type ce: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ObjectPropertyRange', ope, ce)
+
+    def getOWLReflexiveObjectPropertyAxiom(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('ReflexiveObjectProperty', ope)
+
+    def getOWLSubClassOfAxiom(self, sub, sup):
+        """
+        :type sub: OWLObject
+        :type sup: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('SubClassOf', sub, sup)
+
+    def getOWLSubDataPropertyOfAxiom(self, sub, sup):
+        """
+        :type sub: OWLObject
+        :type sup: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('SubDataPropertyOf', sub, sup)
+
+    def getOWLSubObjectPropertyOfAxiom(self, sub, sup):
+        """
+        :type sub: OWLObject
+        :type sup: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('SubObjectPropertyOf', sub, sup)
+
+    def getOWLSubPropertyChainOfAxiom(self, chain, sup):
+        """
+        :type chain: list
+        :type sup: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('SubObjectPropertyOf', OWLObject('ObjectPropertyChain', tuple(chain)), sup)
+
+    def getOWLSymmetricObjectPropertyAxiom(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('SymmetricObjectProperty', ope)
+
+    def getOWLTransitiveObjectPropertyAxiom(self, ope):
+        """
+        :type ope: OWLObject
+        :rtype: OWLObject
+        """
+        return OWLObject('TransitiveObjectProperty', ope)
+
+
+#############################################
+#   ONTOLOGY AND RENDERING
+#################################
+
+
+class OWLOntology(object):
+    """
+    Holds the axioms of an OWL 2 ontology.
+    """
+    def __init__(self, iri, version=None):
+        """
+        Initialize the ontology.
+        :type iri: str
+        :type version: str
+        """
+        self.axioms = set()
+        self.iri = iri
+        self.version = version
+
+    def addAxioms(self, axioms):
+        """
+        Add the given axioms to the ontology.
+        :type axioms: T <= list|set|tuple
+        """
+        self.axioms.update(axioms)
+
+    def signature(self):
+        """
+        Returns the set of entities appearing in the axioms of the ontology.
+        :rtype: set
+        """
+        signature = set()
+        for axiom in self.axioms:
+            signature |= axiom.signature()
+        return signature
+
+
+class OWLFunctionalSyntaxRenderer(object):
+    """
+    Renders OWL 2 objects and ontologies in OWL 2 Functional Syntax.
+    The output follows the layout of the OWL API renderer (once filtered through
+    OWLFunctionalDocumentFilter): declarations of all the non-builtin entities are
+    generated when missing, and operands of n-ary constructs are sorted.
+    """
+    Cardinalities = frozenset({'DataMaxCardinality', 'DataMinCardinality', 'ObjectMaxCardinality', 'ObjectMinCardinality'})
+    Order = {
+        'Class': 1, 'ObjectProperty': 2, 'DataProperty': 3, 'NamedIndividual': 4, 'AnnotationProperty': 5, 'Datatype': 6,
+        'ObjectInverseOf': 10,
+        'ObjectIntersectionOf': 20, 'ObjectUnionOf': 21, 'ObjectComplementOf': 22, 'ObjectOneOf': 23,
+        'ObjectSomeValuesFrom': 24, 'ObjectAllValuesFrom': 25, 'ObjectMinCardinality': 27,
+        'ObjectMaxCardinality': 29, 'ObjectHasSelf': 30, 'DataSomeValuesFrom': 31, 'DataAllValuesFrom': 32,
+        'DataMinCardinality': 34, 'DataMaxCardinality': 36,
+        'DataComplementOf': 40, 'DataIntersectionOf': 41, 'DataUnionOf': 42, 'DatatypeRestriction': 43,
+    }
+
+    def __init__(self, pm):
+        """
+        Initialize the renderer.
+        :type pm: OWLPrefixManager
+        """
+        self.cache = {}
+        self.pm = pm
+
+    def render(self, obj):
+        """
+        Returns the Functional Syntax representation of the given OWL 2 object.
+        :type obj: T <= OWLObject|IRI
+        :rtype: str
+        """
+        try:
+            return self.cache[obj]
+        except KeyError:
+            if isinstance(obj, OWLObject):
+                text = self.renderObject(obj)
+            else:
+                text = self.pm.getShortForm(obj) or '<{0}>'.format(obj)
+            self.cache[obj] = text
+            return text
+
+    def renderArgument(self, arg):
+        """
+        Returns the Functional Syntax representation of the given constructor argument.
+        :type arg: T <= OWLObject|IRI|int|frozenset|tuple
+        :rtype: str
+        """
+        if isinstance(arg, int):
+            return str(arg)
+        if isinstance(arg, frozenset):
+            return ' '.join(self.render(x) for x in sorted(arg, key=self.sortKey))
+        if isinstance(arg, tuple):
+            return ' '.join(self.render(x) for x in arg)
+        return self.render(arg)
+
+    def renderObject(self, obj):
+        """
+        Returns the Functional Syntax representation of the given OWL 2 object.
+        :type obj: OWLObject
+        :rtype: str
+        """
+        if obj.isEntity():
+            return self.render(obj.args[0])
+        if obj.kind == 'Declaration':
+            entity = obj.args[0]
+            return 'Declaration({0}({1}))'.format(entity.kind, self.render(entity))
+        if obj.kind == 'Literal':
+            lexical, datatype, language = obj.args
+            lexical = '"{0}"'.format(lexical.replace('\\', '\\\\').replace('"', '\\"'))
+            if language:
+                return '{0}@{1}'.format(lexical, language)
+            if datatype is None:
+                return lexical
+            return '{0}^^{1}'.format(lexical, self.render(datatype))
+        if obj.kind == 'FacetRestriction':
+            return '{0} {1}'.format(self.render(obj.args[0]), self.render(obj.args[1]))
+        args = obj.args
+        if obj.kind in self.Cardinalities and args[2].isTopEntity():
+            args = args[:2]
+        return '{0}({1})'.format(obj.kind, ' '.join(self.renderArgument(x) for x in args))
+
+    def renderOntology(self, ontology):
+        """
+        Render the given ontology yielding its Functional Syntax document row by row.
+        :type ontology: OWLOntology
+        :rtype: generator
+        """
+        yield 'Prefix(:=<{0}#>)'.format(ontology.iri)
+        for name, namespace in self.pm.prefixes:
+            yield 'Prefix({0}:=<{1}>)'.format(name, namespace)
+        yield ''
+        yield 'Ontology(<{0}>'.format(ontology.iri)
+        if ontology.version:
+            yield '<{0}>'.format(ontology.version)
+        declarations = {x for x in ontology.axioms if x.kind == 'Declaration'}
+        declared = {x.args[0] for x in declarations}
+        for entity in ontology.signature():
+            if entity not in declared and not entity.isBuiltIn():
+                declarations.add(OWLObject('Declaration', entity))
+        for axiom in sorted(declarations, key=self.sortKey):
+            yield self.render(axiom)
+        for axiom in sorted((x for x in ontology.axioms if x.kind != 'Declaration'), key=self.sortKey):
+            yield self.render(axiom)
+        yield ')'
+
+    def sortKey(self, obj):
+        """
+        Returns the key used to sort operands and axioms.
+        :type obj: OWLObject
+        :rtype: tuple
+        """
+        if obj.kind == 'Declaration':
+            return self.Order.get(obj.args[0].kind, 100), self.render(obj)
+        return self.Order.get(obj.kind, 100), self.render(obj)
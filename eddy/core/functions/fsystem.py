@@ -104,13 +104,17 @@ def fwrite(content, path):
     Safely write the given 'content' in the file identified by the given 'path'.
     If the given path identifies an already existing file, its content is not
     truncated unless the writing operation is completed successfully.
-    :type content: T <= bytes|str|unicode
+    The content may also be given as an iterable of strings, which are written one at a time.
+    :type content: T <= bytes|str|unicode|generator
     :type path: str
     """
     components = os.path.split(expandPath(path))
     stage = os.path.join(components[0], '.{0}'.format(components[1]))
     with io.open(stage, 'w', encoding='utf8') as ptr:
-        ptr.write(content)
+        if isinstance(content, (bytes, str)):
+            ptr.write(content)
+        else:
+            ptr.writelines(content)
     fremove(path)
     frename(stage, path)
 
@@ -57,15 +57,27 @@ def OWLFunctionalDocumentFilter(content):
     :type content: str
     :rtype: str
     """
-    result = []
-    extend = result.extend
-    for row in (i for i in content.split('\n') if not i.startswith('#')):
-        if not isEmpty(row):
+    return ''.join(OWLFunctionalDocumentStreamFilter(content.split('\n')))
+
+
+def OWLFunctionalDocumentStreamFilter(rows):
+    """
+    Incremental version of OWLFunctionalDocumentFilter: filters the given iterable of
+    document rows (e.g. an open file) and yields the formatted document chunk by chunk,
+    hence the whole document never needs to be held in memory.
+    :type rows: T <= list|tuple|generator|file
+    :rtype: generator
+    """
+    newlines = ''
+    for row in rows:
+        row = row.rstrip('\n')
+        if not row.startswith('#') and not isEmpty(row):
             if RE_OWL_ONTOLOGY_FUNCTIONAL_TAG.search(row):
-                extend(['\n', row, '\n', '\n'])
+                yield '{0}\n{1}'.format(newlines, row)
+                newlines = '\n\n'
             else:
-                extend([row, '\n'])
-    return ''.join(result).rstrip('\n')
+                yield '{0}{1}'.format(newlines, row)
+                newlines = '\n'
 
 
 def OWLShortIRI(prefix, resource):
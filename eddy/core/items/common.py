@@ -166,6 +166,16 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         """
         pass
 
+    @staticmethod
+    def isLowDetail(painter, option):
+        """
+        Returns True if the item is being painted too small for its details to be distinguished.
+        :type painter: QPainter
+        :type option: QStyleOptionGraphicsItem
+        :rtype: bool
+        """
+        return option.levelOfDetailFromTransform(painter.worldTransform()) < Style.ShapeZoom
+
     @abstractmethod
     def painterPath(self):
         """
@@ -174,6 +184,22 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         """
         pass
 
+    @abstractmethod
+    def paintLowDetail(self, painter, option):
+        """
+        Paint a simplified version of the item (used when the diagram is zoomed out).
+        :type painter: QPainter
+        :type option: QStyleOptionGraphicsItem
+        """
+        pass
+
+    def polygons(self):
+        """
+        Returns the polygons used to draw the item.
+        :rtype: list
+        """
+        return []
+
     @abstractmethod
     def setText(self, text):
         """
@@ -213,6 +239,21 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         """
         return self.Type
 
+    def updateCache(self):
+        """
+        Invalidate the item cache and schedule a repaint if any of its polygons changed since the last
+        time this method was called: returns whether the item is going to be repainted.
+        :rtype: bool
+        """
+        changed = False
+        for polygon in self.polygons():
+            if polygon.isChanged():
+                polygon.setChanged(False)
+                changed = True
+        if changed:
+            self.update()
+        return changed
+
     def updateEdge(self, *args, **kwargs):
         """
         Update the edge geometry if this item is an edge.
@@ -422,6 +463,16 @@ class AbstractLabel(QtWidgets.QGraphicsTextItem, DiagramItemMixin):
         """
         return self._movable
 
+    def paint(self, painter, option, widget=None):
+        """
+        Paint the label in the graphic view: labels are not painted when too small to be read.
+        :type painter: QPainter
+        :type option: QStyleOptionGraphicsItem
+        :type widget: QWidget
+        """
+        if self.hasFocus() or option.levelOfDetailFromTransform(painter.worldTransform()) >= Style.LabelZoom:
+            super().paint(painter, option, widget)
+
     def pos(self):
         """
         Returns the position of the label in parent's item coordinates.
@@ -574,6 +625,7 @@ class Polygon(object):
         self._geometry = geometry
         self._brush = brush
         self._pen = pen
+        self._changed = True
 
     #############################################
     #   INTERFACE
@@ -593,6 +645,13 @@ class Polygon(object):
         """
         return self._geometry
 
+    def isChanged(self):
+        """
+        Returns True if the shape changed since it was last marked as rendered, False otherwise.
+        :rtype: bool
+        """
+        return self._changed
+
     def pen(self):
         """
         Returns the pen used to draw the shape.
@@ -605,13 +664,25 @@ class Polygon(object):
         Set the brush used to draw the shape.
         :type brush: QBrush
         """
+        if brush is not self._brush and brush != self._brush:
+            self._changed = True
         self._brush = brush
 
+    def setChanged(self, changed):
+        """
+        Set whether the shape changed since it was last rendered.
+        :type changed: bool
+        """
+        self._changed = changed
+
     def setGeometry(self, geometry):
         """
         Set the shape polygon.
+        NB: the same geometry object being given back is assumed to have been modified in place.
         :type geometry: T <= QRectF | QPolygonF | QPainterPath
         """
+        if geometry is self._geometry or geometry != self._geometry:
+            self._changed = True
         self._geometry = geometry
 
     def setPen(self, pen):
@@ -619,4 +690,38 @@ class Polygon(object):
         Set the brush used to draw the shape.
         :type pen: QPen
         """
-        self._pen = pen
\ No newline at end of file
+        if pen is not self._pen and pen != self._pen:
+            self._changed = True
+        self._pen = pen
+
+
+class Style(object):
+    """
+    This class holds the pens and brushes shared by all the diagram items, so that updating
+    the items does not require allocating new ones. Since the same instances are referenced
+    by many polygons they must be treated as immutable: copy them before making any change.
+
+    It also holds the zoom factors below which the items are painted with less detail: labels
+    are not painted below LabelZoom, while below ShapeZoom nodes are painted as flat boxes and
+    edges as plain lines (see AbstractItem.paintLowDetail).
+    """
+    LabelZoom = 0.45
+    ShapeZoom = 0.25
+
+    NoBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+    NoPen = QtGui.QPen(QtCore.Qt.NoPen)
+
+    BlackBrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
+    WhiteBrush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
+    OutlinePen = QtGui.QPen(BlackBrush, 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+    DashedOutlinePen = QtGui.QPen(BlackBrush, 1.1, QtCore.Qt.CustomDashLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+    DashedOutlinePen.setDashPattern([5, 5])
+
+    SelectionBrush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
+    ValidBrush = QtGui.QBrush(QtGui.QColor(43, 173, 63, 160))
+    InvalidBrush = QtGui.QBrush(QtGui.QColor(179, 12, 12, 160))
+
+    HandleBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
+    HandlePen = QtGui.QPen(BlackBrush, 1.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+
+    FlatPen = QtGui.QPen(BlackBrush, 0, QtCore.Qt.SolidLine)
\ No newline at end of file
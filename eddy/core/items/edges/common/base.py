@@ -47,6 +47,7 @@ from eddy.core.functions.geometry import distance, projection
 from eddy.core.functions.misc import snap
 from eddy.core.items.common import AbstractItem
 from eddy.core.items.common import Polygon
+from eddy.core.items.common import Style
 
 
 class AbstractEdge(AbstractItem):
@@ -263,6 +264,28 @@ class AbstractEdge(AbstractItem):
             return self.source
         raise AttributeError('node {0} is not attached to edge {1}'.format(node, self))
 
+    def paintLowDetail(self, painter, option):
+        """
+        Paint the edge as a plain line, without head, breakpoints and anchor points.
+        :type painter: QPainter
+        :type option: QStyleOptionGraphicsItem
+        """
+        # SET THE RECT THAT NEEDS TO BE REPAINTED
+        painter.setClipRect(option.exposedRect)
+        # SELECTION AREA
+        if self.selection.brush().style() != QtCore.Qt.NoBrush:
+            painter.fillPath(self.selection.geometry(), self.selection.brush())
+        # EDGE LINE
+        painter.setPen(self.path.pen())
+        painter.drawPath(self.path.geometry())
+
+    def polygons(self):
+        """
+        Returns the polygons used to draw the edge, anchor points and breakpoints included.
+        :rtype: list
+        """
+        return [self.selection, self.path, self.head] + list(self.anchors.values()) + self.handles
+
     def updateEdge(self, selected=None, visible=None, breakpoint=None, anchor=None, **kwargs):
         """
         Update the current edge.
@@ -281,51 +304,54 @@ class AbstractEdge(AbstractItem):
 
         ## ANCHORS (GEOMETRY) --> NB: THE POINTS ARE IN THE ENDPOINTS
         if source and target:
-            p = source.anchor(self)
-            self.anchors[source] = Polygon(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8))
-            p = target.anchor(self)
-            self.anchors[target] = Polygon(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8))
+            for node in (source, target):
+                p = node.anchor(self)
+                geometry = QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8)
+                if node in self.anchors:
+                    self.anchors[node].setGeometry(geometry)
+                else:
+                    self.anchors[node] = Polygon(geometry)
 
         ## BREAKPOINTS (GEOMETRY)
-        self.handles = [Polygon(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8)) for p in self.breakpoints]
+        if len(self.handles) != len(self.breakpoints):
+            self.handles = [Polygon(QtCore.QRectF()) for _ in self.breakpoints]
+            self.update()
+        for polygon, p in zip(self.handles, self.breakpoints):
+            polygon.setGeometry(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8))
 
         ## ANCHORS + BREAKPOINTS + SELECTION (BRUSH + PEN)
         if visible and selected:
-            apBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
-            apPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            bpBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
-            bpPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            selectionBrush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
+            brush = Style.HandleBrush
+            pen = Style.OutlinePen
+            selectionBrush = Style.SelectionBrush
         else:
-            apBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-            apPen = QtGui.QPen(QtCore.Qt.NoPen)
-            bpBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-            bpPen = QtGui.QPen(QtCore.Qt.NoPen)
-            selectionBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+            brush = Style.NoBrush
+            pen = Style.NoPen
+            selectionBrush = Style.NoBrush
         for polygon in self.anchors.values():
-            polygon.setBrush(apBrush)
-            polygon.setPen(apPen)
+            polygon.setBrush(brush)
+            polygon.setPen(pen)
         for polygon in self.handles:
-            polygon.setBrush(bpBrush)
-            polygon.setPen(bpPen)
+            polygon.setBrush(brush)
+            polygon.setPen(pen)
         self.selection.setBrush(selectionBrush)
 
         ## Z-VALUE (DEPTH)
-        try:
-            zValue = max(*(x.zValue() for x in self.collidingItems())) + 0.1
-        except TypeError:
-            zValue = source.zValue() + 0.1
-            if source.label:
-                zValue = max(zValue, source.label.zValue())
+        diagram = self.diagram
+        if diagram:
+            self.setZValue(diagram.layers.edgeDepth(self))
+        else:
+            zValue = source.zValue()
             if target:
                 zValue = max(zValue, target.zValue())
-                if target.label:
-                    zValue = max(zValue, target.label.zValue())
-        self.setZValue(zValue)
+            self.setZValue(zValue + 0.1)
 
-        ## FORCE CACHE REGENERATION
-        self.setCacheMode(AbstractItem.NoCache)
-        self.setCacheMode(AbstractItem.DeviceCoordinateCache)
+        ## REGENERATE CACHE AND SCHEDULE REPAINT (ONLY IF THE EDGE LOOKS DIFFERENT)
+        self.updateCache()
+
+        ## UPDATE DIAGRAM BOUNDS
+        if diagram:
+            diagram.updateBounds(self)
 
     #############################################
     #   EVENTS
@@ -40,7 +40,7 @@ from PyQt5 import QtGui
 
 from eddy.core.datatypes.graphol import Item
 from eddy.core.functions.geometry import createArea
-from eddy.core.items.common import Polygon
+from eddy.core.items.common import Polygon, Style
 from eddy.core.items.edges.common.base import AbstractEdge
 
 
@@ -123,6 +123,10 @@ class EquivalenceEdge(AbstractEdge):
         :type option: QStyleOptionGraphicsItem
         :type widget: QWidget
         """
+        # LOW DETAIL (ZOOMED OUT)
+        if self.isLowDetail(painter, option):
+            self.paintLowDetail(painter, option)
+            return
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
         # SELECTION AREA
@@ -161,6 +165,13 @@ class EquivalenceEdge(AbstractEdge):
         path.addPolygon(self.tail.geometry())
         return path
 
+    def polygons(self):
+        """
+        Returns the polygons used to draw the edge, tail included.
+        :rtype: list
+        """
+        return super().polygons() + [self.tail]
+
     def setText(self, text):
         """
         Set the label text.
@@ -279,18 +290,18 @@ class EquivalenceEdge(AbstractEdge):
         # PATH, HEAD, TAIL (BRUSH)
         #################################
 
-        headBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        headPen = QtGui.QPen(QtCore.Qt.NoPen)
-        pathPen = QtGui.QPen(QtCore.Qt.NoPen)
-        tailBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        tailPen = QtGui.QPen(QtCore.Qt.NoPen)
+        headBrush = Style.NoBrush
+        headPen = Style.NoPen
+        pathPen = Style.NoPen
+        tailBrush = Style.NoBrush
+        tailPen = Style.NoPen
 
         if visible:
-            headBrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
-            headPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            pathPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            tailBrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
-            tailPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+            headBrush = Style.BlackBrush
+            headPen = Style.OutlinePen
+            pathPen = Style.OutlinePen
+            tailBrush = Style.BlackBrush
+            tailPen = Style.OutlinePen
 
         self.head.setBrush(headBrush)
         self.head.setPen(headPen)
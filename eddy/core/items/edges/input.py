@@ -40,6 +40,7 @@ from PyQt5 import QtGui
 
 from eddy.core.datatypes.graphol import Item
 from eddy.core.functions.geometry import createArea
+from eddy.core.items.common import Style
 from eddy.core.items.edges.common.base import AbstractEdge
 from eddy.core.items.edges.common.label import EdgeLabel
 
@@ -109,6 +110,10 @@ class InputEdge(AbstractEdge):
         :type option: QStyleOptionGraphicsItem
         :type widget: QWidget
         """
+        # LOW DETAIL (ZOOMED OUT)
+        if self.isLowDetail(painter, option):
+            self.paintLowDetail(painter, option)
+            return
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
         # SELECTION AREA
@@ -263,15 +268,14 @@ class InputEdge(AbstractEdge):
         # PATH, HEAD (BRUSH)
         #################################
 
-        headBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        headPen = QtGui.QPen(QtCore.Qt.NoPen)
-        pathPen = QtGui.QPen(QtCore.Qt.NoPen)
+        headBrush = Style.NoBrush
+        headPen = Style.NoPen
+        pathPen = Style.NoPen
 
         if visible:
-            headBrush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
-            headPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            pathPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.CustomDashLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            pathPen.setDashPattern([5, 5])
+            headBrush = Style.WhiteBrush
+            headPen = Style.OutlinePen
+            pathPen = Style.DashedOutlinePen
 
         self.head.setBrush(headBrush)
         self.head.setPen(headPen)
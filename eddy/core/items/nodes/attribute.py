@@ -38,7 +38,7 @@ from PyQt5 import QtGui
 
 from eddy.core.datatypes.graphol import Identity, Item, Special
 from eddy.core.datatypes.owl import OWLProfile
-from eddy.core.items.common import Polygon
+from eddy.core.items.common import Polygon, Style
 from eddy.core.items.nodes.common.base import AbstractNode
 from eddy.core.items.nodes.common.label import NodeLabel
 from eddy.core.project import K_FUNCTIONAL
@@ -138,6 +138,10 @@ class AttributeNode(AbstractNode):
         :type option: QStyleOptionGraphicsItem
         :type widget: QWidget
         """
+        # LOW DETAIL (ZOOMED OUT)
+        if self.isLowDetail(painter, option):
+            self.paintLowDetail(painter, option)
+            return
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
         # SELECTION AREA
@@ -167,6 +171,13 @@ class AttributeNode(AbstractNode):
         path.addEllipse(self.polygon.geometry())
         return path
 
+    def polygons(self):
+        """
+        Returns the polygons used to draw the node, functionality marker included.
+        :rtype: list
+        """
+        return super().polygons() + [self.fpolygon]
+
     def setFunctional(self, functional):
         """
         Set the functional property of the predicate represented by this node.
@@ -246,11 +257,11 @@ class AttributeNode(AbstractNode):
         self.fpolygon.setGeometry(path1.subtracted(path2))
 
         # FUNCTIONAL POLYGON (PEN & BRUSH)
-        pen = QtGui.QPen(QtCore.Qt.NoPen)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
+        pen = Style.NoPen
+        brush = Style.NoBrush
         if functional:
-            pen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            brush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
+            pen = Style.OutlinePen
+            brush = Style.WhiteBrush
         self.fpolygon.setPen(pen)
         self.fpolygon.setBrush(brush)
 
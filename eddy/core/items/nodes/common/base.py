@@ -34,6 +34,7 @@
 
 
 from abc import ABCMeta, abstractmethod
+from itertools import count
 
 from PyQt5 import QtCore
 from PyQt5 import QtGui
@@ -41,7 +42,7 @@ from PyQt5 import QtGui
 from eddy.core.commands.nodes import CommandNodeRezize
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.misc import DiagramMode
-from eddy.core.items.common import AbstractItem, Polygon
+from eddy.core.items.common import AbstractItem, Polygon, Style
 
 
 class AbstractNode(AbstractItem):
@@ -52,6 +53,7 @@ class AbstractNode(AbstractItem):
 
     Identities = {}
     Prefix = 'n'
+    Revisions = count(1)
 
     def __init__(self, **kwargs):
         """
@@ -63,6 +65,9 @@ class AbstractNode(AbstractItem):
 
         self.anchors = dict()
         self.edges = set()
+        self.edgesIn = dict() # {Item: set(AbstractEdge)} EDGES TARGETING THIS NODE
+        self.edgesOut = dict() # {Item: set(AbstractEdge)} EDGES ORIGINATING FROM THIS NODE
+        self.revision = next(AbstractNode.Revisions) # RENEWED ON EVERY CONNECTION/IDENTIFICATION/LABEL CHANGE
 
         self.background = None # BACKGROUND POLYGON
         self.selection = None # SELECTION POLYGON
@@ -72,6 +77,7 @@ class AbstractNode(AbstractItem):
         self.setAcceptHoverEvents(True)
         self.setCacheMode(AbstractItem.DeviceCoordinateCache)
         self.setFlag(AbstractItem.ItemIsSelectable, True)
+        self.setFlag(AbstractItem.ItemSendsGeometryChanges, True)
 
     #############################################
     #   PROPERTIES
@@ -96,15 +102,33 @@ class AbstractNode(AbstractItem):
         :type edge: AbstractEdge
         """
         self.edges.add(edge)
+        self.indexEdge(edge)
 
-    def adjacentNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
+    def adjacentEdges(self, types=None):
+        """
+        Returns the set of edges attached to this node, optionally restricted to the given edge types.
+        :type types: T <= list|set|tuple
+        :rtype: set
+        """
+        if types is None:
+            return set(self.edges)
+        edges = set()
+        for index in (self.edgesIn, self.edgesOut):
+            for item in types:
+                if item in index:
+                    edges |= index[item]
+        return edges
+
+    def adjacentNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True, filter_on_types=None):
         """
         Returns the set of adjacent nodes.
         :type filter_on_edges: callable
         :type filter_on_nodes: callable
+        :type filter_on_types: T <= list|set|tuple
         :rtype: set
         """
-        return {x for x in [e.other(self) for e in self.edges if filter_on_edges(e)] if filter_on_nodes(x)}
+        edges = self.edges if filter_on_types is None else self.adjacentEdges(filter_on_types)
+        return {x for x in [e.other(self) for e in edges if filter_on_edges(e)] if filter_on_nodes(x)}
 
     def anchor(self, edge):
         """
@@ -197,16 +221,44 @@ class AbstractNode(AbstractItem):
         """
         return self._identity
 
-    def incomingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
+    def incomingEdges(self, types=None):
+        """
+        Returns the set of edges targeting this node, optionally restricted to the given edge types.
+        Equivalence edges are considered both incoming and outgoing.
+        :type types: T <= list|set|tuple
+        :rtype: set
+        """
+        edges = set()
+        for item in self.edgesIn if types is None else types:
+            if item in self.edgesIn:
+                edges |= self.edgesIn[item]
+        if Item.EquivalenceEdge in self.edgesOut and (types is None or Item.EquivalenceEdge in types):
+            edges |= self.edgesOut[Item.EquivalenceEdge]
+        return edges
+
+    def incomingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True, filter_on_types=None):
         """
         Returns the set of incoming nodes.
         :type filter_on_edges: callable
         :type filter_on_nodes: callable
+        :type filter_on_types: T <= list|set|tuple
         :rtype: set
         """
-        return {x for x in [e.other(self) for e in self.edges \
-                    if (e.target is self or e.type() is Item.EquivalenceEdge) \
-                        and filter_on_edges(e)] if filter_on_nodes(x)}
+        edges = self.incomingEdges(filter_on_types)
+        return {x for x in [e.other(self) for e in edges if filter_on_edges(e)] if filter_on_nodes(x)}
+
+    def indexEdge(self, edge):
+        """
+        Store the given edge in the adjacency index of this node, according to its type and direction.
+        Must be called again whenever the endpoints of an edge already attached to this node are swapped.
+        :type edge: AbstractEdge
+        """
+        self.unindexEdge(edge)
+        self.updateRevision()
+        if edge.target is self:
+            self.edgesIn.setdefault(edge.type(), set()).add(edge)
+        if edge.source is self:
+            self.edgesOut.setdefault(edge.type(), set()).add(edge)
 
     def intersection(self, line):
         """
@@ -259,16 +311,53 @@ class AbstractNode(AbstractItem):
         self.setPos(self.pos() + move)
         self.anchors = {edge: pos + move for edge, pos in self.anchors.items()}
 
-    def outgoingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
+    def outgoingEdges(self, types=None):
+        """
+        Returns the set of edges originating from this node, optionally restricted to the given edge types.
+        Equivalence edges are considered both incoming and outgoing.
+        :type types: T <= list|set|tuple
+        :rtype: set
+        """
+        edges = set()
+        for item in self.edgesOut if types is None else types:
+            if item in self.edgesOut:
+                edges |= self.edgesOut[item]
+        if Item.EquivalenceEdge in self.edgesIn and (types is None or Item.EquivalenceEdge in types):
+            edges |= self.edgesIn[Item.EquivalenceEdge]
+        return edges
+
+    def outgoingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True, filter_on_types=None):
         """
         Returns the set of outgoing nodes.
         :type filter_on_edges: callable
         :type filter_on_nodes: callable
+        :type filter_on_types: T <= list|set|tuple
         :rtype: set
         """
-        return {x for x in [e.other(self) for e in self.edges \
-                    if (e.source is self or e.type() is Item.EquivalenceEdge) \
-                        and filter_on_edges(e)] if filter_on_nodes(x)}
+        edges = self.outgoingEdges(filter_on_types)
+        return {x for x in [e.other(self) for e in edges if filter_on_edges(e)] if filter_on_nodes(x)}
+
+    def paintLowDetail(self, painter, option):
+        """
+        Paint the node as a flat box filled with the node brush, keeping selection and syntax validation.
+        :type painter: QPainter
+        :type option: QStyleOptionGraphicsItem
+        """
+        # SET THE RECT THAT NEEDS TO BE REPAINTED
+        painter.setClipRect(option.exposedRect)
+        # SELECTION AREA + SYNTAX VALIDATION
+        painter.setPen(Style.NoPen)
+        for polygon in (self.selection, self.background):
+            if polygon.brush().style() != QtCore.Qt.NoBrush:
+                painter.setBrush(polygon.brush())
+                painter.drawRect(self.boundingRect())
+        # ITEM SHAPE
+        shape = self.polygon.geometry()
+        if not isinstance(shape, QtCore.QRectF):
+            shape = shape.boundingRect()
+        painter.setPen(Style.FlatPen)
+        painter.setBrush(self.polygon.brush())
+        painter.drawRect(shape)
 
     @abstractmethod
     def painterPath(self):
@@ -285,6 +374,13 @@ class AbstractNode(AbstractItem):
         """
         return self.polygon.pen()
 
+    def polygons(self):
+        """
+        Returns the polygons used to draw the node.
+        :rtype: list
+        """
+        return [self.background, self.selection, self.polygon]
+
     def pos(self):
         """
         Returns the position of this node in scene coordinates.
@@ -298,6 +394,7 @@ class AbstractNode(AbstractItem):
         :type edge: AbstractEdge
         """
         self.edges.discard(edge)
+        self.unindexEdge(edge)
 
     def setAnchor(self, edge, pos):
         """
@@ -320,6 +417,8 @@ class AbstractNode(AbstractItem):
         :type geometry: T <= QtCore.QRectF|QtGui.QPolygonF
         """
         self.polygon.setGeometry(geometry)
+        if self.diagram:
+            self.diagram.updateBounds(self)
 
     def setIdentity(self, identity):
         """
@@ -351,6 +450,19 @@ class AbstractNode(AbstractItem):
             raise TypeError('too many arguments; expected {0}, got {1}'.format(2, len(__args)))
         super().setPos(pos + super().pos() - self.pos())
 
+    def unindexEdge(self, edge):
+        """
+        Remove the given edge from the adjacency index of this node.
+        :type edge: AbstractEdge
+        """
+        self.updateRevision()
+        for index in (self.edgesIn, self.edgesOut):
+            edges = index.get(edge.type())
+            if edges is not None:
+                edges.discard(edge)
+                if not edges:
+                    del index[edge.type()]
+
     def updateEdges(self):
         """
         Update all the edges attached to the node.
@@ -365,25 +477,26 @@ class AbstractNode(AbstractItem):
         :type valid: bool
         """
         # ITEM SELECTION (BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if selected:
-            brush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
-        self.selection.setBrush(brush)
+        self.selection.setBrush(Style.SelectionBrush if selected else Style.NoBrush)
 
         # SYNTAX VALIDATION (BACKGROUND BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
+        brush = Style.NoBrush
         if valid is not None:
-            brush = QtGui.QBrush(QtGui.QColor(179, 12, 12, 160))
-            if valid:
-                brush = QtGui.QBrush(QtGui.QColor(43, 173, 63, 160))
+            brush = Style.ValidBrush if valid else Style.InvalidBrush
         self.background.setBrush(brush)
 
-        # FORCE CACHE REGENERATION
-        self.setCacheMode(AbstractItem.NoCache)
-        self.setCacheMode(AbstractItem.DeviceCoordinateCache)
+        # REGENERATE CACHE AND SCHEDULE REPAINT (ONLY IF THE NODE LOOKS DIFFERENT)
+        self.updateCache()
+
+        # UPDATE DIAGRAM BOUNDS
+        if self.diagram:
+            self.diagram.updateBounds(self)
 
-        # SCHEDULE REPAINT
-        self.update(self.boundingRect())
+    def updateRevision(self):
+        """
+        Assign a new revision number to this node: revision numbers are never reused, even across distinct nodes.
+        """
+        self.revision = next(AbstractNode.Revisions)
 
     @abstractmethod
     def updateTextPos(self, *args, **kwargs):
@@ -413,6 +526,12 @@ class AbstractNode(AbstractItem):
         """
         if change == AbstractNode.ItemSelectedHasChanged:
             self.updateNode(selected=value)
+        elif change == AbstractNode.ItemPositionHasChanged:
+            if self.diagram:
+                self.diagram.updateBounds(self)
+        elif change == AbstractNode.ItemZValueHasChanged:
+            if self.diagram:
+                self.diagram.layers.addNode(self)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, mouseEvent):
@@ -507,6 +626,13 @@ class AbstractResizableNode(AbstractNode):
                 return i
         return None
 
+    def polygons(self):
+        """
+        Returns the polygons used to draw the node, resize handles included.
+        :rtype: list
+        """
+        return super().polygons() + self.handles
+
     @abstractmethod
     def resize(self, mousePos):
         """
@@ -535,31 +661,21 @@ class AbstractResizableNode(AbstractNode):
         self.handles[self.HandleBR].setGeometry(QtCore.QRectF(b.right() - 8, b.bottom() - 8, 8, 8))
 
         # RESIZE HANDLES (PEN + BRUSH)
-        brush = [QtGui.QBrush(QtCore.Qt.NoBrush)] * 8
-        pen = [QtGui.QPen(QtCore.Qt.NoPen)] * 8
-        if selected:
-            if handle is None:
-                brush = [QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))] * 8
-                pen = [QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)] * 8
-            else:
-                for i in range(8):
-                    if i == handle:
-                        brush[i] = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
-                        pen[i] = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
         for i in range(8):
-            self.handles[i].setBrush(brush[i])
-            self.handles[i].setPen(pen[i])
+            if selected and (handle is None or i == handle):
+                self.handles[i].setBrush(Style.HandleBrush)
+                self.handles[i].setPen(Style.HandlePen)
+            else:
+                self.handles[i].setBrush(Style.NoBrush)
+                self.handles[i].setPen(Style.NoPen)
 
         # ITEM SELECTION (BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if selected and handle is None:
-            brush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
-        self.selection.setBrush(brush)
+        self.selection.setBrush(Style.SelectionBrush if selected and handle is None else Style.NoBrush)
 
         # SYNTAX VALIDATION (BACKGROUND BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
+        brush = Style.NoBrush
         if valid is not None:
-            brush = QtGui.QBrush(QtGui.QColor(43, 173, 63, 160)) if valid else QtGui.QBrush(QtGui.QColor(179, 12, 12, 160))
+            brush = Style.ValidBrush if valid else Style.InvalidBrush
         self.background.setBrush(brush)
 
         # ANCHOR POINTS (POSITION) -> NB: SHAPE IS IN THE EDGES
@@ -573,12 +689,12 @@ class AbstractResizableNode(AbstractNode):
                     newPos = self.intersection(QtCore.QLineF(newPos, self.pos()))
                 self.setAnchor(edge, newPos)
 
-        # FORCE CACHE REGENERATION
-        self.setCacheMode(AbstractItem.NoCache)
-        self.setCacheMode(AbstractItem.DeviceCoordinateCache)
+        # REGENERATE CACHE AND SCHEDULE REPAINT (ONLY IF THE NODE LOOKS DIFFERENT)
+        self.updateCache()
 
-        # SCHEDULE REPAINT
-        self.update(self.boundingRect())
+        # UPDATE DIAGRAM BOUNDS
+        if self.diagram:
+            self.diagram.updateBounds(self)
 
     #############################################
     #   EVENTS
@@ -612,6 +728,12 @@ class AbstractResizableNode(AbstractNode):
         if change == AbstractNode.ItemSelectedHasChanged:
             if self.diagram.mode is not DiagramMode.NodeResize:
                 self.updateNode(selected=value)
+        elif change == AbstractNode.ItemPositionHasChanged:
+            if self.diagram:
+                self.diagram.updateBounds(self)
+        elif change == AbstractNode.ItemZValueHasChanged:
+            if self.diagram:
+                self.diagram.layers.addNode(self)
         return super(AbstractNode, self).itemChange(change, value)
 
     def mousePressEvent(self, mouseEvent):
@@ -275,6 +275,10 @@ class FacetNode(AbstractNode):
         :type option: QStyleOptionGraphicsItem
         :type widget: QWidget
         """
+        # LOW DETAIL (ZOOMED OUT)
+        if self.isLowDetail(painter, option):
+            self.paintLowDetail(painter, option)
+            return
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
         # SELECTION AREA
@@ -317,6 +321,13 @@ class FacetNode(AbstractNode):
         """
         return self.polygonB.pen()
 
+    def polygons(self):
+        """
+        Returns the polygons used to draw the node, facet and value boxes included.
+        :rtype: list
+        """
+        return super().polygons() + [self.polygonA, self.polygonB]
+
     def setIdentity(self, identity):
         """
         Set the identity of the current node.
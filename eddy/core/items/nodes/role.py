@@ -39,7 +39,7 @@ from PyQt5 import QtGui
 from eddy.core.datatypes.graphol import Item, Special, Identity
 from eddy.core.datatypes.owl import OWLProfile
 from eddy.core.functions.misc import snapF
-from eddy.core.items.common import Polygon
+from eddy.core.items.common import Polygon, Style
 from eddy.core.items.nodes.common.base import AbstractResizableNode
 from eddy.core.items.nodes.common.label import NodeLabel
 from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
@@ -228,6 +228,10 @@ class RoleNode(AbstractResizableNode):
         :type option: QStyleOptionGraphicsItem
         :type widget: QWidget
         """
+        # LOW DETAIL (ZOOMED OUT)
+        if self.isLowDetail(painter, option):
+            self.paintLowDetail(painter, option)
+            return
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
         # SELECTION AREA
@@ -267,6 +271,13 @@ class RoleNode(AbstractResizableNode):
         path.addPolygon(self.polygon.geometry())
         return path
 
+    def polygons(self):
+        """
+        Returns the polygons used to draw the node, functionality markers included.
+        :rtype: list
+        """
+        return super().polygons() + [self.fpolygon, self.ipolygon]
+
     def resize(self, mousePos):
         """
         Handle the interactive resize of the shape.
@@ -750,18 +761,18 @@ class RoleNode(AbstractResizableNode):
             ipolygon = ipolygon.subtracted(path)
 
         # FUNCTIONAL POLYGON (PEN + BRUSH)
-        fpen = QtGui.QPen(QtCore.Qt.NoPen)
-        fbrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+        fpen = Style.NoPen
+        fbrush = Style.NoBrush
         if functional:
-            fpen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            fbrush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
+            fpen = Style.OutlinePen
+            fbrush = Style.WhiteBrush
 
         # INVERSE FUNCTIONAL POLYGON (PEN + BRUSH)
-        ipen = QtGui.QPen(QtCore.Qt.NoPen)
-        ibrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+        ipen = Style.NoPen
+        ibrush = Style.NoBrush
         if inverseFunctional:
-            ipen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            ibrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
+            ipen = Style.OutlinePen
+            ibrush = Style.BlackBrush
 
         self.fpolygon.setPen(fpen)
         self.fpolygon.setBrush(fbrush)
@@ -36,14 +36,23 @@
 from abc import ABCMeta, abstractmethod
 
 from PyQt5 import QtCore
+from PyQt5 import QtWidgets
 
 
 class AbstractLoader(QtCore.QObject):
     """
     Extends QObject providing the base class for all the loaders.
+    Additionally to built-in signals, this class emits:
+
+    * sgnProgress: periodically during the load, to notify the amount of work done so far (and the total, if known).
     """
     __metaclass__ = ABCMeta
 
+    ProgressInterval = 100
+    ProgressStep = 500
+
+    sgnProgress = QtCore.pyqtSignal(int, int)
+
     def __init__(self, path, session):
         """
         Initialize the AbstractLoader.
@@ -52,6 +61,11 @@ class AbstractLoader(QtCore.QObject):
         """
         super().__init__(session)
         self.path = path
+        self.progress = 0
+        self.progressSteps = 0
+        self.progressTimer = QtCore.QElapsedTimer()
+        self.progressTimer.start()
+        self.progressTotal = 0
 
     #############################################
     #   PROPERTIES
@@ -85,6 +99,21 @@ class AbstractLoader(QtCore.QObject):
         """
         pass
 
+    def step(self, value=None):
+        """
+        Advance the load progress by one unit of work, or set it to the given value.
+        Rather than processing pending events for every loaded element, progress is notified (and the
+        event loop is given the chance to run) only every ProgressStep units of work or ProgressInterval
+        milliseconds, whichever comes first, so that the UI stays responsive without slowing down the load.
+        :type value: int
+        """
+        self.progress = self.progress + 1 if value is None else value
+        self.progressSteps += 1
+        if self.progressSteps % self.ProgressStep == 0 or self.progressTimer.hasExpired(self.ProgressInterval):
+            self.progressTimer.restart()
+            self.sgnProgress.emit(self.progress, self.progressTotal)
+            QtWidgets.QApplication.processEvents()
+
 
 class AbstractDiagramLoader(AbstractLoader):
     """
@@ -193,3 +222,192 @@ class AbstractProjectLoader(AbstractLoader):
         Perform the load of the project and set is as Session project
         """
         pass
+
+
+class StreamElement(object):
+    """
+    Lightweight XML element detached from any document, which can be read from a QXmlStreamReader
+    and written to a QXmlStreamWriter. It exposes the subset of the QDomElement interface used by
+    loaders and exporters, so that the same import/export functions can work either on a
+    QDomDocument or on an incremental XML parser/writer.
+    """
+    __slots__ = ('attrs', 'children', 'content', 'index', 'parent', 'tag')
+
+    def __init__(self, tag='', attrs=None, parent=None, index=-1):
+        """
+        Initialize the element.
+        :type tag: str
+        :type attrs: dict
+        :type parent: StreamElement
+        :type index: int
+        """
+        self.attrs = attrs or {}
+        self.children = []
+        self.content = ''
+        self.index = index
+        self.parent = parent
+        self.tag = tag
+
+    #############################################
+    #   FACTORY
+    #################################
+
+    @classmethod
+    def fromStream(cls, reader, parent=None, index=-1):
+        """
+        Build an element (together with its subtree) out of the StartElement token the given reader is positioned on.
+        The reader is advanced up to the matching EndElement token, hence the element is consumed from the stream.
+        :type reader: QXmlStreamReader
+        :type parent: StreamElement
+        :type index: int
+        :rtype: StreamElement
+        """
+        element = cls.fromStreamHeader(reader, parent, index)
+        content = []
+        while not reader.atEnd():
+            token = reader.readNext()
+            if token == QtCore.QXmlStreamReader.StartElement:
+                element.children.append(cls.fromStream(reader, element, len(element.children)))
+            elif token == QtCore.QXmlStreamReader.Characters:
+                # Mimic QDomDocument default behavior which drops whitespace-only text nodes.
+                if not reader.isWhitespace():
+                    content.append(reader.text())
+            elif token == QtCore.QXmlStreamReader.EndElement:
+                break
+        element.content = ''.join(content)
+        return element
+
+    @classmethod
+    def fromTuple(cls, data, parent=None, index=-1):
+        """
+        Build an element (together with its subtree) out of its tuple representation (see StreamElement.toTuple).
+        :type data: tuple
+        :type parent: StreamElement
+        :type index: int
+        :rtype: StreamElement
+        """
+        element = cls(data[0], data[1], parent, index)
+        element.content = data[2]
+        element.children = [cls.fromTuple(x, element, i) for i, x in enumerate(data[3])]
+        return element
+
+    @classmethod
+    def fromStreamHeader(cls, reader, parent=None, index=-1):
+        """
+        Build an element holding only the tag name and the attributes of the
+        StartElement token the given reader is positioned on, without consuming it.
+        :type reader: QXmlStreamReader
+        :type parent: StreamElement
+        :type index: int
+        :rtype: StreamElement
+        """
+        attrs = {x.name(): x.value() for x in reader.attributes()}
+        return cls(reader.name(), attrs, parent, index)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def appendChild(self, child):
+        """
+        Append the given element to the children of this element.
+        :type child: StreamElement
+        :rtype: StreamElement
+        """
+        child.parent = self
+        child.index = len(self.children)
+        self.children.append(child)
+        return child
+
+    def attribute(self, name, defValue=''):
+        """
+        Returns the value of the attribute with the given name, or defValue if no such attribute exists.
+        :type name: str
+        :type defValue: str
+        :rtype: str
+        """
+        return self.attrs.get(name, defValue)
+
+    def firstChildElement(self, tagName=''):
+        """
+        Returns the first child element with the given tag name (any tag if tagName is empty).
+        :type tagName: str
+        :rtype: StreamElement
+        """
+        for child in self.children:
+            if not tagName or child.tag == tagName:
+                return child
+        return StreamElement()
+
+    def isNull(self):
+        """
+        Returns True if this is a null element, False otherwise.
+        :rtype: bool
+        """
+        return not self.tag
+
+    def nextSiblingElement(self, tagName=''):
+        """
+        Returns the next sibling element with the given tag name (any tag if tagName is empty).
+        :type tagName: str
+        :rtype: StreamElement
+        """
+        if self.parent is not None:
+            children = self.parent.children
+            for i in range(self.index + 1, len(children)):
+                if not tagName or children[i].tag == tagName:
+                    return children[i]
+        return StreamElement()
+
+    def setAttribute(self, name, value):
+        """
+        Set the value of the attribute with the given name.
+        Numeric values are formatted the same way QDomElement.setAttribute does.
+        :type name: str
+        :type value: T <= int|float|str
+        """
+        if isinstance(value, float):
+            value = '%.17g' % value
+        self.attrs[name] = str(value)
+
+    def setText(self, text):
+        """
+        Set the text contained in this element.
+        :type text: str
+        """
+        self.content = text
+
+    def tagName(self):
+        """
+        Returns the tag name of this element.
+        :rtype: str
+        """
+        return self.tag
+
+    def text(self):
+        """
+        Returns the text contained in this element.
+        :rtype: str
+        """
+        return self.content
+
+    def toStream(self, writer):
+        """
+        Write this element (together with its subtree) to the given writer.
+        :type writer: QXmlStreamWriter
+        """
+        writer.writeStartElement(self.tag)
+        for name, value in self.attrs.items():
+            writer.writeAttribute(name, value)
+        if self.content:
+            writer.writeCharacters(self.content)
+        for child in self.children:
+            child.toStream(writer)
+        writer.writeEndElement()
+
+    def toTuple(self):
+        """
+        Returns a compact representation of this element (and its subtree) made only of builtin types.
+        :rtype: tuple
+        """
+        return self.tag, self.attrs, self.content, tuple(x.toTuple() for x in self.children)
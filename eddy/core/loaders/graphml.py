@@ -37,7 +37,6 @@ import itertools
 import os
 
 from PyQt5 import QtCore
-from PyQt5 import QtWidgets
 from PyQt5 import QtXml
 
 from eddy.core.datatypes.graphol import Item, Identity, Restriction
@@ -623,7 +622,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         """
         Create the QDomDocument from where to parse information.
         """
-        QtWidgets.QApplication.processEvents()
+        self.step()
 
         LOGGER.info('Loading diagram: %s', self.path)
 
@@ -648,7 +647,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         e = graph.firstChildElement('node')
         while not e.isNull():
             try:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 item = self.itemFromXmlNode(e)
                 if not item:
                     raise DiagramParseError('could not identify item for XML node')
@@ -672,7 +671,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         e = graph.firstChildElement('edge')
         while not e.isNull():
             try:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 item = self.itemFromXmlNode(e)
                 if not item:
                     raise DiagramParseError('could not identify item for XML node')
@@ -696,8 +695,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         nodes = [n for n in self.nodes.values() if Identity.Neutral in n.identities()]
         if nodes:
             LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
-            for node in nodes:
-                self.diagram.sgnNodeIdentification.emit(node)
+            self.diagram.identifyNodes(nodes)
 
         LOGGER.debug('Diagram created: %s', self.diagram.name)
 
@@ -729,7 +727,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         g = r.firstChildElement('graph')
         e = g.firstChildElement('edge')
         while not e.isNull():
-            QtWidgets.QApplication.processEvents()
+            self.step()
             self.importPredicateMetaFromElement(e)
             e = e.nextSiblingElement('edge')
 
@@ -747,10 +745,10 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         if moveX or moveY:
             collection = [x for x in self.diagram.items() if x.isNode() or x.isEdge()]
             for item in collection:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 item.moveBy(moveX, moveY)
             for item in collection:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 item.updateEdgeOrNode()
         ## RESIZE THE DIAGRAM
         R3 = self.diagram.visibleRect(margin=20)
@@ -759,7 +757,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         LOGGER.debug('Diagram resized: %s -> %s', Diagram.MaxSize, size)
         ## OPTIMIZE NODE LABEL POSITIONS
         for node in self.diagram.nodes():
-            QtWidgets.QApplication.processEvents()
+            self.step()
             self.optimizeLabelPos(node)
         LOGGER.debug('Performed geometrical optimization on %s nodes', len(self.diagram.nodes()))
 
@@ -767,7 +765,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         """
         Read metadata from the open QDomDocument, necessary to parse the GraphML diagram structure.
         """
-        QtWidgets.QApplication.processEvents()
+        self.step()
 
         root = self.document.documentElement()
         key = root.firstChildElement('key')
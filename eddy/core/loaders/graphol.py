@@ -41,7 +41,7 @@ from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 from PyQt5 import QtXml
 
-from eddy import APPNAME
+from eddy import APPNAME, ORGANIZATION
 from eddy.core.datatypes.collections import DistinctList
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.system import File
@@ -56,6 +56,8 @@ from eddy.core.functions.signals import connect
 from eddy.core.loaders.common import AbstractDiagramLoader
 from eddy.core.loaders.common import AbstractOntologyLoader
 from eddy.core.loaders.common import AbstractProjectLoader
+from eddy.core.loaders.common import StreamElement
+from eddy.core.loaders.snapshot import ProjectSnapshot
 from eddy.core.output import getLogger
 from eddy.core.project import Project
 from eddy.core.project import ProjectMergeWorker
@@ -527,7 +529,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
         element = graph.firstChildElement('node')
         while not element.isNull():
             try:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 item = self.itemFromGrapholNode(element)
                 func = self.importFuncForItem[item]
                 node = func(element)
@@ -549,7 +551,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
         element = graph.firstChildElement('edge')
         while not element.isNull():
             try:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 item = self.itemFromGrapholNode(element)
                 func = self.importFuncForItem[item]
                 edge = func(element)
@@ -572,8 +574,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
         nodes = [n for n in self.nodes.values() if Identity.Neutral in n.identities()]
         if nodes:
             LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
-            for node in nodes:
-                self.diagram.sgnNodeIdentification.emit(node)
+            self.diagram.identifyNodes(nodes)
 
         #############################################
         # CONFIGURE DIAGRAM SIGNALS
@@ -710,7 +711,7 @@ class GrapholProjectLoader_v1(AbstractProjectLoader):
         Initialize the project instance by reading project metadata from XML file.
         :raise ProjectNotValidError: If the project metadata file is missing or not readable.
         """
-        QtWidgets.QApplication.processEvents()
+        self.step()
 
         LOGGER.info('Loading ontology metadata from %s', self.projectMetaDataPath)
 
@@ -743,7 +744,7 @@ class GrapholProjectLoader_v1(AbstractProjectLoader):
         """
         Import predicate metadata from XML file.
         """
-        QtWidgets.QApplication.processEvents()
+        self.step()
 
         #############################################
         # LOAD PREDICATE METADATA
@@ -756,7 +757,7 @@ class GrapholProjectLoader_v1(AbstractProjectLoader):
         predicate = predicates.firstChildElement('predicate')
         while not predicate.isNull():
             try:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 item = self.itemFromXml[predicate.attribute('type')]
                 func = self.metaFuncForItem[item]
                 meta = func(predicate)
@@ -780,7 +781,7 @@ class GrapholProjectLoader_v1(AbstractProjectLoader):
         Import project modules from XML file.
         :raise ProjectNotValidError: If the project structure file is missing or not readable.
         """
-        QtWidgets.QApplication.processEvents()
+        self.step()
 
         LOGGER.info('Loading ontology structure from %s', self.projectModulesDataPath)
 
@@ -796,7 +797,7 @@ class GrapholProjectLoader_v1(AbstractProjectLoader):
         module = modules.firstChildElement('module')
         while not module.isNull():
             try:
-                QtWidgets.QApplication.processEvents()
+                self.step()
                 name = module.text()
                 path = os.path.join(self.project.path, name)
                 worker = GrapholDiagramLoader_v1(path, self.project, self.session)
@@ -888,9 +889,16 @@ class GrapholLoaderMixin_v2(object):
         """
         super().__init__(**kwargs)
 
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+
         self.buffer = dict()
+        self.cache = settings.value('project/load_cache', True, bool)
+        self.device = None
         self.document = None
         self.nproject = None
+        self.reader = None
+        self.snapshot = None
+        self.streaming = settings.value('project/load_streaming', True, bool)
 
         self.itemFromXml = {
             'attribute': Item.AttributeNode,
@@ -1287,66 +1295,97 @@ class GrapholLoaderMixin_v2(object):
     #   ONTOLOGY DIAGRAMS : MAIN IMPORT
     #################################
 
-    def importDiagram(self, e, i):
+    def importDiagram(self, e, i, identities=None):
         """
         Create a diagram from the given QDomElement.
         :type e: QDomElement
         :type i: int
+        :type identities: dict
         :rtype: Diagram
         """
-        QtWidgets.QApplication.processEvents()
-        ## PARSE DIAGRAM INFORMATION
-        name = e.attribute('name', 'diagram_{0}'.format(i))
-        size = max(int(e.attribute('width', '10000')), int(e.attribute('height', '10000')))
         ## CREATE NEW DIAGRAM
-        LOGGER.info('Loading diagram: %s', name)
-        diagram = Diagram.create(name, size, self.nproject)
-        self.buffer[diagram.name] = dict()
+        diagram = self.initDiagram(e, i)
         ## LOAD DIAGRAM NODES
         sube = e.firstChildElement('node')
         while not sube.isNull():
-            try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(sube)
-                func = self.importFuncForItem[item]
-                node = func(diagram, sube)
-            except Exception:
-                LOGGER.exception('Failed to create node %s', sube.attribute('id'))
-            else:
-                diagram.addItem(node)
-                diagram.guid.update(node.id)
-                self.buffer[diagram.name][node.id] = node
-            finally:
-                sube = sube.nextSiblingElement('node')
+            self.importDiagramItem(diagram, sube)
+            self.step()
+            sube = sube.nextSiblingElement('node')
         ## LOAD DIAGRAM EDGES
         sube = e.firstChildElement('edge')
         while not sube.isNull():
-            try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(sube)
-                func = self.importFuncForItem[item]
-                edge = func(diagram, sube)
-            except Exception:
-                LOGGER.exception('Failed to create edge %s', sube.attribute('id'))
+            self.importDiagramItem(diagram, sube)
+            self.step()
+            sube = sube.nextSiblingElement('edge')
+        ## COMPLETE DIAGRAM SETUP
+        self.completeDiagram(diagram, identities)
+        ## RETURN GENERATED DIAGRAM
+        return diagram
+
+    def importDiagramFromStream(self, i):
+        """
+        Create a diagram from the 'diagram' element the XML stream reader is positioned on.
+        Nodes and edges are built as soon as their element is read, and released straight away.
+        :type i: int
+        :rtype: Diagram
+        """
+        ## CREATE NEW DIAGRAM
+        element = StreamElement.fromStreamHeader(self.reader)
+        diagram = self.initDiagram(element, i)
+        ## LOAD DIAGRAM NODES AND EDGES
+        items = []
+        pending = []
+        while self.reader.readNextStartElement():
+            tag = self.reader.name()
+            if tag == 'node':
+                sube = StreamElement.fromStream(self.reader)
+                self.importDiagramItem(diagram, sube)
+                if self.snapshot is not None:
+                    items.append(sube.toTuple())
+            elif tag == 'edge':
+                sube = StreamElement.fromStream(self.reader)
+                if self.snapshot is not None:
+                    items.append(sube.toTuple())
+                # Edges are usually serialized after all the nodes of the diagram: in case we hit
+                # one whose endpoints are not loaded yet, delay its creation till the end of the diagram.
+                if sube.attribute('source') in self.buffer[diagram.name] and \
+                    sube.attribute('target') in self.buffer[diagram.name]:
+                    self.importDiagramItem(diagram, sube)
+                else:
+                    pending.append(sube)
             else:
-                diagram.addItem(edge)
-                diagram.guid.update(edge.id)
-                self.buffer[diagram.name][edge.id] = edge
-            finally:
-                sube = sube.nextSiblingElement('edge')
-        ## IDENTIFY NEUTRAL NODES
-        nodes = [x for x in diagram.items(edges=False) if Identity.Neutral in x.identities()]
-        if nodes:
-            LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
-            for node in nodes:
-                diagram.sgnNodeIdentification.emit(node)
-        ## CONFIGURE DIAGRAM SIGNALS
-        connect(diagram.sgnItemAdded, self.nproject.doAddItem)
-        connect(diagram.sgnItemRemoved, self.nproject.doRemoveItem)
-        connect(diagram.selectionChanged, self.session.doUpdateState)
+                self.reader.skipCurrentElement()
+            self.step(self.device.pos())
+        for sube in pending:
+            self.importDiagramItem(diagram, sube)
+        ## RECORD DIAGRAM STRUCTURE
+        if self.snapshot is not None:
+            self.snapshot['diagrams'].append((element.tag, element.attrs, '', tuple(items)))
+        ## COMPLETE DIAGRAM SETUP
+        self.completeDiagram(diagram)
         ## RETURN GENERATED DIAGRAM
         return diagram
 
+    def importDiagramItem(self, d, e):
+        """
+        Create a diagram item (node or edge) from the given QDomElement and add it to the given diagram.
+        :type d: Diagram
+        :type e: QDomElement
+        :rtype: AbstractItem
+        """
+        try:
+            item = self.itemFromXmlNode(e)
+            func = self.importFuncForItem[item]
+            item = func(d, e)
+        except Exception:
+            LOGGER.exception('Failed to create %s %s', e.tagName(), e.attribute('id'))
+            return None
+        else:
+            d.addItem(item)
+            d.guid.update(item.id)
+            self.buffer[d.name][item.id] = item
+            return item
+
     def importMeta(self, e):
         """
         Create predicate metadata from the given QDomElement.
@@ -1354,7 +1393,6 @@ class GrapholLoaderMixin_v2(object):
         :rtype: tuple
         """
         try:
-            QtWidgets.QApplication.processEvents()
             item = self.itemFromXml[e.attribute('type')]
             func = self.importMetaFuncForItem[item]
             meta = func(e)
@@ -1368,6 +1406,44 @@ class GrapholLoaderMixin_v2(object):
     #   AUXILIARY METHODS
     #################################
 
+    def completeDiagram(self, diagram, identities=None):
+        """
+        Complete the setup of a diagram whose items have all been loaded.
+        If the identities of the diagram nodes are given (by node id), they are
+        restored as they are instead of running the identification algorithm.
+        :type diagram: Diagram
+        :type identities: dict
+        """
+        ## IDENTIFY NEUTRAL NODES
+        if identities is not None:
+            for nid, identity in identities.items():
+                node = self.buffer[diagram.name].get(nid)
+                if node:
+                    node.setIdentity(identity)
+        else:
+            nodes = [x for x in diagram.items(edges=False) if Identity.Neutral in x.identities()]
+            if nodes:
+                LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
+                diagram.identifyNodes(nodes)
+        ## CONFIGURE DIAGRAM SIGNALS
+        connect(diagram.sgnItemAdded, self.nproject.doAddItem)
+        connect(diagram.sgnItemRemoved, self.nproject.doRemoveItem)
+        connect(diagram.selectionChanged, self.session.doUpdateState)
+
+    def initDiagram(self, e, i):
+        """
+        Create an empty diagram using the attributes of the given QDomElement.
+        :type e: QDomElement
+        :type i: int
+        :rtype: Diagram
+        """
+        name = e.attribute('name', 'diagram_{0}'.format(i))
+        size = max(int(e.attribute('width', '10000')), int(e.attribute('height', '10000')))
+        LOGGER.info('Loading diagram: %s', name)
+        diagram = Diagram.create(name, size, self.nproject)
+        self.buffer[diagram.name] = dict()
+        return diagram
+
     def itemFromXmlNode(self, e):
         """
         Returns the item matching the given Graphol XML node.
@@ -1408,6 +1484,7 @@ class GrapholLoaderMixin_v2(object):
         version = int(e.attribute('version', '2'))
         if version != 2:
             raise ProjectVersionError('project version mismatch: %s != 2' % version)
+        self.progressTotal = sum(self.document.elementsByTagName(x).count() for x in ('node', 'edge', 'predicate'))
 
     def createPredicatesMeta(self):
         """
@@ -1416,17 +1493,20 @@ class GrapholLoaderMixin_v2(object):
         section = self.document.documentElement().firstChildElement('predicates')
         element = section.firstChildElement('predicate')
         while not element.isNull():
-            QtWidgets.QApplication.processEvents()
             meta = self.importMeta(element)
             if meta:
                 self.nproject.setMeta(meta[0], meta[1], meta[2])
+            self.step()
             element = element.nextSiblingElement('predicate')
 
-    def createProject(self):
+    def createProject(self, section=None):
         """
-        Create the Project by reading data from the parsed QDomDocument.
+        Create the Project by reading data from the given 'ontology' element.
+        If no element is supplied, the 'ontology' section of the parsed QDomDocument is used.
+        :type section: QDomElement
         """
-        section = self.document.documentElement().firstChildElement('ontology')
+        if section is None:
+            section = self.document.documentElement().firstChildElement('ontology')
 
         def parse(tag, default='NULL'):
             """
@@ -1435,7 +1515,6 @@ class GrapholLoaderMixin_v2(object):
             :type default: str
             :rtype: str
             """
-            QtWidgets.QApplication.processEvents()
             subelement = section.firstChildElement(tag)
             if subelement.isNull():
                 LOGGER.warning('Missing tag <%s> in ontology section, using default: %s', tag, default)
@@ -1458,6 +1537,112 @@ class GrapholLoaderMixin_v2(object):
 
         LOGGER.info('Loaded ontology: %s...', self.nproject.name)
 
+    def createProjectFromStream(self):
+        """
+        Create the Project, together with its diagrams and predicate metadata, by incrementally
+        parsing the Graphol document: elements are turned into project items as soon as they are
+        read, so that the whole document never needs to be kept in memory.
+        """
+        counter = 1
+        metas = []
+
+        try:
+            while self.reader.readNextStartElement():
+                tag = self.reader.name()
+                if tag == 'ontology':
+                    section = StreamElement.fromStream(self.reader)
+                    self.createProject(section)
+                    if self.snapshot is not None:
+                        self.snapshot['ontology'] = section.toTuple()
+                elif tag == 'diagrams':
+                    if not self.nproject:
+                        self.createProject(StreamElement())
+                    while self.reader.readNextStartElement():
+                        if self.reader.name() == 'diagram':
+                            self.nproject.addDiagram(self.importDiagramFromStream(counter))
+                            counter += 1
+                        else:
+                            self.reader.skipCurrentElement()
+                elif tag == 'predicates':
+                    if not self.nproject:
+                        self.createProject(StreamElement())
+                    while self.reader.readNextStartElement():
+                        if self.reader.name() == 'predicate':
+                            meta = self.importMeta(StreamElement.fromStream(self.reader))
+                            if meta:
+                                metas.append(meta)
+                        else:
+                            self.reader.skipCurrentElement()
+                        self.step(self.device.pos())
+                else:
+                    self.reader.skipCurrentElement()
+            if self.reader.hasError():
+                raise ProjectNotValidError('invalid project ontology supplied: %s (%s at line %s)' % (
+                    self.path, self.reader.errorString(), self.reader.lineNumber()))
+        finally:
+            self.device.close()
+
+        if not self.nproject:
+            self.createProject(StreamElement())
+
+        # Predicates metadata can be attached only to predicates which are already in the
+        # Project index, and the 'predicates' section precedes the 'diagrams' one.
+        for meta in metas:
+            self.nproject.setMeta(meta[0], meta[1], meta[2])
+        if self.snapshot is not None:
+            self.snapshot['metas'] = metas
+
+    def createProjectFromSnapshot(self, data):
+        """
+        Create the Project using the data stored in a project snapshot.
+        Since the snapshot already holds the parsed document structure and the resolved node
+        identities, this skips both the XML parsing and the node identification passes.
+        :type data: dict
+        """
+        self.progressTotal = sum(len(x[3]) for x in data['diagrams'])
+        if data['ontology']:
+            self.createProject(StreamElement.fromTuple(data['ontology']))
+        else:
+            self.createProject(StreamElement())
+        for i, diagram in enumerate(data['diagrams']):
+            element = StreamElement.fromTuple(diagram)
+            self.nproject.addDiagram(self.importDiagram(element, i + 1, data['identities'][i]))
+        for meta in data['metas']:
+            self.nproject.setMeta(meta[0], meta[1], meta[2])
+
+    def createSnapshot(self):
+        """
+        Returns the data to be stored in the project snapshot, as recorded by the streaming loader.
+        :rtype: dict
+        """
+        identities = []
+        for i, diagram in enumerate(self.snapshot['diagrams']):
+            name = diagram[1].get('name', 'diagram_{0}'.format(i + 1))
+            nodes = self.buffer.get(name, {}).values()
+            identities.append({x.id: x.identity() for x in nodes if x.isNode() and Identity.Neutral in x.identities()})
+        return dict(self.snapshot, identities=identities)
+
+    def createStreamReader(self):
+        """
+        Create the QXmlStreamReader from where to incrementally parse Project information.
+        """
+        if not fexists(self.path):
+            raise ProjectNotFoundError('missing project ontology: %s' % self.path)
+        if File.forPath(self.path) is not File.Graphol:
+            raise ProjectNotValidError('invalid project ontology supplied: %s' % self.path)
+        self.device = QtCore.QFile(self.path)
+        if not self.device.open(QtCore.QIODevice.ReadOnly):
+            raise ProjectNotValidError('invalid project ontology supplied: %s' % self.path)
+        self.progressTotal = self.device.size()
+        self.reader = QtCore.QXmlStreamReader(self.device)
+        if not self.reader.readNextStartElement() or self.reader.name() != 'graphol':
+            self.device.close()
+            raise ProjectNotValidError('invalid project ontology supplied: %s' % self.path)
+        version = int(self.reader.attributes().value('version') or '2')
+        if version != 2:
+            self.device.close()
+            raise ProjectVersionError('project version mismatch: %s != 2' % version)
+
     def projectRender(self):
         """
         Render all the elements in the Project ontology.
@@ -1502,10 +1687,14 @@ class GrapholOntologyLoader_v2(AbstractOntologyLoader, GrapholLoaderMixin_v2):
         """
         Perform ontology import from Graphol file format and merge the loaded ontology with the current project.
         """
-        self.createDomDocument()
-        self.createProject()
-        self.createDiagrams()
-        self.createPredicatesMeta()
+        if self.streaming:
+            self.createStreamReader()
+            self.createProjectFromStream()
+        else:
+            self.createDomDocument()
+            self.createProject()
+            self.createDiagrams()
+            self.createPredicatesMeta()
         self.projectRender()
         self.projectMerge()
 
@@ -1556,13 +1745,32 @@ class GrapholProjectLoader_v2(AbstractProjectLoader, GrapholLoaderMixin_v2):
         """
         Perform project import.
         """
+        snapshot = ProjectSnapshot(self.path) if self.cache else None
+        data = snapshot.load() if snapshot else None
+        if data:
+            LOGGER.info('Loading project from snapshot: %s', snapshot.cachePath)
+            self.createProjectFromSnapshot(data)
+            self.projectRender()
+            self.projectLoaded()
+            return
         try:
-            self.createDomDocument()
+            if self.streaming:
+                self.createStreamReader()
+            else:
+                self.createDomDocument()
         except (ProjectNotFoundError, ProjectVersionError):
             self.createLegacyProject()
         else:
-            self.createProject()
-            self.createDiagrams()
-            self.createPredicatesMeta()
+            if self.streaming:
+                if snapshot:
+                    self.snapshot = {'ontology': None, 'diagrams': [], 'metas': []}
+                self.createProjectFromStream()
+            else:
+                self.createProject()
+                self.createDiagrams()
+                self.createPredicatesMeta()
             self.projectRender()
-            self.projectLoaded()
\ No newline at end of file
+            self.projectLoaded()
+            if self.snapshot is not None:
+                snapshot.save(self.createSnapshot())
+                self.snapshot = None
\ No newline at end of file
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import hashlib
+import io
+import os
+import pickle
+
+from eddy.core.functions.fsystem import fexists, fremove, mkdir
+from eddy.core.functions.path import expandPath
+from eddy.core.output import getLogger
+
+
+LOGGER = getLogger()
+
+
+class ProjectSnapshot(object):
+    """
+    Binary cache of the content of a Graphol project file.
+    The snapshot holds the already parsed document structure together with the information
+    that is expensive to recompute when the project is loaded (e.g: node identities), and it
+    is bound to the exact content of the source file: as soon as the latter changes, the
+    snapshot is considered stale and ignored.
+    """
+    Directory = '@home/cache'
+    Extension = '.snapshot'
+    Limit = 20
+    Version = 2
+
+    def __init__(self, path):
+        """
+        Initialize the snapshot of the given Graphol file.
+        :type path: str
+        """
+        self.path = expandPath(path)
+        name = hashlib.sha1(os.path.abspath(self.path).encode('utf8')).hexdigest()
+        self.cachePath = expandPath(os.path.join(self.Directory, name + self.Extension))
+        self.sourceKey = None
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def digest(self):
+        """
+        Returns the SHA-1 digest of the content of the source file.
+        :rtype: str
+        """
+        digest = hashlib.sha1()
+        with io.open(self.path, 'rb') as ptr:
+            for chunk in iter(lambda: ptr.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def key(self):
+        """
+        Returns the key identifying the current content of the source file.
+        :rtype: tuple
+        """
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size, self.digest()
+
+    def load(self):
+        """
+        Returns the data stored in the snapshot, or None if there is no valid snapshot for the source file.
+        :rtype: dict
+        """
+        if not fexists(self.path):
+            return None
+        # Remember the modification time and the size of the content we are about to load,
+        # so that a snapshot saved after the load is not bound to a file modified in the meantime.
+        stat = os.stat(self.path)
+        self.sourceKey = (stat.st_mtime_ns, stat.st_size)
+        if not fexists(self.cachePath):
+            return None
+        try:
+            with io.open(self.cachePath, 'rb') as ptr:
+                header = pickle.load(ptr)
+                if header[0] != self.Version:
+                    LOGGER.debug('Discarding outdated project snapshot: %s', self.cachePath)
+                    return None
+                key = header[2]
+                # The content of the source file is hashed only when its modification time or its
+                # size do not match anymore, to tell an edited file from one which has been touched.
+                if key[:2] != self.sourceKey and key[2] != self.digest():
+                    LOGGER.debug('Discarding stale project snapshot: %s', self.cachePath)
+                    return None
+                data = pickle.load(ptr)
+        except Exception:
+            LOGGER.exception('Failed to read project snapshot: %s', self.cachePath)
+            return None
+        else:
+            # Mark the snapshot as recently used so that it survives eviction.
+            os.utime(self.cachePath)
+            return data
+
+    @classmethod
+    def prune(cls):
+        """
+        Removes the snapshots whose source file no longer exists, and the least
+        recently used ones exceeding the maximum number of snapshots to keep.
+        """
+        snapshots = []
+        directory = expandPath(cls.Directory)
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name.endswith(cls.Extension):
+                try:
+                    with io.open(path, 'rb') as ptr:
+                        header = pickle.load(ptr)
+                    if header[0] == cls.Version and fexists(header[1]):
+                        snapshots.append((os.stat(path).st_mtime_ns, path))
+                        continue
+                except Exception:
+                    pass
+                LOGGER.debug('Evicting project snapshot: %s', path)
+                fremove(path)
+        for _, path in sorted(snapshots, reverse=True)[cls.Limit:]:
+            LOGGER.debug('Evicting project snapshot: %s', path)
+            fremove(path)
+
+    def remove(self):
+        """
+        Removes the snapshot of the source file, if any.
+        """
+        fremove(self.cachePath)
+
+    def save(self, data):
+        """
+        Store the given data in the snapshot, binding it to the current content of the source file.
+        :type data: dict
+        :rtype: bool
+        """
+        stage = '{0}.{1}'.format(self.cachePath, os.getpid())
+        try:
+            key = self.key()
+            if self.sourceKey and key[:2] != self.sourceKey:
+                LOGGER.debug('Project file modified since it was loaded, skipping snapshot: %s', self.path)
+                return False
+            mkdir(self.Directory)
+            with io.open(stage, 'wb') as ptr:
+                pickle.dump((self.Version, self.path, key), ptr, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, ptr, pickle.HIGHEST_PROTOCOL)
+            os.replace(stage, self.cachePath)
+        except Exception:
+            LOGGER.exception('Failed to write project snapshot: %s', self.cachePath)
+            fremove(stage)
+            return False
+        else:
+            LOGGER.debug('Saved project snapshot: %s', self.cachePath)
+            self.prune()
+            return True
@@ -52,6 +52,7 @@ from eddy.core.functions.misc import first, lstrip, rstrip
 from eddy.core.functions.fsystem import fcopy, fexists, fread, fremove
 from eddy.core.functions.fsystem import isdir, mkdir, rmdir
 from eddy.core.functions.path import expandPath, isSubPath
+from eddy.core.functions.signals import connect
 from eddy.core.output import getLogger
 
 
@@ -61,9 +62,15 @@ LOGGER = getLogger()
 class AbstractPlugin(QtCore.QObject, HasActionSystem, HasMenuSystem, HasWidgetSystem):
     """
     Extension QtCore.QObject which implements a plugin.
+    Plugins whose widgets reflect the state of the project can mark themselves as dirty (see
+    AbstractPlugin.scheduleRefresh) rather than rebuilding the widgets on every notification: the
+    refresh hook is then executed once, when control returns to the event loop (or, if RefreshInterval
+    is set, at most once every RefreshInterval milliseconds), no matter how many times it was requested.
     """
     __metaclass__ = ABCMeta
 
+    RefreshInterval = 0
+
     def __init__(self, spec, session):
         """
         Initialize the plugin.
@@ -72,6 +79,11 @@ class AbstractPlugin(QtCore.QObject, HasActionSystem, HasMenuSystem, HasWidgetSy
         """
         super().__init__(session)
         self.spec = spec
+        self.dirty = False
+        self.refreshTimer = QtCore.QTimer(self)
+        self.refreshTimer.setInterval(self.RefreshInterval)
+        self.refreshTimer.setSingleShot(True)
+        connect(self.refreshTimer.timeout, self.doRefresh)
 
     #############################################
     #   PROPERTIES
@@ -93,6 +105,20 @@ class AbstractPlugin(QtCore.QObject, HasActionSystem, HasMenuSystem, HasWidgetSy
         """
         return self.parent()
 
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def doRefresh(self):
+        """
+        Refresh the plugin right away if it has been marked as dirty.
+        """
+        self.refreshTimer.stop()
+        if self.dirty:
+            self.dirty = False
+            self.refresh()
+
     #############################################
     #   INTERFACE
     #################################
@@ -149,6 +175,14 @@ class AbstractPlugin(QtCore.QObject, HasActionSystem, HasMenuSystem, HasWidgetSy
         root = expandPath('@plugins/' if self.isBuiltIn() else '@home/plugins/')
         return os.path.join(root, home)
 
+    def scheduleRefresh(self):
+        """
+        Mark the plugin as dirty, scheduling the execution of the refresh hook.
+        """
+        self.dirty = True
+        if not self.refreshTimer.isActive():
+            self.refreshTimer.start()
+
     @classmethod
     def subclasses(cls):
         """
@@ -174,6 +208,12 @@ class AbstractPlugin(QtCore.QObject, HasActionSystem, HasMenuSystem, HasWidgetSy
         """
         pass
 
+    def refresh(self):
+        """
+        Executed to bring the plugin widgets up to date after the plugin has been marked as dirty.
+        """
+        pass
+
     def start(self):
         """
         Executed whenever the plugin is to be started, after all the plugins have been loaded.
@@ -314,6 +354,7 @@ class PluginManager(QtCore.QObject):
         :rtype: bool
         """
         LOGGER.info('Disposing plugin: %s v%s', plugin.name(), plugin.version())
+        plugin.refreshTimer.stop()
         try:
             plugin.dispose()
         except Exception:
@@ -34,6 +34,7 @@
 
 
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 
 from PyQt5 import QtCore
 
@@ -44,16 +45,30 @@ from eddy.core.profiles.rules.common import ProfileNodeRule
 class AbstractProfile(QtCore.QObject):
     """
     Extends QObject providing the base class for all the ontology profiles.
+    Validation rules are dispatched according to the types of the validated items: the rules
+    matching a given (source, edge, target) or node type combination are computed the first time
+    such a combination is validated, and looked up in a table from then on.
+    Validation results are kept in a LRU cache keyed by the identity of the validated items together
+    with the revision of the validated nodes, so that validating the same triple again (e.g: while
+    hovering back and forth over nodes during edge insertion) costs a dictionary lookup, while any
+    change to the connections, identity or label of the involved nodes (or of their neighbours)
+    makes the stored result unreachable. Since node revisions are never reused, the cache holds
+    no reference to the validated items and stale entries are simply evicted.
     """
     __metaclass__ = ABCMeta
 
+    CacheSize = 4096
+
     def __init__(self, project=None):
         """
         Initialize the profile.
         :type project: Project
         """
         super().__init__(project)
+        self._cache = OrderedDict()
+        self._edgeDispatch = {}
         self._edgeRules = []
+        self._nodeDispatch = {}
         self._nodeRules = []
         self._pvr = None
 
@@ -88,6 +103,7 @@ class AbstractProfile(QtCore.QObject):
         """
         if issubclass(rule, ProfileEdgeRule):
             self._edgeRules.append(rule(*args, **kwargs))
+            self._edgeDispatch.clear()
 
     def addNodeRule(self, rule, *args, **kwargs):
         """
@@ -96,6 +112,18 @@ class AbstractProfile(QtCore.QObject):
         """
         if issubclass(rule, ProfileNodeRule):
             self._nodeRules.append(rule(*args, **kwargs))
+            self._nodeDispatch.clear()
+
+    def cached(self, key):
+        """
+        Returns the validation outcome (valid, message) stored in the cache for the given key, or None if no outcome is found.
+        :type key: tuple
+        :rtype: tuple
+        """
+        outcome = self._cache.get(key)
+        if outcome is not None:
+            self._cache.move_to_end(key)
+        return outcome
 
     def checkEdge(self, source, edge, target):
         """
@@ -108,20 +136,23 @@ class AbstractProfile(QtCore.QObject):
         :type target: AbstractNode
         :rtype: AbstractProfileValidationResult
         """
-        if not self.pvr() or (source, edge, target) not in self.pvr():
-
+        key = (id(source), source.revision, id(edge), edge.type(), id(target), target.revision)
+        outcome = self.cached(key)
+        if outcome is None:
             try:
                 for node in (source, target):
-                    for r in self.nodeRules():
+                    for r in self.nodeRulesFor(node):
                         r(node)
-                for r in self.edgeRules():
+                for r in self.edgeRulesFor(source, edge, target):
                     r(source, edge, target)
             except ProfileError as e:
-                self.setPvr(ProfileValidationResult((source, edge, target), False, e.msg))
+                outcome = (False, e.msg)
             else:
-                self.setPvr(ProfileValidationResult((source, edge, target), True))
-
-        return self.pvr()
+                outcome = (True, '')
+            self.store(key, outcome)
+        pvr = ProfileValidationResult((source, edge, target), *outcome)
+        self.setPvr(pvr)
+        return pvr
 
     def checkNode(self, node):
         """
@@ -129,17 +160,20 @@ class AbstractProfile(QtCore.QObject):
         :type node: AbstractNode
         :rtype: ProfileValidationResult
         """
-        if not self.pvr() or node not in self.pvr():
-
+        key = (id(node), node.revision)
+        outcome = self.cached(key)
+        if outcome is None:
             try:
-                for r in self.nodeRules():
+                for r in self.nodeRulesFor(node):
                     r(node)
             except ProfileError as e:
-                self.setPvr(ProfileValidationResult(node, False, e.msg))
+                outcome = (False, e.msg)
             else:
-                self.setPvr(ProfileValidationResult(node, True))
-
-        return self.pvr()
+                outcome = (True, '')
+            self.store(key, outcome)
+        pvr = ProfileValidationResult(node, *outcome)
+        self.setPvr(pvr)
+        return pvr
 
     def edgeRules(self):
         """
@@ -148,6 +182,21 @@ class AbstractProfile(QtCore.QObject):
         """
         return self._edgeRules
 
+    def edgeRulesFor(self, source, edge, target):
+        """
+        Returns the edge rules of this Profile which apply to the given triple.
+        :type source: AbstractNode
+        :type edge: AbstractEdge
+        :type target: AbstractNode
+        :rtype: tuple
+        """
+        key = (source.type(), edge.type(), target.type())
+        try:
+            return self._edgeDispatch[key]
+        except KeyError:
+            rules = self._edgeDispatch[key] = tuple(r for r in self._edgeRules if r.matches(*key))
+            return rules
+
     @classmethod
     def name(cls):
         """
@@ -164,6 +213,19 @@ class AbstractProfile(QtCore.QObject):
         """
         return self._nodeRules
 
+    def nodeRulesFor(self, node):
+        """
+        Returns the node rules of this Profile which apply to the given node.
+        :type node: AbstractNode
+        :rtype: tuple
+        """
+        key = node.type()
+        try:
+            return self._nodeDispatch[key]
+        except KeyError:
+            rules = self._nodeDispatch[key] = tuple(r for r in self._nodeRules if r.matches(key))
+            return rules
+
     def objectName(self):
         """
         Returns the system name of the profile.
@@ -191,6 +253,16 @@ class AbstractProfile(QtCore.QObject):
         """
         self._pvr = pvr
 
+    def store(self, key, outcome):
+        """
+        Store the given validation outcome in the cache, evicting the least recently used one if the cache is full.
+        :type key: tuple
+        :type outcome: tuple
+        """
+        self._cache[key] = outcome
+        if len(self._cache) > self.CacheSize:
+            self._cache.popitem(last=False)
+
     @classmethod
     @abstractmethod
     def type(cls):
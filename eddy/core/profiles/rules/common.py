@@ -53,9 +53,29 @@ class ProfileRule(object):
 class ProfileEdgeRule(ProfileRule):
     """
     Extends built-in object providing the base class for all the edge validation rules.
+    Rules can declare the types of the edges (EdgeTypes), of the source nodes (SourceTypes) and of
+    the target nodes (TargetTypes) they apply to, so that profiles can skip them when validating
+    triples they have nothing to say about: None (the default) matches items of any type.
     """
     __metaclass__ = ABCMeta
 
+    EdgeTypes = None
+    SourceTypes = None
+    TargetTypes = None
+
+    @classmethod
+    def matches(cls, source, edge, target):
+        """
+        Returns True if the rule applies to triples made of items of the given types, False otherwise.
+        :type source: Item
+        :type edge: Item
+        :type target: Item
+        :rtype: bool
+        """
+        return (cls.EdgeTypes is None or edge in cls.EdgeTypes) and \
+               (cls.SourceTypes is None or source in cls.SourceTypes) and \
+               (cls.TargetTypes is None or target in cls.TargetTypes)
+
     @abstractmethod
     def __call__(self, source, edge, target):
         """
@@ -70,9 +90,22 @@ class ProfileEdgeRule(ProfileRule):
 class ProfileNodeRule(ProfileRule):
     """
     Extends built-in object providing the base class for all the node validation rules.
+    Rules can declare the types of the nodes they apply to (NodeTypes), so that profiles can
+    skip them when validating nodes of other types: None (the default) matches nodes of any type.
     """
     __metaclass__ = ABCMeta
 
+    NodeTypes = None
+
+    @classmethod
+    def matches(cls, node):
+        """
+        Returns True if the rule applies to nodes of the given type, False otherwise.
+        :type node: Item
+        :rtype: bool
+        """
+        return cls.NodeTypes is None or node in cls.NodeTypes
+
     @abstractmethod
     def __call__(self, node):
         """
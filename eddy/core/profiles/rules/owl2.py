@@ -46,6 +46,8 @@ class EquivalenceBetweenExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an equivalence edge is traced only between graphol expressions.
     """
+    EdgeTypes = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             supported = {Identity.Concept, Identity.Role, Identity.Attribute, Identity.ValueDomain}
@@ -64,6 +66,8 @@ class EquivalenceBetweenCompatibleExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an equivalence edge is traced only between compatible Graphol expressions.
     """
+    EdgeTypes = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.EquivalenceEdge:
@@ -81,6 +85,8 @@ class EquivalenceBetweenValueDomainExpressionsRule(ProfileEdgeRule):
     """
     Prevents equivalence edges from being traced between Value-domain expressions.
     """
+    EdgeTypes = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Identity.ValueDomain in {source.identity(), target.identity()}:
@@ -92,6 +98,8 @@ class EquivalenceBetweenRoleExpressionAndComplementRule(ProfileEdgeRule):
     """
     Prevents equivalence edges from being traced between a Role expression and a Complement node.
     """
+    EdgeTypes = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Identity.Role in {source.identity(), target.identity()}:
@@ -104,6 +112,8 @@ class EquivalenceBetweenAttributeExpressionAndComplementRule(ProfileEdgeRule):
     """
     Prevents equivalence edges from being traced between an Attribute expression and a Complement node.
     """
+    EdgeTypes = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Identity.Attribute in {source.identity(), target.identity()}:
@@ -116,6 +126,8 @@ class EquivalenceBetweenRoleExpressionAndRoleChainRule(ProfileEdgeRule):
     """
     Make sure that equivalence edges are never traced in presence of a Role chain node.
     """
+    EdgeTypes = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Item.RoleChainNode in {source.type(), target.type()}:
@@ -129,6 +141,8 @@ class InclusionBetweenExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an inclusion edge is traced only between graphol expressions.
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InclusionEdge:
             supported = {Identity.Concept, Identity.Role, Identity.Attribute, Identity.ValueDomain}
@@ -147,6 +161,8 @@ class InclusionBetweenCompatibleExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an inclusion edge is traced only between compatible Graphol expressions.
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InclusionEdge:
@@ -166,6 +182,8 @@ class InclusionBetweenValueDomainExpressionsRule(ProfileEdgeRule):
     """
     Prevents inclusion edged from being traced between Value-domain expressions.
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InclusionEdge:
             if Identity.ValueDomain in {source.identity(), target.identity()}:
@@ -183,6 +201,8 @@ class InclusionBetweenRoleExpressionAndComplementNodeRule(ProfileEdgeRule):
     """
     Prevents inclusion edges sourcing from Complement nodes to target Role expressions.
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -213,6 +233,8 @@ class InclusionBetweenAttributeExpressionAndComplementNodeRule(ProfileEdgeRule):
     """
     Prevents inclusion edges sourcing from Complement nodes to target Attribute expressions.
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -243,6 +265,8 @@ class InclusionBetweenRoleExpressionAndRoleChainNodeRule(ProfileEdgeRule):
     """
     Make sure that inclusion edges sourcing from Role chain nodes target only Role expressions.
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InclusionEdge:
@@ -264,6 +288,8 @@ class InputToConstructorNodeRule(ProfileEdgeRule):
     """
     Make sure that input edges only target constructor nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if not target.isConstructor():
@@ -278,6 +304,9 @@ class InputToComplementNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Complement nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.ComplementNode}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InputEdge:
@@ -314,10 +343,9 @@ class InputToComplementNodeRule(ProfileEdgeRule):
                     # DataPropertyRange axiom.
                     f1 = lambda x: x.type() is Item.InputEdge and x is not edge
                     f2 = lambda x: x.identity() is Identity.Neutral
-                    f3 = lambda x: x.type() is Item.InclusionEdge
                     f4 = lambda x: x.type() is Item.InclusionEdge and x.source.type() is not Item.RangeRestrictionNode
                     for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
-                        if node.outgoingNodes(filter_on_edges=f3) or node.incomingNodes(filter_on_edges=f4):
+                        if node.outgoingNodes(filter_on_types={Item.InclusionEdge}) or node.incomingNodes(filter_on_edges=f4):
                             raise ProfileError('Type mismatch: inclusion between value-domain expressions')
 
 
@@ -325,6 +353,9 @@ class InputToIntersectionOrUnionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting either Intersection or (Disjoint)Union nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.IntersectionNode, Item.UnionNode, Item.DisjointUnionNode}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InputEdge:
@@ -362,10 +393,9 @@ class InputToIntersectionOrUnionNodeRule(ProfileEdgeRule):
                     # DataPropertyRange axiom.
                     f1 = lambda x: x.type() is Item.InputEdge and x is not edge
                     f2 = lambda x: x.identity() is Identity.Neutral
-                    f3 = lambda x: x.type() is Item.InclusionEdge
                     f4 = lambda x: x.type() is Item.InclusionEdge and x.source.type() is not Item.RangeRestrictionNode
                     for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
-                        if node.outgoingNodes(filter_on_edges=f3) or node.incomingNodes(filter_on_edges=f4):
+                        if node.outgoingNodes(filter_on_types={Item.InclusionEdge}) or node.incomingNodes(filter_on_edges=f4):
                             raise ProfileError('Type mismatch: inclusion between value-domain expressions')
 
 
@@ -373,6 +403,9 @@ class InputToEnumerationNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Enumeration nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.EnumerationNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -393,10 +426,9 @@ class InputToEnumerationNodeRule(ProfileEdgeRule):
                     if source.identity() is Identity.Value and target.identity() is Identity.Concept:
                         raise ProfileError('Invalid input to {}: {}'.format(target.name, source.identityName))
 
-                f1 = lambda x: x.type() is Item.InputEdge
                 f2 = lambda x: x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
                 f3 = lambda x: x.type() is Item.InputEdge and x is not edge
-                node = first(target.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                node = first(target.outgoingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
                 if node:
                     # If this Enumeration node is acting as filler for a domain/range restriction
                     # we need to check for the Enumeration node to have at most one input.
@@ -408,6 +440,9 @@ class InputToRoleInverseNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Role Inverse nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.RoleInverseNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -431,6 +466,9 @@ class InputToRoleChainNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Role Chain nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.RoleChainNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -452,6 +490,9 @@ class InputToDatatypeRestrictionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Role Chain nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.DatatypeRestrictionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -475,9 +516,8 @@ class InputToDatatypeRestrictionNodeRule(ProfileEdgeRule):
                     # Check if a Facet node is already connected to this node: if
                     # so we need to check whether the datatype in input and the
                     # already connected Facet are compatible.
-                    f1 = lambda x: x.type() is Item.InputEdge
                     f2 = lambda x: x.type() is Item.FacetNode
-                    node = first(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                    node = first(target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
                     if node:
                         if node.facet not in Facet.forDatatype(source.datatype):
                             nA = source.datatype.value
@@ -489,9 +529,8 @@ class InputToDatatypeRestrictionNodeRule(ProfileEdgeRule):
                     # We need to check if the DatatypeRestriction node has already datatype
                     # connected: if that's the case we need to check whether the Facet we
                     # want to attach to the datatype restriction node supports it.
-                    f1 = lambda x: x.type() is Item.InputEdge
                     f2 = lambda x: x.type() is Item.ValueDomainNode
-                    node = first(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                    node = first(target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2))
                     if node:
                         if source.facet not in Facet.forDatatype(node.datatype):
                             nA = source.facet.value
@@ -503,6 +542,9 @@ class InputToPropertyAssertionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Property Assertion nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.PropertyAssertionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -550,6 +592,9 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Domain Restriction nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.DomainRestrictionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -677,6 +722,9 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Range Restriction nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.RangeRestrictionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -793,6 +841,9 @@ class InputToFacetNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Facet nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.FacetNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.FacetNode:
@@ -803,6 +854,8 @@ class MembershipFromAssertionCompatibleNodeRule(ProfileEdgeRule):
     """
     Make sure that membership assertion edges source from either Individual or Property Assertion nodes.
     """
+    EdgeTypes = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is not Identity.Individual and source.type() is not Item.PropertyAssertionNode:
@@ -814,6 +867,8 @@ class MembershipFromIndividualRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from Individuals.
     """
+    EdgeTypes = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is Identity.Individual:
@@ -828,6 +883,8 @@ class MembershipFromRoleInstanceRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from a Role Instance.
     """
+    EdgeTypes = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.MembershipEdge:
@@ -870,6 +927,8 @@ class MembershipFromAttributeInstanceRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from an Attribute Instance.
     """
+    EdgeTypes = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.MembershipEdge:
@@ -902,6 +961,9 @@ class MembershipFromNeutralPropertyAssertionRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from Neutral Property Assertion nodes.
     """
+    EdgeTypes = {Item.MembershipEdge}
+    SourceTypes = {Item.PropertyAssertionNode}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.MembershipEdge:
@@ -951,6 +1013,8 @@ class CardinalityRestrictionNodeRule(ProfileNodeRule):
     """
     Make sure that the cardinality specified is consistent.
     """
+    NodeTypes = {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
+
     def __call__(self, node):
         if node.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
             if node.restriction() is Restriction.Cardinality:
@@ -45,6 +45,8 @@ class UnsupportedDatatypeRule(ProfileNodeRule):
     """
     Prevents from using datatypes which are outside of the OWL 2 QL profile.
     """
+    NodeTypes = {Item.ValueDomainNode}
+
     def __call__(self, node):
         if node.type() is Item.ValueDomainNode:
             if node.datatype not in Datatype.forProfile(OWLProfile.OWL2QL):
@@ -55,6 +57,8 @@ class UnsupportedOperatorRule(ProfileNodeRule):
     """
     Prevents from using operator nodes which are not supported by the OWL 2 QL profile.
     """
+    NodeTypes = {Item.UnionNode, Item.DisjointUnionNode, Item.DatatypeRestrictionNode, Item.FacetNode, Item.EnumerationNode, Item.RoleChainNode}
+
     def __call__(self, node):
         if node.type() in {Item.UnionNode, Item.DisjointUnionNode,
             Item.DatatypeRestrictionNode, Item.FacetNode,
@@ -66,6 +70,8 @@ class EquivalenceBetweenConceptExpressionRule(ProfileEdgeRule):
     """
     Make sure that equivalence edges are not from/to intersection or complement nodes.
     """
+    EdgeTypes = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             # Similarily as for the Inclusion edge, here we deny the equivalence in presence
@@ -86,6 +92,8 @@ class InclusionBetweenConceptExpressionRule(ProfileEdgeRule):
     """
     Make sure that inclusion edges do not source from intersection or complement nodes.
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InclusionEdge:
             # We need to prevent inclusions sourcing from Complement nodes and Intersection nodes.
@@ -107,6 +115,9 @@ class InputConceptToRestrictionNodeRule(ProfileEdgeRule):
     """
     Make sure to construct qualified Role domain/range restrictions using only atomic Concept nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
@@ -132,6 +143,9 @@ class InputValueDomainToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of complement of value-domain expressions.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.ComplementNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.ComplementNode:
@@ -144,6 +158,9 @@ class InputValueDomainToIntersectionNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of intersection of value-domains which are given in input to complement nodes.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.IntersectionNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.IntersectionNode:
@@ -162,6 +179,9 @@ class MembershipFromAttributeInstanceToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of NegativeDataPropertyAssertion axioms.
     """
+    EdgeTypes = {Item.MembershipEdge}
+    TargetTypes = {Item.ComplementNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is Identity.AttributeInstance:
@@ -173,6 +193,9 @@ class MembershipFromRoleInstanceToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of NegativeObjectPropertyAssertion axioms.
     """
+    EdgeTypes = {Item.MembershipEdge}
+    TargetTypes = {Item.ComplementNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is Identity.RoleInstance:
@@ -184,6 +207,10 @@ class MembershipFromPropertyAssertionToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of NegativeObjectPropertyAssertion and NegativeDataPropertyAssertion axioms.
     """
+    EdgeTypes = {Item.MembershipEdge}
+    SourceTypes = {Item.PropertyAssertionNode}
+    TargetTypes = {Item.ComplementNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.type() is Item.PropertyAssertionNode:
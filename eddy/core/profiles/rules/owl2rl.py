@@ -44,6 +44,8 @@ class UnsupportedDatatypeRule(ProfileNodeRule):
     """
     Prevents from using datatypes which are outside of the OWL 2 RL profile.
     """
+    NodeTypes = {Item.ValueDomainNode}
+
     def __call__(self, node):
         if node.type() is Item.ValueDomainNode:
             if node.datatype not in Datatype.forProfile(OWLProfile.OWL2RL):
@@ -54,6 +56,8 @@ class UnsupportedOperatorRule(ProfileNodeRule):
     """
     Prevents from using operator nodes which are not supported by the OWL 2 RL profile.
     """
+    NodeTypes = {Item.DatatypeRestrictionNode, Item.FacetNode}
+
     def __call__(self, node):
         if node.type() in {Item.DatatypeRestrictionNode, Item.FacetNode}:
             raise ProfileError('Usage of {} operator is forbidden in OWL 2 RL'.format(node.shortName))
@@ -63,6 +67,8 @@ class UnsupportedSpecialOnRoleAndAttributeNode(ProfileNodeRule):
     """
     Make sure that TOP and BOTTOM are not used in Role and Attribute nodes.
     """
+    NodeTypes = {Item.AttributeNode, Item.RoleNode}
+
     def __call__(self, node):
         if node.type() in {Item.AttributeNode, Item.RoleNode}:
             if Special.valueOf(node.text()) is not None:
@@ -74,6 +80,8 @@ class EquivalenceBetweenConceptExpressionRule(ProfileEdgeRule):
     Make sure that equivalence edges are traced according to OWL 2 RL subClass and superClass definition.
     More information: https://www.w3.org/TR/owl2-profiles/
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -96,9 +104,8 @@ class EquivalenceBetweenConceptExpressionRule(ProfileEdgeRule):
                         raise ProfileError('Equivalence in presence of a union of concept expressions is forbidden in OWL 2 RL')
                     # Domain/range restriction cannot be part of concept equivalence in OWL 2 RL.
                     elif node.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
-                        f1 = lambda x: x.type() is Item.InputEdge
                         f2 = lambda x: x.type() is Item.EnumerationNode
-                        if not node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        if not node.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
                             raise ProfileError('Existential {} must specify an Enumeration as filler when involved '
                                                'in an equivalence between concept expressions in OWL 2 RL'.format(target.shortName))
 
@@ -108,6 +115,8 @@ class InclusionBetweenConceptExpressionRule(ProfileEdgeRule):
     Make sure that inclusion edges are traced according to OWL 2 RL subClass and superClass definition.
     More information: https://www.w3.org/TR/owl2-profiles/
     """
+    EdgeTypes = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -152,9 +161,8 @@ class InclusionBetweenConceptExpressionRule(ProfileEdgeRule):
                 elif target.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
                     if target.restriction() is Restriction.Exists:
                         # We need to check for the restriction to have a an Enumeration as filler.
-                        f1 = lambda x: x.type() is Item.InputEdge
                         f2 = lambda x: x.type() is Item.EnumerationNode
-                        if not target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        if not target.incomingNodes(filter_on_types={Item.InputEdge}, filter_on_nodes=f2):
                             raise ProfileError('Existential {} must specify an Enumeration as filler when acting as '
                                                'target for a concept expression inclusion in OWL 2 RL'.format(target.shortName))
                     elif target.restriction() is Restriction.Cardinality:
@@ -167,6 +175,9 @@ class InputValueToEnumerationNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of value-domain expression composed of a oneOf of values.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.EnumerationNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.EnumerationNode:
@@ -178,6 +189,9 @@ class InputValueDomainToUnionNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of union of value domain expressions.
     """
+    EdgeTypes = {Item.InputEdge}
+    TargetTypes = {Item.DisjointUnionNode, Item.UnionNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() in {Item.DisjointUnionNode, Item.UnionNode}:
@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+from collections.abc import Set
+
 from PyQt5 import QtCore
 
 from eddy.core.commands.diagram import CommandDiagramAdd
@@ -42,6 +44,7 @@ from eddy.core.functions.owl import OWLText
 from eddy.core.functions.path import expandPath
 from eddy.core.functions.signals import connect, disconnect
 from eddy.core.output import getLogger
+from eddy.core.validation import SyntaxValidator
 
 from eddy.ui.resolvers import PredicateBooleanConflictResolver
 from eddy.ui.resolvers import PredicateDocumentationConflictResolver
@@ -109,6 +112,10 @@ class Project(QtCore.QObject):
         :type kwargs: dict
         """
         super().__init__(kwargs.get('session'))
+        self.dirtyDiagrams = set() # MODIFIED SINCE THEY WERE LAST COLLECTED FOR A SAVE
+        self.dirtyMetas = set()
+        self.savingDiagrams = set() # COLLECTED FOR A SAVE WHICH IS NOT COMPLETED YET
+        self.savingMetas = set()
         self.index = ProjectIndex()
         self.iri = kwargs.get('iri', 'NULL')
         self.name = kwargs.get('name')
@@ -116,6 +123,7 @@ class Project(QtCore.QObject):
         self.prefix = kwargs.get('prefix', 'NULL')
         self.profile = kwargs.get('profile')
         self.profile.setParent(self)
+        self.validator = SyntaxValidator(self)
         self.version = kwargs.get('version', '1.0')
 
     #############################################
@@ -140,6 +148,8 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         """
         if self.index.addDiagram(diagram):
+            self.dirtyDiagrams.add(diagram)
+            connect(diagram.sgnUpdated, self.onDiagramUpdated)
             self.sgnDiagramAdded.emit(diagram)
             for item in diagram.items():
                 if item.isNode() or item.isEdge():
@@ -172,9 +182,9 @@ class Project(QtCore.QObject):
     def edges(self, diagram=None):
         """
         Returns a collection with all the edges in the given diagram.
-        If no diagram is supplied a collection with all the edges in the Project will be returned.
+        If no diagram is supplied a read-only view of all the edges in the Project will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: set|ProjectIndexView
         """
         return self.index.edges(diagram)
 
@@ -207,9 +217,9 @@ class Project(QtCore.QObject):
     def items(self, diagram=None):
         """
         Returns a collection with all the items in the given diagram.
-        If no diagram is supplied a collection with all the items in the Project will be returned.
+        If no diagram is supplied a read-only view of all the items in the Project will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: set|ProjectIndexView
         """
         return self.index.items(diagram)
 
@@ -242,9 +252,9 @@ class Project(QtCore.QObject):
     def nodes(self, diagram=None):
         """
         Returns a collection with all the nodes in the given diagram.
-        If no diagram is supplied a collection with all the nodes in the Project will be returned.
+        If no diagram is supplied a read-only view of all the nodes in the Project will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: set|ProjectIndexView
         """
         return self.index.nodes(diagram)
 
@@ -277,6 +287,8 @@ class Project(QtCore.QObject):
         if self.index.removeDiagram(diagram):
             for item in self.items(diagram):
                 diagram.sgnItemRemoved.emit(diagram, item)
+            disconnect(diagram.sgnUpdated, self.onDiagramUpdated)
+            self.dirtyDiagrams.discard(diagram)
             self.sgnDiagramRemoved.emit(diagram)
 
     def setMeta(self, item, name, meta):
@@ -287,8 +299,38 @@ class Project(QtCore.QObject):
         :type meta: dict
         """
         if self.index.setMeta(item, name, meta):
+            self.dirtyMetas.add((item, OWLText(name)))
             self.sgnMetaAdded.emit(item, name)
 
+    def setClean(self):
+        """
+        Mark the Project as saved: the diagrams and predicate metadata collected by the
+        save in progress (see setSaving) are not considered modified anymore.
+        """
+        self.savingDiagrams.clear()
+        self.savingMetas.clear()
+
+    def setDirty(self):
+        """
+        Mark the save in progress (see setSaving) as failed: the diagrams and predicate
+        metadata it collected are considered modified again.
+        """
+        self.dirtyDiagrams |= self.savingDiagrams
+        self.dirtyMetas |= self.savingMetas
+        self.savingDiagrams.clear()
+        self.savingMetas.clear()
+
+    def setSaving(self):
+        """
+        Mark the Project as being saved: the diagrams and predicate metadata modified so far have
+        been collected, and they are considered modified until the save either completes (see setClean)
+        or fails (see setDirty). Modifications performed in the meantime are tracked as usual.
+        """
+        self.savingDiagrams |= self.dirtyDiagrams
+        self.savingMetas |= self.dirtyMetas
+        self.dirtyDiagrams.clear()
+        self.dirtyMetas.clear()
+
     def unsetMeta(self, item, name):
         """
         Remove metadata for the given predicate type/name combination.
@@ -296,6 +338,7 @@ class Project(QtCore.QObject):
         :type name: str
         """
         if self.index.unsetMeta(item, name):
+            self.dirtyMetas.add((item, OWLText(name)))
             self.sgnMetaRemoved.emit(item, name)
 
     #############################################
@@ -310,6 +353,7 @@ class Project(QtCore.QObject):
         :type item: AbstractItem
         """
         if self.index.addItem(diagram, item):
+            self.dirtyDiagrams.add(diagram)
             self.sgnItemAdded.emit(diagram, item)
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
@@ -321,12 +365,22 @@ class Project(QtCore.QObject):
         :type item: AbstractItem
         """
         if self.index.removeItem(diagram, item):
+            self.dirtyDiagrams.add(diagram)
             self.sgnItemRemoved.emit(diagram, item)
 
+    @QtCore.pyqtSlot()
+    def onDiagramUpdated(self):
+        """
+        Executed whenever a diagram belonging to this Project is updated.
+        """
+        self.dirtyDiagrams.add(self.sender())
+
 
 class ProjectIndex(dict):
     """
     Extends built-in dict and implements the Project index.
+    Aggregate figures (number of items and predicates of each type) and the collections
+    spanning all the diagrams are kept up to date by addItem/removeItem.
     """
     def __init__(self):
         """
@@ -339,6 +393,9 @@ class ProjectIndex(dict):
         self[K_NODE] = dict()
         self[K_PREDICATE] = dict()
         self[K_TYPE] = dict()
+        self.itemCount = dict() # {Item: int}
+        self.predicateCount = dict() # {str: {Item: int}}
+        self.views = {K_EDGE: set(), K_ITEMS: set(), K_NODE: set()}
 
     def addDiagram(self, diagram):
         """
@@ -368,10 +425,13 @@ class ProjectIndex(dict):
             if i not in self[K_TYPE][diagram.name]:
                 self[K_TYPE][diagram.name][i] = set()
             self[K_TYPE][diagram.name][i] |= {item}
+            self.itemCount[i] = self.itemCount.get(i, 0) + 1
+            self.views[K_ITEMS].add(item)
             if item.isNode():
                 if diagram.name not in self[K_NODE]:
                     self[K_NODE][diagram.name] = dict()
                 self[K_NODE][diagram.name][item.id] = item
+                self.views[K_NODE].add(item)
                 if item.isPredicate():
                     k = OWLText(item.text())
                     if i not in self[K_PREDICATE]:
@@ -380,11 +440,15 @@ class ProjectIndex(dict):
                         self[K_PREDICATE][i][k] = {K_NODE: dict()}
                     if diagram.name not in self[K_PREDICATE][i][k][K_NODE]:
                         self[K_PREDICATE][i][k][K_NODE][diagram.name] = set()
+                        if diagram.name not in self.predicateCount:
+                            self.predicateCount[diagram.name] = dict()
+                        self.predicateCount[diagram.name][i] = self.predicateCount[diagram.name].get(i, 0) + 1
                     self[K_PREDICATE][i][k][K_NODE][diagram.name] |= {item}
             if item.isEdge():
                 if diagram.name not in self[K_EDGE]:
                     self[K_EDGE][diagram.name] = dict()
                 self[K_EDGE][diagram.name][item.id] = item
+                self.views[K_EDGE].add(item)
             return True
         return False
 
@@ -421,13 +485,13 @@ class ProjectIndex(dict):
     def edges(self, diagram=None):
         """
         Returns a collection with all the edges in the given diagram.
-        If no diagram is supplied a collection with all the edges in the Project Index will be returned.
+        If no diagram is supplied a read-only view of all the edges in the Project Index will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: set|ProjectIndexView
         """
         try:
             if not diagram:
-                return set.union(*(set(self[K_EDGE][i].values()) for i in self[K_EDGE]))
+                return self.view(K_EDGE)
             return set(self[K_EDGE][diagram.name].values())
         except (KeyError, TypeError):
             return set()
@@ -463,23 +527,22 @@ class ProjectIndex(dict):
         :rtype: int
         """
         try:
-            subdict = self[K_TYPE]
             if not diagram:
-                return len(set.union(*(subdict[i][item] for i in subdict if item in subdict[i])))
-            return len(subdict[diagram.name][item])
+                return self.itemCount.get(item, 0)
+            return len(self[K_TYPE][diagram.name][item])
         except (KeyError, TypeError):
             return 0
 
     def items(self, diagram=None):
         """
         Returns a collection with all the items in the given diagram.
-        If no diagram is supplied a collection with all the items in the Project Index will be returned.
+        If no diagram is supplied a read-only view of all the items in the Project Index will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: set|ProjectIndexView
         """
         try:
             if not diagram:
-                return set.union(*(set(self[K_ITEMS][i].values()) for i in self[K_ITEMS]))
+                return self.view(K_ITEMS)
             return set(self[K_ITEMS][diagram.name].values())
         except (KeyError, TypeError):
             return set()
@@ -523,13 +586,13 @@ class ProjectIndex(dict):
     def nodes(self, diagram=None):
         """
         Returns a collection with all the nodes in the given diagram.
-        If no diagram is supplied a collection with all the nodes in the Project Index will be returned.
+        If no diagram is supplied a read-only view of all the nodes in the Project Index will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: set|ProjectIndexView
         """
         try:
             if not diagram:
-                return set.union(*(set(self[K_NODE][i].values()) for i in self[K_NODE]))
+                return self.view(K_NODE)
             return set(self[K_NODE][diagram.name].values())
         except (KeyError, TypeError):
             return set()
@@ -543,10 +606,9 @@ class ProjectIndex(dict):
         :rtype: int
         """
         try:
-            subdict = self[K_PREDICATE]
             if not diagram:
-                return len(subdict[item])
-            return len({i for i in subdict[item] if diagram.name in subdict[item][i][K_NODE]})
+                return len(self[K_PREDICATE][item])
+            return self.predicateCount[diagram.name].get(item, 0)
         except (KeyError, TypeError):
             return 0
     
@@ -625,11 +687,15 @@ class ProjectIndex(dict):
         if diagram.name in self[K_ITEMS]:
             if item.id in self[K_ITEMS][diagram.name]:
                 del self[K_ITEMS][diagram.name][item.id]
+                self.views[K_ITEMS].discard(item)
                 if not self[K_ITEMS][diagram.name]:
                     del self[K_ITEMS][diagram.name]
             if diagram.name in self[K_TYPE]:
-                if i in self[K_TYPE][diagram.name]:
+                if item in self[K_TYPE][diagram.name].get(i, ()):
                     self[K_TYPE][diagram.name][i] -= {item}
+                    self.itemCount[i] -= 1
+                    if not self.itemCount[i]:
+                        del self.itemCount[i]
                     if not self[K_TYPE][diagram.name][i]:
                         del self[K_TYPE][diagram.name][i]
                         if not self[K_TYPE][diagram.name]:
@@ -638,6 +704,7 @@ class ProjectIndex(dict):
                 if diagram.name in self[K_NODE]:
                     if item.id in self[K_NODE][diagram.name]:
                         del self[K_NODE][diagram.name][item.id]
+                        self.views[K_NODE].discard(item)
                         if not self[K_NODE][diagram.name]:
                             del self[K_NODE][diagram.name]
                 if item.isPredicate():
@@ -648,6 +715,7 @@ class ProjectIndex(dict):
                                 self[K_PREDICATE][i][k][K_NODE][diagram.name] -= {item}
                                 if not self[K_PREDICATE][i][k][K_NODE][diagram.name]:
                                     del self[K_PREDICATE][i][k][K_NODE][diagram.name]
+                                    self.predicateCount[diagram.name][i] -= 1
                                     if not self[K_PREDICATE][i][k][K_NODE]:
                                         del self[K_PREDICATE][i][k]
                                         if not self[K_PREDICATE][i]:
@@ -656,6 +724,7 @@ class ProjectIndex(dict):
                 if diagram.name in self[K_EDGE]:
                     if item.id in self[K_EDGE][diagram.name]:
                         del self[K_EDGE][diagram.name][item.id]
+                        self.views[K_EDGE].discard(item)
                         if not self[K_EDGE][diagram.name]:
                             del self[K_EDGE][diagram.name]
             return True
@@ -692,6 +761,68 @@ class ProjectIndex(dict):
                     return True
         return False
 
+    def view(self, key):
+        """
+        Returns a read-only view of the elements stored in the given index section over all the diagrams.
+        The view reflects later changes to the index, hence callers that need to modify
+        the Project while iterating over it must take a copy first.
+        :type key: str
+        :rtype: ProjectIndexView
+        """
+        return ProjectIndexView(self.views[key])
+
+
+class ProjectIndexView(Set):
+    """
+    Extends collections.abc.Set to implement a read-only view of a collection kept in the Project index.
+    """
+    __slots__ = ('collection',)
+
+    def __init__(self, collection):
+        """
+        Initialize the view.
+        :type collection: set
+        """
+        self.collection = collection
+
+    def __contains__(self, item):
+        """
+        Returns True if the given item is in the view, False otherwise.
+        :type item: AbstractItem
+        :rtype: bool
+        """
+        return item in self.collection
+
+    def __iter__(self):
+        """
+        Returns an iterator over the items in the view.
+        :rtype: iter
+        """
+        return iter(self.collection)
+
+    def __len__(self):
+        """
+        Returns the number of items in the view.
+        :rtype: int
+        """
+        return len(self.collection)
+
+    def __repr__(self):
+        """
+        Returns repr(self).
+        :rtype: str
+        """
+        return '{0}({1!r})'.format(self.__class__.__name__, self.collection)
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        """
+        Returns the result of set operations (union, difference, ...) as a new frozenset.
+        :type iterable: iter
+        :rtype: frozenset
+        """
+        return frozenset(iterable)
+
 
 class ProjectMergeWorker(QtCore.QObject):
     """
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import json
+
+from PyQt5 import QtCore
+
+from eddy.core.datatypes.graphol import Item, Identity
+from eddy.core.functions.graph import bfs
+from eddy.core.functions.signals import connect, disconnect
+from eddy.core.output import getLogger
+
+
+LOGGER = getLogger()
+
+
+class SyntaxValidator(QtCore.QObject):
+    """
+    Extension of QtCore.QObject which keeps the syntax validation results of a project up to date.
+    The validator stores the result of the validation of every edge and every isolated node of the
+    project: whenever the project is edited, only the items whose validity may be affected by the
+    edit (the edges attached to the modified items and to the nodes whose identity depends on them)
+    are marked as pending, and they are validated again the next time results are requested.
+    Additionally to built-in signals, this class emits:
+
+    * sgnInvalidated: whenever some items are marked as pending validation.
+    """
+    Predicates = {Item.AttributeNode, Item.ConceptNode, Item.RoleNode, Item.ValueDomainNode}
+
+    sgnInvalidated = QtCore.pyqtSignal()
+
+    def __init__(self, project):
+        """
+        Initialize the syntax validator.
+        :type project: Project
+        """
+        super().__init__(project)
+        self.complete = False
+        self.dirty = set()
+        self.profile = None
+        self.results = dict()
+
+        connect(project.sgnDiagramAdded, self.onDiagramAdded)
+        connect(project.sgnDiagramRemoved, self.onDiagramRemoved)
+        connect(project.sgnItemAdded, self.onItemAdded)
+        connect(project.sgnItemRemoved, self.onItemRemoved)
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def project(self):
+        """
+        Returns the project this validator belongs to (alias for SyntaxValidator.parent()).
+        :rtype: Project
+        """
+        return self.parent()
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot('QGraphicsScene')
+    def onDiagramAdded(self, diagram):
+        """
+        Executed whenever a diagram is added to the project.
+        :type diagram: Diagram
+        """
+        connect(diagram.sgnNodeIdentification, self.onNodeIdentification)
+
+    @QtCore.pyqtSlot('QGraphicsScene')
+    def onDiagramRemoved(self, diagram):
+        """
+        Executed whenever a diagram is removed from the project.
+        :type diagram: Diagram
+        """
+        disconnect(diagram.sgnNodeIdentification, self.onNodeIdentification)
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def onItemAdded(self, _, item):
+        """
+        Executed whenever an item is added to the project.
+        :type _: Diagram
+        :type item: AbstractItem
+        """
+        self.invalidate(item)
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def onItemRemoved(self, _, item):
+        """
+        Executed whenever an item is removed from the project.
+        :type _: Diagram
+        :type item: AbstractItem
+        """
+        self.dirty.discard(item)
+        self.results.pop(item, None)
+        if item.isEdge():
+            self.invalidate(item)
+
+    @QtCore.pyqtSlot('QGraphicsItem')
+    def onNodeIdentification(self, node):
+        """
+        Executed whenever the identity of the given node (and of the ones connected to it) needs to be computed.
+        :type node: AbstractNode
+        """
+        self.invalidate(node)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def check(self, item):
+        """
+        Perform the syntax validation of the given item.
+        Returns the message describing the syntax error detected on the item, or None if the item is valid.
+        :type item: AbstractItem
+        :rtype: str
+        """
+        entry = self.entry(item)
+        return entry['description'] if entry else None
+
+    def entry(self, item):
+        """
+        Perform the syntax validation of the given item.
+        Returns the report entry describing the syntax error detected on the item, or None if the item is valid.
+        :type item: AbstractItem
+        :rtype: dict
+        """
+        if item.isEdge():
+            source = item.source
+            target = item.target
+            pvr = self.project.profile.checkEdge(source, item, target)
+            if not pvr.isValid():
+                s = '{} <b>({})</b>'.format(source.name, source.id)
+                t = '{} <b>({})</b>'.format(target.name, target.id)
+                if source.type() in self.Predicates:
+                    s = '{} <b>{} ({})</b>'.format(source.name, source.text(), source.id)
+                if target.type() in self.Predicates:
+                    t = '{} <b>{} ({})</b>'.format(target.name, target.text(), target.id)
+                i = '{}{}'.format(pvr.message()[:1].lower(), pvr.message()[1:])
+                return {
+                    'diagram': item.diagram.name, 'id': item.id, 'type': item.name,
+                    'source': source.id, 'target': target.id, 'message': pvr.message(),
+                    'description': 'Syntax error detected on {} from {} to {}: <i>{}</i>.'.format(item.name, s, t, i),
+                }
+        elif item.isNode():
+            pvr = self.project.profile.checkNode(item)
+            if not pvr.isValid():
+                name = '{} <b>({})</b>'.format(item.name, item.id)
+                if item.isPredicate():
+                    name = '{} <b>{} ({})</b>'.format(item.name, item.text(), item.id)
+                i = '{}{}'.format(pvr.message()[:1].lower(), pvr.message()[1:])
+                return {
+                    'diagram': item.diagram.name, 'id': item.id, 'type': item.name,
+                    'source': None, 'target': None, 'message': pvr.message(),
+                    'description': 'Syntax error detected on {}: <i>{}</i>.'.format(name, i),
+                }
+        return None
+
+    def errors(self):
+        """
+        Returns the list of syntax errors currently affecting the project, as (item, message) pairs.
+        Pending items are validated before returning the result.
+        :rtype: list
+        """
+        self.validate()
+        errors = [(item, entry['description']) for item, entry in self.results.items() if entry]
+        return sorted(errors, key=lambda x: (x[0].isNode(), x[0].diagram.name, x[0].id))
+
+    def invalidate(self, item):
+        """
+        Mark as pending the validation of the given item and of the ones whose validity may depend on it.
+        These are the edges attached to the given item (or to its endpoints, if it's an edge), together with
+        the edges attached to the nodes whose identity is computed out of the given item's neighbourhood.
+        :type item: AbstractItem
+        """
+        if self.complete:
+            seeds = {item.source, item.target} - {None} if item.isEdge() else {item}
+            neutral = lambda x: Identity.Neutral in x.identities()
+            nodes = set(seeds)
+            for seed in seeds:
+                nodes.update(bfs(source=seed, filter_on_visit=neutral))
+            for node in nodes:
+                self.dirty.add(node)
+                if node in seeds or neutral(node):
+                    self.dirty.update(node.edges)
+            if item.isEdge():
+                self.dirty.add(item)
+            self.sgnInvalidated.emit()
+
+    def pending(self):
+        """
+        Returns the collection of items pending validation.
+        :rtype: set
+        """
+        if not self.complete or self.profile is not self.project.profile:
+            return set(self.project.edges()) | {x for x in self.project.nodes() if not x.edges}
+        return set(self.dirty)
+
+    def report(self):
+        """
+        Returns the report of all the syntax errors currently affecting the project.
+        Pending items are validated before returning the result.
+        :rtype: SyntaxValidationReport
+        """
+        self.validate()
+        return SyntaxValidationReport(self.project, [x for x in self.results.values() if x])
+
+    def reset(self):
+        """
+        Discard all the validation results, hence forcing the validation of the whole project.
+        """
+        self.complete = False
+        self.dirty.clear()
+        self.results.clear()
+        self.sgnInvalidated.emit()
+
+    def validate(self, progress=None):
+        """
+        Perform the syntax validation of all the items pending validation.
+        Returns the number of validated items.
+        :type progress: callable
+        :rtype: int
+        """
+        if self.profile is not self.project.profile:
+            self.profile = self.project.profile
+            self.complete = False
+        if not self.complete:
+            self.results.clear()
+        pending = self.pending()
+        self.complete = True
+        self.dirty = set()
+        self.project.profile.reset()
+        for i, item in enumerate(pending):
+            if not item.diagram:
+                self.results.pop(item, None)
+            elif item.isEdge():
+                self.results[item] = self.entry(item)
+            elif item.isNode() and not item.edges:
+                self.results[item] = self.entry(item)
+            else:
+                self.results.pop(item, None)
+            if progress:
+                progress(i)
+        LOGGER.debug('Syntax validation performed on %s items (errors = %s)', len(pending),
+                     sum(1 for x in self.results.values() if x))
+        return len(pending)
+
+
+class SyntaxValidationReport(object):
+    """
+    This class can be used to collect the syntax errors detected in a project.
+    Each error is described by an entry made only of builtin types (the name of the diagram, the id and
+    the type of the item, the ids of the edge endpoints and the error message), hence reports can be
+    sorted and serialized without accessing the graphic items of the project.
+    """
+    def __init__(self, project, entries):
+        """
+        Initialize the syntax validation report.
+        :type project: Project
+        :type entries: list
+        """
+        self.name = project.name
+        self.profile = project.profile.name()
+        self.entries = entries
+        self.sort()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def sort(self, *keys):
+        """
+        Sort the entries of the report by the given keys (by default: diagram name, item id).
+        :type keys: list
+        """
+        keys = keys or ('diagram', 'id')
+        self.entries.sort(key=lambda x: tuple(x[k] or '' for k in keys))
+
+    def toJson(self, indent=2):
+        """
+        Returns the machine-readable (JSON) representation of the report.
+        :type indent: int
+        :rtype: str
+        """
+        return json.dumps({
+            'project': self.name,
+            'profile': self.profile,
+            'errors': self.entries,
+        }, indent=indent)
+
+    def __iter__(self):
+        """
+        Returns an iterator over the entries of the report.
+        :rtype: iter
+        """
+        return iter(self.entries)
+
+    def __len__(self):
+        """
+        Returns the number of syntax errors in the report.
+        :rtype: int
+        """
+        return len(self.entries)
@@ -91,49 +91,49 @@ class InfoPlugin(AbstractPlugin):
         """
         Executed whenever a diagram is added to the active project.
         """
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot('QGraphicsScene')
     def onDiagramRemoved(self, diagram):
         """
         Executed whenever a diagram is removed from the active project.
         """
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot()
     def onDiagramSelectionChanged(self):
         """
         Executed whenever the selection of the active diagram changes.
         """
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot()
     def onDiagramUpdated(self):
         """
         Executed whenever the active diagram is updated.
         """
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def onProjectItemAdded(self, diagram, item):
         """
         Executed whenever a new element is added to the active project.
         """
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def onProjectItemRemoved(self, diagram, item):
         """
         Executed whenever a new element is removed from the active project.
         """
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot()
     def onProjectUpdated(self):
         """
         Executed whenever the current project is updated.
         """
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot()
     def onSessionReady(self):
@@ -146,7 +146,7 @@ class InfoPlugin(AbstractPlugin):
         connect(self.project.sgnDiagramRemoved, self.onDiagramRemoved)
         connect(self.project.sgnItemAdded, self.onProjectItemAdded)
         connect(self.project.sgnItemRemoved, self.onProjectItemRemoved)
-        self.widget('info').stack()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot(QtWidgets.QMdiSubWindow)
     def onSubWindowActivated(self, subwindow):
@@ -170,7 +170,7 @@ class InfoPlugin(AbstractPlugin):
             connect(subwindow.diagram.selectionChanged, self.onDiagramSelectionChanged)
             connect(subwindow.diagram.sgnUpdated, self.onDiagramUpdated)
             widget.setDiagram(subwindow.diagram)
-            widget.stack()
+            self.scheduleRefresh()
         else:
             if not self.session.mdi.subWindowList():
                 # If we don't have any active subwindow (which means that
@@ -182,12 +182,18 @@ class InfoPlugin(AbstractPlugin):
                     disconnect(widget.diagram.selectionChanged, self.onDiagramSelectionChanged)
                     disconnect(widget.diagram.sgnUpdated, self.onDiagramUpdated)
                 widget.setDiagram(None)
-                widget.stack()
+                self.scheduleRefresh()
 
     #############################################
     #   HOOKS
     #################################
 
+    def refresh(self):
+        """
+        Rebuild the information box according to the current selection.
+        """
+        self.widget('info').stack()
+
     def dispose(self):
         """
         Executed whenever the plugin is going to be destroyed.
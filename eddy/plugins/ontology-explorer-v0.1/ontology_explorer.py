@@ -52,8 +52,6 @@ class OntologyExplorerPlugin(AbstractPlugin):
     """
     This plugin provides the Ontology Explorer widget.
     """
-    sgnFakeItemAdded = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
-
     #############################################
     #   SLOTS
     #################################
@@ -69,10 +67,7 @@ class OntologyExplorerPlugin(AbstractPlugin):
         connect(self.project.sgnItemAdded, widget.doAddNode)
         connect(self.project.sgnItemRemoved, widget.doRemoveNode)
         # FILL IN ONTOLOGY EXPLORER WITH DATA
-        connect(self.sgnFakeItemAdded, widget.doAddNode)
-        for node in self.project.nodes():
-            self.sgnFakeItemAdded.emit(node.diagram, node)
-        disconnect(self.sgnFakeItemAdded, widget.doAddNode)
+        widget.addNodes(self.project.nodes())
 
     #############################################
     #   HOOKS
@@ -136,7 +131,11 @@ class OntologyExplorerPlugin(AbstractPlugin):
 class OntologyExplorerWidget(QtWidgets.QWidget):
     """
     This class implements the ontology explorer used to list ontology predicates.
+    Predicate (parent) and node (child) rows are indexed by (type, predicate) and (diagram, node id)
+    respectively, and the view is sorted once after a batch of changes rather than after every row.
     """
+    Types = {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}
+
     sgnItemClicked = QtCore.pyqtSignal('QGraphicsItem')
     sgnItemDoubleClicked = QtCore.pyqtSignal('QGraphicsItem')
     sgnItemRightClicked = QtCore.pyqtSignal('QGraphicsItem')
@@ -156,6 +155,12 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         self.iconRole = QtGui.QIcon(':/icons/18/ic_treeview_role')
         self.iconValue = QtGui.QIcon(':/icons/18/ic_treeview_value')
 
+        self.children = dict() # {(Diagram, str): QStandardItem}
+        self.parents = dict() # {(Item, str): QStandardItem}
+        self.sortTimer = QtCore.QTimer(self)
+        self.sortTimer.setInterval(0)
+        self.sortTimer.setSingleShot(True)
+
         self.search = StringField(self)
         self.search.setAcceptDrops(False)
         self.search.setClearButtonEnabled(True)
@@ -198,6 +203,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         connect(self.ontoview.doubleClicked, self.onItemDoubleClicked)
         connect(self.ontoview.pressed, self.onItemPressed)
         connect(self.search.textChanged, self.doFilterItem)
+        connect(self.sortTimer.timeout, self.doSort)
         connect(self.sgnItemDoubleClicked, self.session.doFocusItem)
         connect(self.sgnItemRightClicked, self.session.doFocusItem)
 
@@ -247,17 +253,13 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type diagram: QGraphicsScene
         :type node: AbstractItem
         """
-        if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
+        if node.type() in self.Types:
             parent = self.parentFor(node)
             if not parent:
-                parent = QtGui.QStandardItem(self.parentKey(node))
-                parent.setIcon(self.iconFor(node))
+                parent = self.createParent(node)
                 self.model.appendRow(parent)
-                self.proxy.sort(0, QtCore.Qt.AscendingOrder)
-            child = QtGui.QStandardItem(self.childKey(diagram, node))
-            child.setData(node)
-            parent.appendRow(child)
-            self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+            parent.appendRow(self.createChild(diagram, node))
+            self.sortTimer.start()
 
     @QtCore.pyqtSlot(str)
     def doFilterItem(self, key):
@@ -275,14 +277,24 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type diagram: QGraphicsScene
         :type node: AbstractItem
         """
-        if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
+        if node.type() in self.Types:
             parent = self.parentFor(node)
             if parent:
                 child = self.childFor(parent, diagram, node)
                 if child:
-                    parent.removeRow(child.index().row())
+                    del self.children[diagram, node.id]
+                    parent.removeRow(child.row())
                 if not parent.rowCount():
-                    self.model.removeRow(parent.index().row())
+                    del self.parents[node.type(), parent.text()]
+                    self.model.removeRow(parent.row())
+
+    @QtCore.pyqtSlot()
+    def doSort(self):
+        """
+        Sort the items in the tree view.
+        """
+        self.sortTimer.stop()
+        self.proxy.sort(0, QtCore.Qt.AscendingOrder)
 
     @QtCore.pyqtSlot('QModelIndex')
     def onItemDoubleClicked(self, index):
@@ -312,18 +324,39 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
     #   INTERFACE
     #################################
 
+    def addNodes(self, nodes):
+        """
+        Add the given nodes in the tree view, building the new rows in bulk and sorting them once.
+        :type nodes: T <= list|set|tuple
+        """
+        parents = []
+        children = dict()
+        for node in nodes:
+            if node.type() in self.Types:
+                parent = self.parentFor(node)
+                if not parent:
+                    parent = self.createParent(node)
+                    parents.append(parent)
+                key = (node.type(), parent.text())
+                children.setdefault(key, []).append(self.createChild(node.diagram, node))
+        for key, rows in children.items():
+            self.parents[key].appendRows(rows)
+        if parents:
+            self.model.invisibleRootItem().appendRows(parents)
+        if children:
+            self.doSort()
+
     def childFor(self, parent, diagram, node):
         """
         Search the item representing this node among parent children.
         :type parent: QtGui.QStandardItem
         :type diagram: Diagram
         :type node: AbstractNode
+        :rtype: QtGui.QStandardItem
         """
-        key = self.childKey(diagram, node)
-        for i in range(parent.rowCount()):
-            child = parent.child(i)
-            if child.text() == key:
-                return child
+        child = self.children.get((diagram, node.id))
+        if child and child.parent() is parent and child.data() is node:
+            return child
         return None
 
     @staticmethod
@@ -338,6 +371,29 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         diagram = rstrip(diagram.name, File.Graphol.extension)
         return '{0} ({1} - {2})'.format(predicate, diagram, node.id)
 
+    def createChild(self, diagram, node):
+        """
+        Create the item representing the given node and add it to the index.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        :rtype: QtGui.QStandardItem
+        """
+        child = QtGui.QStandardItem(self.childKey(diagram, node))
+        child.setData(node)
+        self.children[diagram, node.id] = child
+        return child
+
+    def createParent(self, node):
+        """
+        Create the item representing the predicate of the given node and add it to the index.
+        :type node: AbstractNode
+        :rtype: QtGui.QStandardItem
+        """
+        parent = QtGui.QStandardItem(self.parentKey(node))
+        parent.setIcon(self.iconFor(node))
+        self.parents[node.type(), parent.text()] = parent
+        return parent
+
     def iconFor(self, node):
         """
         Returns the icon for the given node.
@@ -361,11 +417,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractNode
         :rtype: QtGui.QStandardItem
         """
-        for i in self.model.findItems(self.parentKey(node), QtCore.Qt.MatchExactly):
-            n = i.child(0).data()
-            if node.type() is n.type():
-                return i
-        return None
+        return self.parents.get((node.type(), self.parentKey(node)))
 
     @staticmethod
     def parentKey(node):
@@ -47,6 +47,8 @@ class OverviewPlugin(AbstractPlugin):
     """
     This plugin provides the Overview widget.
     """
+    RefreshInterval = 200
+
     #############################################
     #   EVENTS
     #################################
@@ -72,14 +74,14 @@ class OverviewPlugin(AbstractPlugin):
         """
         Executed whenever the selection of the active diagram changes.
         """
-        self.widget('overview').redraw()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot()
     def onDiagramUpdated(self):
         """
         Executed whenever the active diagram is updated.
         """
-        self.widget('overview').redraw()
+        self.scheduleRefresh()
 
     @QtCore.pyqtSlot(QtWidgets.QMdiSubWindow)
     def onSubWindowActivated(self, subwindow):
@@ -104,7 +106,7 @@ class OverviewPlugin(AbstractPlugin):
             connect(subwindow.diagram.sgnUpdated, self.onDiagramUpdated)
             widget.setScene(subwindow.diagram)
             widget.setView(subwindow.view)
-            widget.redraw()
+            self.scheduleRefresh()
         else:
             if not self.session.mdi.subWindowList():
                 # If we don't have any active subwindow (which means that
@@ -117,12 +119,18 @@ class OverviewPlugin(AbstractPlugin):
                     disconnect(widget.diagram.sgnUpdated, self.onDiagramUpdated)
                 widget.setScene(None)
                 widget.setView(None)
-                widget.redraw()
+                self.scheduleRefresh()
 
     #############################################
     #   HOOKS
     #################################
 
+    def refresh(self):
+        """
+        Redraw the active diagram within the overview.
+        """
+        self.widget('overview').redraw()
+
     def dispose(self):
         """
         Executed whenever the plugin is going to be destroyed.
@@ -183,6 +191,9 @@ class OverviewPlugin(AbstractPlugin):
 class OverviewWidget(QtWidgets.QGraphicsView):
     """
     This class is used to display the active diagram overview.
+    The diagram is rendered into a thumbnail pixmap only when the overview is redrawn (which the plugin
+    schedules at most every RefreshInterval milliseconds), while paint events just draw the thumbnail
+    together with the area of the diagram displayed by the inspected view, which is kept up to date live.
     """
     def __init__(self, plugin):
         """
@@ -198,6 +209,7 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setViewportUpdateMode(QtWidgets.QGraphicsView.NoViewportUpdate)
         self._mousePressed = False
+        self._pixmap = QtGui.QPixmap()
         self._view = None
 
     #############################################
@@ -253,6 +265,23 @@ class OverviewWidget(QtWidgets.QGraphicsView):
             if self._view:
                 self._mousePressed = False
 
+    def paintEvent(self, paintEvent):
+        """
+        Draw the diagram thumbnail and the area displayed by the inspected view.
+        :type paintEvent: QPaintEvent
+        """
+        viewport = self.viewport()
+        painter = QtGui.QPainter(viewport)
+        if self._pixmap.isNull():
+            painter.fillRect(viewport.rect(), self.palette().color(QtGui.QPalette.Base))
+        else:
+            painter.drawPixmap(0, 0, self._pixmap)
+        if self._view:
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setPen(QtGui.QPen(QtGui.QColor(66, 165, 245, 255), 1.0, QtCore.Qt.SolidLine))
+            painter.setBrush(QtGui.QBrush(QtGui.QColor(66, 165, 245, 40)))
+            painter.drawPolygon(self.mapFromScene(self._view.visibleRect()))
+
     def wheelEvent(self, wheelEvent):
         """
         Turn off wheel event since we don't need to scroll anything.
@@ -260,6 +289,26 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         """
         pass
 
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(int)
+    def onViewScrolled(self, _):
+        """
+        Executed when the inspected view is scrolled.
+        :type _: int
+        """
+        self.viewport().update()
+
+    @QtCore.pyqtSlot(float)
+    def onViewScaled(self, _):
+        """
+        Executed when the inspected view is scaled.
+        :type _: float
+        """
+        self.viewport().update()
+
     #############################################
     #   INTERFACE
     #################################
@@ -272,6 +321,7 @@ class OverviewWidget(QtWidgets.QGraphicsView):
             polygon = self.diagram.visibleRect(margin=10)
             if polygon:
                 self.fitInView(polygon, QtCore.Qt.KeepAspectRatio)
+        self._pixmap = self.thumbnail()
         viewport = self.viewport()
         viewport.update()
 
@@ -280,7 +330,15 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         Sets the widget to inspect the given Diagram view.
         :type: view: DiagramView
         """
+        if self._view:
+            disconnect(self._view.horizontalScrollBar().valueChanged, self.onViewScrolled)
+            disconnect(self._view.verticalScrollBar().valueChanged, self.onViewScrolled)
+            disconnect(self._view.sgnScaled, self.onViewScaled)
         self._view = view
+        if self._view:
+            connect(self._view.horizontalScrollBar().valueChanged, self.onViewScrolled)
+            connect(self._view.verticalScrollBar().valueChanged, self.onViewScrolled)
+            connect(self._view.sgnScaled, self.onViewScaled)
 
     def sizeHint(self):
         """
@@ -289,6 +347,22 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         """
         return QtCore.QSize(216, 216)
     
+    def thumbnail(self):
+        """
+        Returns a pixmap with the portion of the diagram displayed in the overview rendered into it.
+        :rtype: QtGui.QPixmap
+        """
+        viewport = self.viewport()
+        pixmap = QtGui.QPixmap(viewport.size())
+        pixmap.fill(self.palette().color(QtGui.QPalette.Base))
+        if self._view:
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            source = self.mapToScene(viewport.rect()).boundingRect()
+            self.diagram.render(painter, QtCore.QRectF(pixmap.rect()), source, QtCore.Qt.IgnoreAspectRatio)
+            painter.end()
+        return pixmap
+
     def view(self):
         """
         Returns the reference to the view currently inspected by this widget.
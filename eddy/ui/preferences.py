@@ -90,6 +90,37 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         groupbox.setLayout(formlayout)
         self.addWidget(groupbox)
 
+        ## PROJECT GROUP
+
+        prefix = QtWidgets.QLabel(self, objectName='project_load_streaming_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Streaming project loader')
+        self.addWidget(prefix)
+
+        checkbox = CheckBox(self, objectName='project_load_streaming_checkbox')
+        checkbox.setChecked(settings.value('project/load_streaming', True, bool))
+        checkbox.setFont(Font('Roboto', 12))
+        checkbox.setToolTip('Whether or not projects should be loaded incrementally (lower memory usage on big ontologies)')
+        self.addWidget(checkbox)
+
+        prefix = QtWidgets.QLabel(self, objectName='project_load_cache_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Project snapshot cache')
+        self.addWidget(prefix)
+
+        checkbox = CheckBox(self, objectName='project_load_cache_checkbox')
+        checkbox.setChecked(settings.value('project/load_cache', True, bool))
+        checkbox.setFont(Font('Roboto', 12))
+        checkbox.setToolTip('Whether or not a binary snapshot of loaded projects should be kept to speed up reopening them')
+        self.addWidget(checkbox)
+
+        formlayout = QtWidgets.QFormLayout()
+        formlayout.addRow(self.widget('project_load_streaming_prefix'), self.widget('project_load_streaming_checkbox'))
+        formlayout.addRow(self.widget('project_load_cache_prefix'), self.widget('project_load_cache_checkbox'))
+        groupbox = QtWidgets.QGroupBox('Project', self, objectName='project_widget')
+        groupbox.setLayout(formlayout)
+        self.addWidget(groupbox)
+
         ## UPDATE GROUP
 
         prefix = QtWidgets.QLabel(self, objectName='update_startup_prefix')
@@ -130,6 +161,7 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         layout = QtWidgets.QVBoxLayout()
         layout.setAlignment(QtCore.Qt.AlignTop)
         layout.addWidget(self.widget('editor_widget'), 0, QtCore.Qt.AlignTop)
+        layout.addWidget(self.widget('project_widget'), 0, QtCore.Qt.AlignTop)
         layout.addWidget(self.widget('update_widget'), 0, QtCore.Qt.AlignTop)
         widget = QtWidgets.QWidget()
         widget.setLayout(layout)
@@ -381,6 +413,8 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         #################################
 
         settings.setValue('diagram/size', self.widget('diagram_size_field').value())
+        settings.setValue('project/load_cache', self.widget('project_load_cache_checkbox').isChecked())
+        settings.setValue('project/load_streaming', self.widget('project_load_streaming_checkbox').isChecked())
         settings.setValue('update/channel', self.widget('update_channel_switch').currentText())
         settings.setValue('update/check_on_startup', self.widget('update_startup_checkbox').isChecked())
 
@@ -68,6 +68,21 @@ class BusyProgressDialog(QtWidgets.QDialog):
         self.setWindowTitle(title or 'Busy ...')
         self.setFixedSize(self.sizeHint())
 
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(int, int)
+    def setProgress(self, value, total):
+        """
+        Display the given amount of work done: the progress bar stays in busy mode if the total is unknown.
+        :type value: int
+        :type total: int
+        """
+        if total > 0:
+            self.progressBar.setRange(0, total)
+            self.progressBar.setValue(min(value, total))
+
     #############################################
     #   INTERFACE
     #################################
@@ -210,16 +210,9 @@ class DiagramProperty(PropertyDialog):
         size1 = max(sceneRect.width(), sceneRect.height())
         size2 = self.diagramSizeField.value()
         if size1 != size2:
-            items = self.diagram.items()
-            if items:
-                x = set()
-                y = set()
-                for item in items:
-                    if item.isEdge() or item.isNode():
-                        b = item.mapRectToScene(item.boundingRect())
-                        x.update({b.left(), b.right()})
-                        y.update({b.top(), b.bottom()})
-                size2 = max(size2, abs(min(x) * 2), abs(max(x) * 2), abs(min(y) * 2), abs(max(y) * 2))
+            content = self.diagram.contentRect()
+            if content:
+                size2 = max(size2, abs(content.left() * 2), abs(content.right() * 2), abs(content.top() * 2), abs(content.bottom() * 2))
             return CommandDiagramResize(self.diagram, QtCore.QRectF(-size2 / 2, -size2 / 2, size2, size2))
         return None
 
@@ -160,11 +160,12 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
     sgnSaveProject = QtCore.pyqtSignal()
     sgnUpdateState = QtCore.pyqtSignal()
 
-    def __init__(self, application, path, **kwargs):
+    def __init__(self, application, path, progress=None, **kwargs):
         """
         Initialize the application main working session.
         :type application: QApplication
         :type path: str
+        :type progress: BusyProgressDialog
         :type kwargs: dict
         """
         super().__init__(**kwargs)
@@ -181,6 +182,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         self.pf = PropertyFactory(self)
         self.pmanager = PluginManager(self)
         self.project = None
+        self.saving = None # UNDO STACK INDEX MATCHING THE PROJECT BEING SAVED
 
         #############################################
         # CONFIGURE SESSION
@@ -204,6 +206,8 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         #################################
 
         worker = self.createProjectLoader(File.Graphol, path, self)
+        if progress:
+            connect(worker.sgnProgress, progress.setProgress)
         worker.run()
 
         #############################################
@@ -870,6 +874,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         Connect session specific signals to their slots.
         """
         connect(self.undostack.cleanChanged, self.doUpdateState)
+        connect(self.undostack.indexChanged, self.onUndoStackIndexChanged)
         connect(self.sgnCheckForUpdate, self.doCheckForUpdate)
         connect(self.sgnFocusDiagram, self.doFocusDiagram)
         connect(self.sgnFocusItem, self.doFocusItem)
@@ -1227,6 +1232,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
                         for path in selected:
                             progress.setWindowTitle('Importing {0}...'.format(os.path.basename(path)))
                             worker = self.createOntologyLoader(filetype, path, self.project, self)
+                            connect(worker.sgnProgress, progress.setProgress)
                             worker.run()
                 except Exception as e:
                     msgbox = QtWidgets.QMessageBox(self)
@@ -1516,22 +1522,24 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
     def doSave(self):
         """
         Save the current project.
+        The project structure is collected in the main thread, while it's written to disk in a separate one.
         """
+        # Make sure that saves are written to disk in the same order they are requested,
+        # and that the outcome of the previous one has been handled before starting a new one.
+        self.waitThread('projectSave')
+        QtCore.QCoreApplication.sendPostedEvents(self, QtCore.QEvent.MetaCall)
         try:
-            worker = self.createProjectExporter(File.Graphol, self.project, self)
-            worker.run()
+            exporter = self.createProjectExporter(File.Graphol, self.project, self)
+            worker = exporter.createWorker()
         except Exception as e:
-            msgbox = QtWidgets.QMessageBox(self)
-            msgbox.setDetailedText(format_exception(e))
-            msgbox.setIconPixmap(QtGui.QIcon(':/icons/48/ic_error_outline_black').pixmap(48))
-            msgbox.setStandardButtons(QtWidgets.QMessageBox.Close)
-            msgbox.setText('Eddy could not save the current project!')
-            msgbox.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
-            msgbox.setWindowTitle('Save failed!')
-            msgbox.exec_()
+            self.onProjectSaveFailed(e)
         else:
-            self.undostack.setClean()
-            self.sgnProjectSaved.emit()
+            # The project is marked as clean only once it has been written to disk (see onProjectSaved):
+            # until then remember the state of the undo stack matching the collected structure.
+            self.saving = self.undostack.index()
+            connect(worker.sgnCompleted, self.onProjectSaved)
+            connect(worker.sgnErrored, self.onProjectSaveFailed)
+            self.startThread('projectSave', worker)
 
     @QtCore.pyqtSlot()
     def doSaveAs(self):
@@ -1899,6 +1907,40 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             unable to get update information.
             """))
 
+    @QtCore.pyqtSlot(Exception)
+    def onProjectSaveFailed(self, exception):
+        """
+        Executed when the current project could not be saved.
+        :type exception: Exception
+        """
+        # The project file is replaced only once completely written, hence
+        # the clean state of the undo stack still matches its content.
+        self.project.setDirty()
+        self.saving = None
+        msgbox = QtWidgets.QMessageBox(self)
+        msgbox.setDetailedText(format_exception(exception))
+        msgbox.setIconPixmap(QtGui.QIcon(':/icons/48/ic_error_outline_black').pixmap(48))
+        msgbox.setStandardButtons(QtWidgets.QMessageBox.Close)
+        msgbox.setText('Eddy could not save the current project!')
+        msgbox.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
+        msgbox.setWindowTitle('Save failed!')
+        msgbox.exec_()
+
+    @QtCore.pyqtSlot()
+    def onProjectSaved(self):
+        """
+        Executed when the current project has been written to disk.
+        """
+        self.project.setClean()
+        if self.saving is not None:
+            self.undostack.setClean()
+        else:
+            # The project has been edited while being written: the undo stack
+            # matches neither the saved project nor the previously saved one.
+            self.undostack.resetClean()
+        self.saving = None
+        self.sgnProjectSaved.emit()
+
     @QtCore.pyqtSlot()
     def onSessionReady(self):
         """
@@ -1912,6 +1954,15 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             action = self.action('check_for_updates')
             action.trigger()
 
+    @QtCore.pyqtSlot(int)
+    def onUndoStackIndexChanged(self, index):
+        """
+        Executed when a command is pushed, undone or redone in the undo stack.
+        The project being saved (if any) does not match its current state anymore.
+        :type index: int
+        """
+        self.saving = None
+
     @QtCore.pyqtSlot(str, str)
     def onUpdateAvailable(self, name, url):
         """
@@ -1957,6 +2008,13 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             ## SAVE THE CURRENT PROJECT IF NEEDED
             if save:
                 self.sgnSaveProject.emit()
+            ## WAIT FOR THE PROJECT TO BE WRITTEN TO DISK
+            self.waitThread('projectSave')
+            QtCore.QCoreApplication.sendPostedEvents(self, QtCore.QEvent.MetaCall)
+            if save and not self.undostack.isClean():
+                ## THE PROJECT COULD NOT BE SAVED: KEEP THE SESSION OPEN
+                closeEvent.ignore()
+                return
             ## DISPOSE ALL THE PLUGINS
             for plugin in self.plugins():
                 self.pmanager.dispose(plugin)
@@ -38,8 +38,11 @@ from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 
 from eddy.core.common import HasThreadingSystem
-from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.qt import Font
+from eddy.core.datatypes.system import File
+from eddy.core.functions.fsystem import fwrite
+from eddy.core.functions.misc import first
+from eddy.core.functions.path import expandPath
 from eddy.core.functions.signals import connect
 from eddy.core.worker import AbstractWorker
 
@@ -58,12 +61,10 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         """
         super().__init__(session)
 
-        # Here we perform the validation on all the edges in the project and the isolated nodes. This is
-        # due to the implementation of the checkEdge() function in the Profile class which validates the
-        # edge endpoints at first, and then (if no error is detected) will perform the validation on the
-        # edge itself. However, disconnected nodes won't be taken into account and thus we must perform
-        # an additional step to validate the isolated nodes separately.
-        self.items = list(project.edges()) + list(filter(lambda n: not n.adjacentNodes(), project.nodes()))
+        # The validation is performed by the project syntax validator, which keeps the results of the previous
+        # runs and only validates again the items that were affected by the edits performed since then: the
+        # progress bar thus reflects the number of items pending validation rather than the project size.
+        self.errors = []
         self.project = project
         self.workerThread = None
         self.worker = None
@@ -75,9 +76,9 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
 
         self.progressBar = QtWidgets.QProgressBar(self)
         self.progressBar.setAlignment(QtCore.Qt.AlignHCenter)
-        self.progressBar.setRange(self.i, len(self.items) - 1)
+        self.progressBar.setRange(0, max(len(project.validator.pending()) - 1, 0))
         self.progressBar.setFixedSize(400, 30)
-        self.progressBar.setValue(self.i)
+        self.progressBar.setValue(0)
 
         self.progressBox = QtWidgets.QWidget(self)
         self.progressBoxLayout = QtWidgets.QVBoxLayout(self.progressBox)
@@ -92,6 +93,8 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         self.buttonAbort.setFont(Font('Roboto', 12))
         self.buttonIgnore = QtWidgets.QPushButton('Ignore', self)
         self.buttonIgnore.setFont(Font('Roboto', 12))
+        self.buttonReport = QtWidgets.QPushButton('Save report', self)
+        self.buttonReport.setFont(Font('Roboto', 12))
         self.buttonShow = QtWidgets.QPushButton('Show', self)
         self.buttonShow.setFont(Font('Roboto', 12))
 
@@ -101,6 +104,7 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         self.buttonBoxLayout.setContentsMargins(10, 0, 10, 10)
         self.buttonBoxLayout.addWidget(self.buttonAbort, 0, QtCore.Qt.AlignRight)
         self.buttonBoxLayout.addWidget(self.buttonIgnore, 0, QtCore.Qt.AlignRight)
+        self.buttonBoxLayout.addWidget(self.buttonReport, 0, QtCore.Qt.AlignRight)
         self.buttonBoxLayout.addWidget(self.buttonShow, 0, QtCore.Qt.AlignRight)
 
         #############################################
@@ -132,8 +136,9 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
 
         connect(self.buttonAbort.clicked, self.doAbort)
         connect(self.buttonIgnore.clicked, self.doIgnore)
+        connect(self.buttonReport.clicked, self.doSaveReport)
         connect(self.buttonShow.clicked, self.doShow)
-        connect(self.sgnWork, self.doWork)
+        connect(self.sgnWork, self.doReport)
 
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
         self.setFixedSize(self.sizeHint())
@@ -182,7 +187,7 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         Executed whenever the dialog is shown.
         :type showEvent: QShowEvent
         """
-        self.sgnWork.emit(0)
+        self.doWork()
 
     #############################################
     #   SLOTS
@@ -204,14 +209,47 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         """
         self.sgnWork.emit(self.i + 1)
 
+    @QtCore.pyqtSlot(int)
+    def doReport(self, i):
+        """
+        Display the syntax error matching the given index, or complete the validation if there are no more errors.
+        :type i: int
+        """
+        if i < len(self.errors):
+            self.i = i
+            self.buttonBox.setVisible(True)
+            self.messageBox.setVisible(True)
+            self.messageField.setHtml(self.errors[i][1])
+            self.progressBar.setValue(self.progressBar.maximum())
+            self.setFixedSize(self.sizeHint())
+            self.setWindowTitle('Syntax error {0} of {1}'.format(i + 1, len(self.errors)))
+        else:
+            self.onCompleted()
+
+    @QtCore.pyqtSlot(bool)
+    def doSaveReport(self, _=False):
+        """
+        Executed when the save report button is pressed.
+        :type _: bool
+        """
+        dialog = QtWidgets.QFileDialog(self)
+        dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
+        dialog.setDirectory(expandPath('~/'))
+        dialog.setFileMode(QtWidgets.QFileDialog.AnyFile)
+        dialog.setNameFilters([File.Json.value])
+        dialog.setViewMode(QtWidgets.QFileDialog.Detail)
+        dialog.selectFile('{0}-syntax'.format(self.project.name))
+        if dialog.exec_():
+            fwrite(self.project.validator.report().toJson(), expandPath(first(dialog.selectedFiles())))
+
     @QtCore.pyqtSlot(bool)
     def doShow(self, _=False):
         """
         Executed when the show button is pressed.
         :type _: bool
         """
-        if self.i < len(self.items):
-            item = self.items[self.i]
+        if self.i < len(self.errors):
+            item = self.errors[self.i][0]
             focus = item
             if item.isEdge():
                 try:
@@ -224,11 +262,10 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
             item.setSelected(True)
         self.close()
 
-    @QtCore.pyqtSlot(int)
-    def doWork(self, i):
+    @QtCore.pyqtSlot()
+    def doWork(self):
         """
-        Perform on or more advancements step in the validation procedure.
-        :type i: int
+        Perform the syntax validation of the items pending validation.
         """
         # ADAPT DISPLAY
         self.buttonBox.setVisible(False)
@@ -238,7 +275,7 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         # MAKE SURE WE ARE CLEAR
         self.dispose()
         # RUN THE WORKER
-        worker = SyntaxValidationWorker(i, self.items, self.project)
+        worker = SyntaxValidationWorker(self.project)
         connect(worker.sgnCompleted, self.onCompleted)
         connect(worker.sgnProgress, self.onProgress)
         connect(worker.sgnSyntaxError, self.onSyntaxError)
@@ -265,21 +302,18 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         Adjust the value of the progress bar.
         :type i: int
         """
-        if i < len(self.items):
-            self.i = i
-            self.progressBar.setValue(self.i)
+        if i <= self.progressBar.maximum():
+            self.progressBar.setValue(i)
             self.progressBar.update()
 
     @QtCore.pyqtSlot(str)
-    def onSyntaxError(self, message):
+    def onSyntaxError(self, _):
         """
-        Executed when a syntax error is detected.
-        :type message: str
+        Executed when the syntax validation detects errors in the project.
+        :type _: str
         """
-        self.buttonBox.setVisible(True)
-        self.messageBox.setVisible(True)
-        self.messageField.setHtml(message)
-        self.setFixedSize(self.sizeHint())
+        self.errors = self.project.validator.errors()
+        self.sgnWork.emit(0)
 
 
 class SyntaxValidationWorker(AbstractWorker):
@@ -290,63 +324,23 @@ class SyntaxValidationWorker(AbstractWorker):
     sgnProgress = QtCore.pyqtSignal(int)
     sgnSyntaxError = QtCore.pyqtSignal(str)
 
-    def __init__(self, current, items, project):
+    def __init__(self, project):
         """
         Initialize the syntax validation worker.
-        :type current: int
-        :type items: list
         :type project: Project
         """
         super().__init__()
         self.project = project
-        self.items = items
-        self.i = current
 
     @QtCore.pyqtSlot()
     def run(self):
         """
         Main worker.
         """
-        errorMsg = None
-        while self.i < len(self.items):
-
-            item = self.items[self.i]
-
-            # UPDATE PROGRESS BAR
-            self.sgnProgress.emit(self.i)
-
-            # VALIDATE EDGE
-            if item.isEdge():
-                source = item.source
-                target = item.target
-                pvr = self.project.profile.checkEdge(source, item, target)
-                if not pvr.isValid():
-                    s = '{} <b>({})</b>'.format(source.name, source.id)
-                    t = '{} <b>({})</b>'.format(target.name, target.id)
-                    if source.type() in {Item.AttributeNode, Item.ConceptNode, Item.RoleNode, Item.ValueDomainNode}:
-                        s = '{} <b>{} ({})</b>'.format(source.name, source.text(), source.id)
-                    if target.type() in {Item.AttributeNode, Item.ConceptNode, Item.RoleNode, Item.ValueDomainNode}:
-                        t = '{} <b>{} ({})</b>'.format(target.name, target.text(), target.id)
-                    i = '{}{}'.format(pvr.message()[:1].lower(), pvr.message()[1:])
-                    errorMsg = 'Syntax error detected on {} from {} to {}: <i>{}</i>.'.format(item.name, s, t, i)
-                    break
-
-            # VALIDATE NODE (ISOLATED)
-            elif item.isNode():
-                pvr = self.project.profile.checkNode(item)
-                if not pvr.isValid():
-                    name = '{} <b>({})</b>'.format(item.name, item.id)
-                    if item.isPredicate():
-                        name = '{} <b>{} ({})</b>'.format(item.name, item.text(), item.id)
-                    i = '{}{}'.format(pvr.message()[:1].lower(), pvr.message()[1:])
-                    errorMsg = 'Syntax error detected on {}: <i>{}</i>.'.format(name, i)
-                    break
-
-            self.i += 1
-
-        if errorMsg:
-            self.sgnSyntaxError.emit(errorMsg)
+        self.project.validator.validate(self.sgnProgress.emit)
+        errors = self.project.validator.errors()
+        if errors:
+            self.sgnSyntaxError.emit(errors[0][1])
         else:
             self.sgnCompleted.emit()
-
-        self.finished.emit()
\ No newline at end of file
+        self.finished.emit()
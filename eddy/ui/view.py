@@ -43,6 +43,7 @@ from eddy.core.diagram import Diagram
 from eddy.core.functions.geometry import midpoint
 from eddy.core.functions.misc import clamp, snapF
 from eddy.core.functions.signals import disconnect, connect
+from eddy.core.items.common import AbstractItem, Style
 
 
 class DiagramView(QtWidgets.QGraphicsView):
@@ -410,6 +411,13 @@ class DiagramView(QtWidgets.QGraphicsView):
         self.resetTransform()
         self.translate(self.transform().dx(), self.transform().dy())
         self.scale(zoom, zoom)
+        if (zoom < Style.ShapeZoom) != (self.zoom < Style.ShapeZoom):
+            # Items painted with low detail are cheaper to paint than to cache: caching thousands
+            # of them would also overflow the pixmap cache, invalidating the cache on every repaint.
+            cacheMode = AbstractItem.NoCache if zoom < Style.ShapeZoom else AbstractItem.DeviceCoordinateCache
+            for item in self.diagram.items():
+                if item.isNode() or item.isEdge():
+                    item.setCacheMode(cacheMode)
         self.sgnScaled.emit(zoom)
         self.zoom = zoom
 
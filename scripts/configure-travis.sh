@@ -83,5 +83,7 @@ pip install -e hg+https://danielepantaleone@bitbucket.org/danielepantaleone/cx_f
 pip install -e git+https://github.com/danielepantaleone/pyjnius.git@i386#egg=pyjnius --exists-action i
 pip install --pre github3.py
 
+pyrcc5 "${PARENT_DIR}/eddy/ui/fonts.qrc" -o "${PARENT_DIR}/eddy/ui/fonts_rc.py"
+
 cd ~
 rm -rf "${BUILDS_DIR}"
@@ -162,13 +162,14 @@ class EddyTestCase(TestCase):
     #   INTERFACE
     #################################
 
-    def init(self, project):
+    def init(self, project, source='@tests'):
         """
-        Create a new instance of Eddy loading the given project from the '@resources' directory.
+        Create a new instance of Eddy loading the given project from the given directory ('@tests' by default).
         :type project: str
+        :type source: str
         """
         # COPY TEST PROJECT OVER
-        cpdir('@tests/%s/' % project, '@tests/.tests/%s' % project)
+        cpdir('%s/%s/' % (source, project), '@tests/.tests/%s' % project)
         # CREATE AN INSTANCE OF EDDY
         arguments = ['--nosplash', '--tests', '--open', '@tests/.tests/%s' % project]
         parser = ArgumentParser()
@@ -488,6 +488,50 @@ class ActionsTestCase(EddyTestCase):
         self.assertEqual(num_edges_in_project, len(self.project.edges(diagram)) + 3)
         self.assertFalse(self.session.undostack.isClean())
 
+    def test_action_delete_updates_project_counters(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        action = self.session.action('delete')
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        num_inclusions_in_project = self.project.itemNum(Item.InclusionEdge)
+        num_roles_in_diagram = self.project.predicateNum(Item.RoleNode, diagram)
+        diagram.clearSelection()
+        node.setSelected(True)
+        # WHEN
+        action.trigger()
+        # THEN
+        self.assertEqual(len([x for x in self.project.items() if x.type() is Item.InclusionEdge]),
+            self.project.itemNum(Item.InclusionEdge))
+        self.assertEqual(len({x.text() for x in self.project.predicates(Item.RoleNode, diagram=diagram)}),
+            self.project.predicateNum(Item.RoleNode, diagram))
+        self.assertEqual(num_roles_in_diagram - 1, self.project.predicateNum(Item.RoleNode, diagram))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(num_inclusions_in_project, self.project.itemNum(Item.InclusionEdge))
+        self.assertEqual(num_roles_in_diagram, self.project.predicateNum(Item.RoleNode, diagram))
+
+    def test_action_delete_revalidates_affected_items(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        action = self.session.action('delete')
+        validator = self.project.validator
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        errors = validator.errors()
+        diagram.clearSelection()
+        node.setSelected(True)
+        # WHEN
+        action.trigger()
+        # THEN
+        self.assertLess(len(validator.pending()), len(self.project.edges()))
+        self.assertNotIn(node, validator.pending())
+        self.assertEqual(sorted(filter(None, map(validator.check, self.project.edges()))),
+            sorted(x[1] for x in validator.errors() if x[0].isEdge()))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(errors, validator.errors())
+
     def test_action_purge_role_node(self):
         # GIVEN
         diagram = self.session.mdi.activeDiagram()
@@ -515,6 +559,37 @@ class ActionsTestCase(EddyTestCase):
         self.assertEmpty(self.project.predicates(Item.RoleNode, 'hasAncestor'))
         self.assertFalse(self.session.undostack.isClean())
 
+    #############################################
+    #   EDGE SWAP
+    #################################
+
+    def test_action_swap_edge(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        action = self.session.action('swap_edge')
+        edge = first(x for x in self.project.edges(diagram) if x.type() is Item.InclusionEdge \
+            and x.source.type() is Item.ConceptNode and x.target.type() is Item.ConceptNode)
+        source = edge.source
+        target = edge.target
+        diagram.clearSelection()
+        edge.setSelected(True)
+        self.session.doUpdateState()
+        # WHEN
+        action.trigger()
+        # THEN
+        self.assertIs(target, edge.source)
+        self.assertIs(source, edge.target)
+        self.assertIn(edge, source.incomingEdges([Item.InclusionEdge]))
+        self.assertNotIn(edge, source.outgoingEdges([Item.InclusionEdge]))
+        self.assertIn(edge, target.outgoingEdges([Item.InclusionEdge]))
+        self.assertIn(source, target.outgoingNodes(filter_on_types=[Item.InclusionEdge]))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertIn(edge, source.outgoingEdges([Item.InclusionEdge]))
+        self.assertNotIn(edge, source.incomingEdges([Item.InclusionEdge]))
+        self.assertIn(target, source.outgoingNodes(filter_on_types=[Item.InclusionEdge]))
+
     #############################################
     #   ITEM SELECTION
     #################################
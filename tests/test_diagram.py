@@ -34,13 +34,19 @@
 
 
 from PyQt5 import QtCore
+from PyQt5 import QtGui
 from PyQt5 import QtTest
+from PyQt5 import QtWidgets
 
 from tests import EddyTestCase
 
-from eddy.core.datatypes.graphol import Item
+from eddy.core.commands.edges import CommandEdgeAdd
+from eddy.core.commands.nodes import CommandNodeAdd
+from eddy.core.commands.nodes import CommandNodeSetDepth
+from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.misc import DiagramMode
 from eddy.core.functions.misc import first
+from eddy.core.items.common import Style
 
 
 class DiagramTestCase(EddyTestCase):
@@ -134,6 +140,26 @@ class DiagramTestCase(EddyTestCase):
         self.assertEqual(num_nodes_in_project, len(self.project.nodes()) - 3)
         self.assertLen(3, self.project.predicates(Item.ConceptNode, 'concept'))
 
+    #############################################
+    #   DEPTH
+    #################################
+
+    def test_edges_follow_node_layers(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.ConceptNode, 'Male', diagram))
+        zValue = diagram.layers.top
+        # WHEN
+        self.session.undostack.push(CommandNodeSetDepth(diagram, node, zValue + 1))
+        # THEN
+        self.assertEqual(zValue + 1, diagram.layers.top)
+        for edge in node.edges:
+            self.assertGreater(edge.zValue(), node.zValue())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(zValue, diagram.layers.top)
+
     #############################################
     #   EDGE INSERTION
     #################################
@@ -191,3 +217,133 @@ class DiagramTestCase(EddyTestCase):
         self.assertEqual(num_edges_in_diagram, len(diagram.edges()))
         self.assertEqual(num_items_in_project, len(self.project.items()))
         self.assertEqual(num_edges_in_project, len(self.project.edges()))
+
+    #############################################
+    #   NODE MOVE
+    #################################
+
+    def test_move_node(self):
+        # GIVEN
+        view = self.session.mdi.activeView()
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.ConceptNode, 'Male', diagram))
+        pos = node.pos()
+        pos1 = view.mapFromScene(pos)
+        num_commands = self.session.undostack.count()
+        # WHEN
+        QtTest.QTest.mousePress(view.viewport(), QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, pos1)
+        for offset in (10, 20, 30, 40):
+            # QTest.mouseMove does not report pressed buttons: send the event by hand.
+            event = QtGui.QMouseEvent(QtCore.QEvent.MouseMove, QtCore.QPointF(pos1 + QtCore.QPoint(offset, 0)),
+                                      QtCore.Qt.LeftButton, QtCore.Qt.LeftButton, QtCore.Qt.NoModifier)
+            QtWidgets.QApplication.sendEvent(view.viewport(), event)
+        # THEN
+        self.assertTrue(diagram.isNodeMove())
+        # WHEN
+        QtTest.QTest.mouseRelease(view.viewport(), QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, pos1 + QtCore.QPoint(40, 0))
+        # THEN
+        self.assertFalse(diagram.isNodeMove())
+        self.assertNotEqual(pos, node.pos())
+        self.assertEqual(num_commands + 1, self.session.undostack.count())
+        for edge in node.edges:
+            self.assertGreater(edge.zValue(), node.zValue())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(pos, node.pos())
+
+    #############################################
+    #   NODE IDENTIFICATION
+    #################################
+
+    def test_identification_follows_neutral_components(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        concept = first(self.project.predicates(Item.ConceptNode, 'Person', diagram))
+        union = diagram.factory.create(Item.UnionNode)
+        complement = diagram.factory.create(Item.ComplementNode)
+        self.session.undostack.push(CommandNodeAdd(diagram, union))
+        self.session.undostack.push(CommandNodeAdd(diagram, complement))
+        # WHEN
+        self.session.undostack.push(CommandEdgeAdd(diagram, diagram.factory.create(Item.InputEdge, source=complement, target=union)))
+        # THEN
+        self.assertEqual({union, complement}, diagram.components.find(union))
+        self.assertIs(Identity.Neutral, union.identity())
+        # WHEN
+        self.session.undostack.push(CommandEdgeAdd(diagram, diagram.factory.create(Item.InputEdge, source=concept, target=complement)))
+        # THEN
+        self.assertEqual({union, complement}, diagram.components.find(complement))
+        self.assertIs(Identity.Concept, complement.identity())
+        self.assertIs(Identity.Concept, union.identity())
+        # WHEN
+        self.session.undostack.undo()
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual({union}, diagram.components.find(union))
+        self.assertEqual({complement}, diagram.components.find(complement))
+        self.assertIs(Identity.Neutral, complement.identity())
+        self.assertIs(Identity.Neutral, union.identity())
+
+    #############################################
+    #   BOUNDS
+    #################################
+
+    def test_scene_rect_follows_content(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        size = diagram.sceneRect().width()
+        node = diagram.factory.create(Item.ConceptNode)
+        node.setPos(QtCore.QPointF(size, size))
+        count = diagram.itemCount(diagram.sceneRect())
+        # WHEN
+        self.session.undostack.push(CommandNodeAdd(diagram, node))
+        # THEN
+        self.assertTrue(diagram.sceneRect().contains(diagram.contentRect()))
+        self.assertGreater(diagram.sceneRect().width(), size)
+        self.assertEqual(count + 1, diagram.itemCount(diagram.sceneRect()))
+        self.assertEqual(1, diagram.itemCount(node.mapRectToScene(node.boundingRect())))
+        # WHEN
+        self.session.undostack.undo()
+        diagram.fitSceneRect()
+        # THEN
+        self.assertEqual(size, diagram.sceneRect().width())
+        self.assertEqual(count, diagram.itemCount(diagram.sceneRect()))
+
+    #############################################
+    #   LEVEL OF DETAIL
+    #################################
+
+    def test_cache_follows_zoom(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        view = self.session.mdi.activeView()
+        node = first(self.project.predicates(Item.ConceptNode, 'Person', diagram))
+        # WHEN
+        view.scaleView(Style.ShapeZoom / 2)
+        # THEN
+        self.assertEqual(QtWidgets.QGraphicsItem.NoCache, node.cacheMode())
+        # WHEN
+        view.scaleView(1.0)
+        # THEN
+        self.assertEqual(QtWidgets.QGraphicsItem.DeviceCoordinateCache, node.cacheMode())
+
+    #############################################
+    #   CACHE
+    #################################
+
+    def test_cache_follows_node_look(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.ConceptNode, 'Person', diagram))
+        node.updateNode(selected=False, valid=True)
+        # WHEN
+        node.updateNode(selected=False, valid=True)
+        node.selection.setBrush(QtGui.QBrush(QtCore.Qt.NoBrush))
+        # THEN
+        self.assertIs(Style.ValidBrush, node.background.brush())
+        self.assertFalse(node.updateCache())
+        # WHEN
+        node.selection.setBrush(Style.SelectionBrush)
+        # THEN
+        self.assertTrue(node.updateCache())
+        self.assertFalse(node.updateCache())
@@ -33,15 +33,21 @@
 ##########################################################################
 
 
+import unittest
+
 from mock import patch
 
+from PyQt5 import QtCore
+
 from tests import EddyTestCase
 
-from eddy.core.datatypes.owl import OWLSyntax, OWLAxiom
+from eddy.core.datatypes.owl import OWLAxiom, OWLEngine, OWLSyntax
 from eddy.core.exporters.graphml import GraphMLDiagramExporter
+from eddy.core.exporters import owl2python
+from eddy.core.exporters.graphol import GrapholProjectExporter
 from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
 from eddy.core.exporters.pdf import PdfDiagramExporter
-from eddy.core.functions.fsystem import fread
+from eddy.core.functions.fsystem import fread, fremove
 from eddy.core.functions.path import expandPath
 
 
@@ -69,6 +75,39 @@ class ExportTestCase(EddyTestCase):
         # THEN
         self.assertFileExists('@tests/.tests/diagram.graphml')
 
+    #############################################
+    #   GRAPHOL EXPORT
+    #################################
+
+    def test_export_project_to_graphol_using_worker(self):
+        # GIVEN
+        path = '@tests/.tests/test_project_1/test_project_1.graphol'
+        content = fread(path)
+        fremove(path)
+        worker = GrapholProjectExporter(self.project, self.session).createWorker()
+        # WHEN
+        worker.run()
+        # THEN
+        self.assertFileExists(path)
+        self.assertEqual(len(content.split('<node ')), len(fread(path).split('<node ')))
+        self.assertEqual(len(content.split('<edge ')), len(fread(path).split('<edge ')))
+        self.assertEqual(len(content.split('<predicate ')), len(fread(path).split('<predicate ')))
+
+    def test_export_project_to_graphol_after_diagram_change(self):
+        # GIVEN
+        path = '@tests/.tests/test_project_1/test_project_1.graphol'
+        GrapholProjectExporter(self.project, self.session).createWorker().run()
+        diagram = self.project.diagram('diagram')
+        node = next(iter(self.project.nodes(diagram)))
+        node.setPos(node.pos() + QtCore.QPointF(40, 40))
+        diagram.sgnUpdated.emit()
+        # WHEN
+        self.assertIn(diagram, self.project.dirtyDiagrams)
+        GrapholProjectExporter(self.project, self.session).createWorker().run()
+        # THEN
+        self.assertFalse(self.project.dirtyDiagrams)
+        self.assertIn('x="{0}"'.format('%.17g' % node.pos().x()), fread(path))
+
     #############################################
     #   PDF EXPORT
     #################################
@@ -180,6 +219,18 @@ class ExportTestCase(EddyTestCase):
         # AND
         self.assertLen(61, content)
 
+    def test_export_project_to_owl_converts_each_node_once(self):
+        # GIVEN
+        worker = OWLOntologyExporterWorker(self.project, '@tests/.tests/test_project_1.owl',
+           axioms={x for x in OWLAxiom}, normalize=False, syntax=OWLSyntax.Functional)
+        # WHEN
+        worker.run()
+        # THEN
+        self.assertFileExists('@tests/.tests/test_project_1.owl')
+        self.assertLen(len(self.project.nodes()), worker.converted())
+        self.assertEqual(len(self.project.nodes()), worker._convertedMisses)
+        self.assertTrue(all(isinstance(x, tuple) and len(x) == 2 for x in worker.converted()))
+
     def test_export_project_to_owl_with_normalization(self):
         # WHEN
         worker = OWLOntologyExporterWorker(self.project, '@tests/.tests/test_project_1.owl',
@@ -271,4 +322,117 @@ class ExportTestCase(EddyTestCase):
         self.assertAnyIn(['DisjointClasses(test:Less_than_50_cc test:Over_50_cc)',
                           'DisjointClasses(test:Over_50_cc test:Less_than_50_cc)'], content)
         # AND
-        self.assertLen(68, content)
\ No newline at end of file
+        self.assertLen(68, content)
+
+
+class OWLEngineConformanceTestCase(EddyTestCase):
+    """
+    Tests the Python OWL 2 engine against the OWL API one on the bundled projects.
+    """
+    def assertConformant(self, normalize):
+        """
+        Check the Python engine to generate the same Functional-style syntax document as the OWL API engine.
+        :type normalize: bool
+        """
+        content = {}
+        for engine in OWLEngine:
+            path = '@tests/.tests/{0}.owl'.format(engine.name)
+            worker = OWLOntologyExporterWorker(self.project, path,
+                axioms={x for x in OWLAxiom}, engine=engine,
+                normalize=normalize, syntax=OWLSyntax.Functional)
+            worker.run()
+            self.assertFileExists(path)
+            content[engine] = set(filter(None, fread(path).split('\n')))
+        self.assertEqual(content[OWLEngine.OWLAPI], content[OWLEngine.Python])
+
+    def test_conformance_on_test_project(self):
+        # GIVEN
+        self.init('test_project_1')
+        # THEN
+        self.assertConformant(normalize=False)
+        self.assertConformant(normalize=True)
+
+    def test_conformance_on_animals_example(self):
+        # GIVEN
+        self.init('Animals', '@examples')
+        # THEN
+        self.assertConformant(normalize=False)
+        self.assertConformant(normalize=True)
+
+    def test_conformance_on_diet_example(self):
+        # GIVEN
+        self.init('Diet', '@examples')
+        # THEN
+        self.assertConformant(normalize=False)
+        self.assertConformant(normalize=True)
+
+    def test_conformance_on_family_example(self):
+        # GIVEN
+        self.init('Family', '@examples')
+        # THEN
+        self.assertConformant(normalize=False)
+        self.assertConformant(normalize=True)
+
+    def test_conformance_on_lubm_example(self):
+        # GIVEN
+        self.init('LUBM', '@examples')
+        # THEN
+        self.assertConformant(normalize=False)
+        self.assertConformant(normalize=True)
+
+    def test_conformance_on_pizza_example(self):
+        # GIVEN
+        self.init('Pizza', '@examples')
+        # THEN
+        self.assertConformant(normalize=False)
+        self.assertConformant(normalize=True)
+
+
+class OWLPythonEngineTestCase(unittest.TestCase):
+    """
+    Tests for the Python OWL 2 engine.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        self.pm = owl2python.OWLPrefixManager()
+        self.pm.setPrefix('test', 'http://www.dis.uniroma1.it/~graphol/test_project#')
+        self.df = owl2python.OWLDataFactory()
+        self.renderer = owl2python.OWLFunctionalSyntaxRenderer(self.pm)
+
+    def test_render_expressions(self):
+        # GIVEN
+        person = self.df.getOWLClass('test:Person', self.pm)
+        drives = self.df.getOWLObjectProperty('test:drives', self.pm)
+        collection = owl2python.HashSet()
+        collection.add(self.df.getOWLObjectAllValuesFrom(drives.getInverseProperty(), self.df.getOWLThing()))
+        collection.add(person)
+        # THEN
+        self.assertEqual('test:Person', self.renderer.render(person))
+        self.assertEqual(drives, drives.getInverseProperty().getInverseProperty())
+        self.assertEqual('ObjectMinCardinality(1 test:drives)',
+            self.renderer.render(self.df.getOWLObjectMinCardinality(1, drives, self.df.getOWLThing())))
+        self.assertEqual('EquivalentClasses(test:Person ObjectAllValuesFrom(ObjectInverseOf(test:drives) owl:Thing))',
+            self.renderer.render(self.df.getOWLEquivalentClassesAxiom(collection)))
+        self.assertEqual('"A \\"human\\" being"^^xsd:string',
+            self.renderer.render(self.df.getOWLLiteral('A "human" being')))
+
+    def test_render_ontology_with_missing_declarations(self):
+        # GIVEN
+        ontology = owl2python.OWLOntology('http://www.dis.uniroma1.it/~graphol/test_project')
+        person = self.df.getOWLClass('test:Person', self.pm)
+        bob = self.df.getOWLNamedIndividual('test:Bob', self.pm)
+        ontology.addAxioms({self.df.getOWLClassAssertionAxiom(person, bob),
+                            self.df.getOWLSubClassOfAxiom(person, self.df.getOWLThing())})
+        # WHEN
+        content = list(self.renderer.renderOntology(ontology))
+        # THEN
+        self.assertIn('Prefix(test:=<http://www.dis.uniroma1.it/~graphol/test_project#>)', content)
+        self.assertIn('Ontology(<http://www.dis.uniroma1.it/~graphol/test_project>', content)
+        self.assertIn('Declaration(Class(test:Person))', content)
+        self.assertIn('Declaration(NamedIndividual(test:Bob))', content)
+        self.assertNotIn('Declaration(Class(owl:Thing))', content)
+        self.assertIn('ClassAssertion(test:Person test:Bob)', content)
+        self.assertIn('SubClassOf(test:Person owl:Thing)', content)
+        self.assertEqual(')', content[-1])
@@ -44,6 +44,7 @@ from eddy.core.functions.misc import clamp, first, last, lstrip, rstrip
 from eddy.core.functions.geometry import angle, distance, projection
 from eddy.core.functions.geometry import intersection, midpoint
 from eddy.core.functions.owl import OWLText, OWLShortIRI
+from eddy.core.functions.owl import OWLFunctionalDocumentFilter, OWLFunctionalDocumentStreamFilter
 from eddy.core.functions.path import compressPath
 
 
@@ -149,6 +150,13 @@ class FunctionsTestCase(unittest.TestCase):
         self.assertEqual(8.0, snapF(value=8.0, size=10.0, perform=False))
         self.assertEqual(6.0, snapF(value=6.0, size=10.0, perform=False))
 
+    def test_owl_functional_document_filter(self):
+        content = '# comment\nPrefix(:=<http://x#>)\n\nOntology(<http://x>\n\n# comment\nDeclaration(Class(:A))\n)\n'
+        self.assertEqual('Prefix(:=<http://x#>)\n\nOntology(<http://x>\n\nDeclaration(Class(:A))\n)',
+                         OWLFunctionalDocumentFilter(content))
+        self.assertEqual(OWLFunctionalDocumentFilter(content),
+                         ''.join(OWLFunctionalDocumentStreamFilter(content.splitlines(keepends=True))))
+
     def test_owl_short_iri(self):
         self.assertEqual('prefix:this_is_my_content', OWLShortIRI('prefix', 'this_is my content'))
         self.assertEqual('prefix:this_is_my_content', OWLShortIRI('prefix', 'this\n\nis_my content'))
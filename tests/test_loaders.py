@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <pantaleone@dis.uniroma1.it>    #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from mock import patch
+from PyQt5 import QtCore
+
+from tests import EddyTestCase
+
+from eddy.core.loaders.common import StreamElement
+from eddy.core.functions.fsystem import fwrite
+from eddy.core.loaders.graphol import GrapholProjectLoader_v2
+from eddy.core.loaders.snapshot import ProjectSnapshot
+
+
+class StreamElementTestCase(unittest.TestCase):
+    """
+    Tests for the element built out of the XML stream reader.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        reader = QtCore.QXmlStreamReader(
+            '<node id="n0" type="concept">'
+            '<geometry height="50" width="110" x="-40" y="20"/>'
+            '<label x="-40" y="20">  Person  </label>'
+            '<point x="1" y="2"/><point x="3" y="4"/>'
+            '<description>  </description>'
+            '</node>')
+        reader.readNextStartElement()
+        self.element = StreamElement.fromStream(reader)
+
+    def test_attributes(self):
+        self.assertEqual('n0', self.element.attribute('id'))
+        self.assertEqual('concept', self.element.attribute('type'))
+        self.assertEqual('', self.element.attribute('color'))
+        self.assertEqual('#fcfcfc', self.element.attribute('color', '#fcfcfc'))
+
+    def test_children(self):
+        self.assertEqual('110', self.element.firstChildElement('geometry').attribute('width'))
+        self.assertEqual('  Person  ', self.element.firstChildElement('label').text())
+        self.assertEqual('', self.element.firstChildElement('description').text())
+        self.assertTrue(self.element.firstChildElement('missing').isNull())
+
+    def test_siblings(self):
+        point = self.element.firstChildElement('point')
+        points = []
+        while not point.isNull():
+            points.append((point.attribute('x'), point.attribute('y')))
+            point = point.nextSiblingElement('point')
+        self.assertEqual([('1', '2'), ('3', '4')], points)
+
+    def test_stream_roundtrip(self):
+        element = StreamElement('node')
+        element.setAttribute('id', 'n1')
+        element.setAttribute('x', -40.0)
+        element.setAttribute('y', 12.5)
+        element.appendChild(StreamElement('label')).setText('Person & Co.')
+        data = QtCore.QByteArray()
+        writer = QtCore.QXmlStreamWriter(data)
+        element.toStream(writer)
+        reader = QtCore.QXmlStreamReader(data)
+        reader.readNextStartElement()
+        element = StreamElement.fromStream(reader)
+        self.assertEqual({'id': 'n1', 'x': '-40', 'y': '12.5'}, element.attrs)
+        self.assertEqual('Person & Co.', element.firstChildElement('label').text())
+
+    def test_tuple_roundtrip(self):
+        element = StreamElement.fromTuple(self.element.toTuple())
+        self.assertEqual(self.element.toTuple(), element.toTuple())
+        self.assertEqual('4', element.firstChildElement('point').nextSiblingElement('point').attribute('y'))
+
+
+class ProjectSnapshotTestCase(unittest.TestCase):
+    """
+    Tests for the binary cache of project files.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        self.workdir = tempfile.mkdtemp()
+        self.patcher = patch.object(ProjectSnapshot, 'Directory', os.path.join(self.workdir, 'cache'))
+        self.patcher.start()
+        self.path = os.path.join(self.workdir, 'test.graphol')
+        fwrite('<graphol version="2"/>', self.path)
+        self.snapshot = ProjectSnapshot(self.path)
+
+    def tearDown(self):
+        """
+        Remove test case environment.
+        """
+        self.patcher.stop()
+        shutil.rmtree(self.workdir)
+
+    def test_load_missing_snapshot(self):
+        self.assertIsNone(self.snapshot.load())
+
+    def test_load_saved_snapshot(self):
+        self.assertTrue(self.snapshot.save({'diagrams': []}))
+        with patch.object(ProjectSnapshot, 'digest') as digest:
+            self.assertEqual({'diagrams': []}, ProjectSnapshot(self.path).load())
+        digest.assert_not_called()
+
+    def test_load_stale_snapshot(self):
+        self.assertTrue(self.snapshot.save({'diagrams': []}))
+        fwrite('<graphol version="2"><diagrams/></graphol>', self.path)
+        self.assertIsNone(ProjectSnapshot(self.path).load())
+
+    def test_load_touched_snapshot(self):
+        self.assertTrue(self.snapshot.save({'diagrams': []}))
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual({'diagrams': []}, ProjectSnapshot(self.path).load())
+
+    def test_prune_snapshots(self):
+        paths = []
+        for i in range(3):
+            paths.append(os.path.join(self.workdir, 'test{0}.graphol'.format(i)))
+            fwrite('<graphol version="2"/>', paths[-1])
+            self.assertTrue(ProjectSnapshot(paths[-1]).save({'diagrams': []}))
+        os.remove(paths[0])
+        with patch.object(ProjectSnapshot, 'Limit', 1):
+            self.assertTrue(self.snapshot.save({'diagrams': []}))
+        remaining = [x for x in paths + [self.path] if os.path.isfile(ProjectSnapshot(x).cachePath)]
+        self.assertEqual([self.path], remaining)
+
+
+class GrapholLoaderTestCase(EddyTestCase):
+    """
+    Tests for the Graphol project loader.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+
+    #############################################
+    #   UTILITY METHODS
+    #################################
+
+    def __load(self, streaming):
+        """
+        Load the test project using the given loader mode and returns a signature of its content.
+        :type streaming: bool
+        :rtype: tuple
+        """
+        loader = GrapholProjectLoader_v2('@tests/.tests/test_project_1', self.session)
+        loader.cache = False
+        loader.streaming = streaming
+        loader.run()
+        project = self.session.project
+        nodes = {(x.diagram.name, x.id, x.type(), x.pos().x(), x.pos().y(), x.identity()) for x in project.nodes()}
+        edges = {(x.diagram.name, x.id, x.type(), x.source.id, x.target.id) for x in project.edges()}
+        metas = {(i, n, tuple(sorted(project.meta(i, n).items()))) for i, n in project.metas()}
+        return nodes, edges, metas
+
+    #############################################
+    #   STREAMING LOAD
+    #################################
+
+    def test_streaming_load_matches_dom_load(self):
+        # GIVEN
+        nodes1, edges1, metas1 = self.__load(streaming=False)
+        # WHEN
+        nodes2, edges2, metas2 = self.__load(streaming=True)
+        # THEN
+        self.assertNotEmpty(nodes2)
+        self.assertNotEmpty(edges2)
+        self.assertEqual(nodes1, nodes2)
+        self.assertEqual(edges1, edges2)
+        self.assertEqual(metas1, metas2)
@@ -33,11 +33,13 @@
 ##########################################################################
 
 
-from mock import Mock
+from mock import Mock, patch
 
 from PyQt5 import QtCore
 from PyQt5 import QtTest
 
+from eddy.core.commands.edges import CommandEdgeAdd
+from eddy.core.commands.nodes import CommandNodeAdd
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.misc import DiagramMode
 from eddy.core.functions.misc import first
@@ -1178,4 +1180,75 @@ class OWL2ProfileTestCase(EddyTestCase):
         # THEN
         self.assertEqual(len(self.project.edges()), num_edges_in_project)
         self.assertEqual(self.project.profile.pvr().message(), 'Detected unsupported operator sequence on intersection node')
-        self.assertFalse(self.project.profile.pvr().isValid())
\ No newline at end of file
+        self.assertFalse(self.project.profile.pvr().isValid())
+    #############################################
+    #   RULES DISPATCH / RESULTS CACHE
+    #################################
+
+    def test_rules_dispatch_on_input_edge(self):
+        # GIVEN
+        self.__give_focus_to_diagram('diagram1')
+        profile = self.project.profile
+        edge = first(filter(lambda x: x.type() is Item.InputEdge, self.project.edges()))
+        # WHEN
+        rules = profile.edgeRulesFor(edge.source, edge, edge.target)
+        # THEN
+        self.assertTrue(all(x.matches(edge.source.type(), Item.InputEdge, edge.target.type()) for x in rules))
+        self.assertFalse(any(x.EdgeTypes and Item.InputEdge not in x.EdgeTypes for x in rules))
+        self.assertEqual([x for x in profile.edgeRules() if x in rules], list(rules))
+        self.assertIs(rules, profile.edgeRulesFor(edge.source, edge, edge.target))
+
+    def test_validation_result_cached_until_node_changes(self):
+        # GIVEN
+        self.__give_focus_to_diagram('diagram1')
+        profile = self.project.profile
+        edge = first(filter(lambda x: x.type() is Item.InputEdge, self.project.edges()))
+        pvr = profile.checkEdge(edge.source, edge, edge.target)
+        # WHEN
+        profile.reset()
+        with patch.object(profile, 'edgeRulesFor', wraps=profile.edgeRulesFor) as edgeRulesFor:
+            cached = profile.checkEdge(edge.source, edge, edge.target)
+            # THEN
+            self.assertFalse(edgeRulesFor.called)
+            self.assertEqual((pvr.isValid(), pvr.message()), (cached.isValid(), cached.message()))
+            # WHEN
+            edge.target.updateRevision()
+            profile.checkEdge(edge.source, edge, edge.target)
+            # THEN
+            self.assertTrue(edgeRulesFor.called)
+
+    def test_validation_result_invalidated_by_neutral_component_change(self):
+        # GIVEN
+        self.__give_focus_to_diagram('diagram1')
+        diagram = self.session.mdi.activeDiagram()
+        profile = self.project.profile
+        datatype = diagram.factory.create(Item.ValueDomainNode)
+        nodes = [diagram.factory.create(Item.IntersectionNode) for _ in range(3)]
+        for node in [datatype] + nodes:
+            self.session.undostack.push(CommandNodeAdd(diagram, node))
+        self.session.undostack.push(CommandEdgeAdd(diagram, diagram.factory.create(Item.InputEdge, source=nodes[0], target=nodes[1])))
+        edge = diagram.factory.create(Item.InputEdge, source=datatype, target=nodes[0])
+        self.assertTrue(profile.checkEdge(datatype, edge, nodes[0]).isValid())
+        # WHEN
+        self.session.undostack.push(CommandEdgeAdd(diagram, diagram.factory.create(Item.InclusionEdge, source=nodes[1], target=nodes[2])))
+        # THEN
+        pvr = profile.checkEdge(datatype, edge, nodes[0])
+        self.assertFalse(pvr.isValid())
+        self.assertEqual('Type mismatch: inclusion between value-domain expressions', pvr.message())
+
+    #############################################
+    #   SYNTAX VALIDATION
+    #################################
+
+    def test_syntax_validation_report_after_reset(self):
+        # GIVEN
+        validator = self.project.validator
+        self.project.profile = self.session.createProfile('OWL 2 QL', self.project)
+        validator.validate()
+        report = validator.report()
+        # WHEN
+        validator.reset()
+        validator.validate()
+        # THEN
+        self.assertEqual(report.toJson(), validator.report().toJson())
+        self.assertEqual(len(report), len(validator.errors()))